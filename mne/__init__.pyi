@@ -158,6 +158,7 @@ __all__ = [
     "set_cache_dir",
     "set_config",
     "set_eeg_reference",
+    "set_fft_backend",
     "set_memmap_min_size",
     "setup_source_space",
     "setup_volume_source_space",
@@ -179,6 +180,7 @@ __all__ = [
     "time_frequency",
     "transform_surface_to",
     "use_coil_def",
+    "use_fft_backend",
     "use_log_level",
     "verbose",
     "vertex_to_mni",
@@ -295,6 +297,7 @@ from .cov import (
     whiten_evoked,
     write_cov,
 )
+from .cuda import set_fft_backend, use_fft_backend
 from .dipole import Dipole, DipoleFixed, fit_dipole, read_dipole
 from .epochs import (
     BaseEpochs,
@@ -7,6 +7,7 @@
 # Copyright the MNE-Python contributors.
 
 import contextlib
+import copyreg
 import datetime
 import operator
 import string
@@ -15,11 +16,13 @@ from collections.abc import Mapping
 from copy import deepcopy
 from io import BytesIO
 from textwrap import shorten
+from types import MappingProxyType
 
 import numpy as np
 
 from ..defaults import _handle_default
 from ..html_templates import _get_html_template
+from ..parallel import parallel_func
 from ..utils import (
     _check_fname,
     _check_on_missing,
@@ -51,9 +54,18 @@ from ._digitization import (
 from .compensator import get_current_comp
 from .constants import FIFF, _ch_unit_mul_named, _coord_frame_named
 from .ctf_comp import _read_ctf_comp, write_ctf_comp
-from .open import fiff_open
+from .open import (
+    _check_file_id,
+    _fiff_get_fid,
+    _find_block_start,
+    _get_index_cache_key,
+    _read_directory,
+    _read_index_cache,
+    fiff_open,
+)
 from .pick import (
     _DATA_CH_TYPES_SPLIT,
+    _channel_types,
     _contains_ch_type,
     _picks_to_idx,
     channel_type,
@@ -78,7 +90,7 @@ from .tag import (
     find_tag,
     read_tag,
 )
-from .tree import dir_tree_find
+from .tree import dir_tree_find, make_dir_tree
 from .write import (
     DATE_NONE,
     _safe_name_list,
@@ -110,6 +122,8 @@ _SCALAR_CH_KEYS = (
     "unit_mul",
     "coord_frame",
 )
+_SCALAR_CH_DEFAULTS = (1,) * len(_SCALAR_CH_KEYS)
+_SCALAR_CH_TYPES = ((int, float),) * len(_SCALAR_CH_KEYS)
 _ALL_CH_KEYS_SET = set(_SCALAR_CH_KEYS + ("loc", "ch_name"))
 # XXX we need to require these except when doing simplify_info
 _MIN_CH_KEYS_SET = set(("kind", "cal", "unit", "loc", "ch_name"))
@@ -910,7 +924,7 @@ class ContainsMixin:
         info = self if isinstance(self, Info) else self.info
         none = "data" if only_data_chs else "all"
         picks = _picks_to_idx(info, picks, none, (), allow_empty=False)
-        ch_types = [channel_type(info, pick) for pick in picks]
+        ch_types = _channel_types(info, picks)
         if only_data_chs:
             ch_types = [
                 ch_type for ch_type in ch_types if ch_type in _DATA_CH_TYPES_SPLIT
@@ -934,6 +948,10 @@ def _format_trans(obj, key):
 
 
 def _check_ch_keys(ch, ci, name='info["chs"]', check_min=True):
+    if ch.keys() <= _ALL_CH_KEYS_SET and (
+        not check_min or ch.keys() >= _MIN_CH_KEYS_SET
+    ):
+        return
     ch_keys = set(ch)
     bad = sorted(ch_keys.difference(_ALL_CH_KEYS_SET))
     if bad:
@@ -946,6 +964,56 @@ def _check_ch_keys(ch, ci, name='info["chs"]', check_min=True):
             )
 
 
+def _entries_to_columns(entries):
+    """Convert dict entries (e.g., channels) to columns (None if irregular)."""
+    if not entries:
+        return None
+    kind, keys = type(entries[0]), tuple(entries[0])
+    if any(type(entry) is not kind or tuple(entry) != keys for entry in entries):
+        return None
+    columns = dict()
+    for key in keys:
+        vals = [entry[key] for entry in entries]
+        types = set(type(val) for val in vals)
+        if types == {np.ndarray}:
+            if len(set((val.dtype, val.shape) for val in vals)) != 1:
+                return None
+            # pickling can change the byte order, so keep the dtype
+            columns[key] = ("rows", np.array(vals), vals[0].dtype)
+        elif types == {float}:
+            columns[key] = ("array", np.array(vals, float), None)
+        elif types == {int} and all(abs(val) < 2**62 for val in vals):
+            columns[key] = ("array", np.array(vals, np.int64), None)
+        elif types == {str}:
+            columns[key] = ("list", vals, None)
+        else:
+            # e.g., named constants: store each distinct object once
+            uniques = dict()
+            codes = [uniques.setdefault(id(val), len(uniques)) for val in vals]
+            first = dict(zip(codes[::-1], vals[::-1]))
+            uniques = [first[code] for code in range(len(uniques))]
+            codes = np.array(codes, np.min_scalar_type(len(uniques)))
+            columns[key] = ("codes", uniques, codes)
+    return kind, columns
+
+
+def _entries_from_columns(kind, columns):
+    """Convert columns back to dict entries."""
+    vals = list()
+    for how, values, extra in columns.values():
+        if how == "rows":  # the entries are rows of a single array
+            vals.append(list(values.astype(extra, copy=False)))
+        elif how == "array":
+            vals.append(values.tolist())
+        elif how == "list":
+            vals.append(values)
+        else:
+            assert how == "codes"
+            vals.append([values[code] for code in extra.tolist()])
+    keys = list(columns)
+    return [kind(zip(keys, entry_vals)) for entry_vals in zip(*vals)]
+
+
 def _check_bads_info_compat(bads, info):
     _validate_type(bads, list, "bads")
     if not len(bads):
@@ -1561,8 +1629,25 @@ class Info(dict, SetChannelsMixin, MontageMixin, ContainsMixin):
         """Get state (for pickling)."""
         return {"_unlocked": self._unlocked}
 
+    def __reduce__(self):
+        """Reduce the instance (for pickling)."""
+        state = self.__getstate__()
+        # pickling the channels and digitization points as columns is much
+        # faster and smaller than pickling one dict per entry
+        columns = dict()
+        for key in ("chs", "dig"):
+            columns[key] = _entries_to_columns(self.get(key))
+        state["_columns"] = {key: val for key, val in columns.items() if val}
+        items = (
+            (key, None if key in state["_columns"] else val)
+            for key, val in self.items()
+        )
+        return (copyreg.__newobj__, (type(self),), state, None, items)
+
     def __setstate__(self, state):
         """Set state (for pickling)."""
+        for key, (kind, columns) in state.get("_columns", {}).items():
+            self[key] = _entries_from_columns(kind, columns)
         self._unlocked = state["_unlocked"]
         self["bads"] = MNEBadsList(bads=self["bads"], info=self)
 
@@ -1705,7 +1790,7 @@ class Info(dict, SetChannelsMixin, MontageMixin, ContainsMixin):
             elif k == "chs":
                 # TODO someday we should refactor with _repr_html_ with
                 # bad vs good
-                ch_types = [channel_type(self, idx) for idx in range(len(v))]
+                ch_types = _channel_types(self)
                 ch_counts = Counter(ch_types)
                 entr = ", ".join(
                     f"{count} {titles.get(ch_type, ch_type.upper())}"
@@ -1740,6 +1825,8 @@ class Info(dict, SetChannelsMixin, MontageMixin, ContainsMixin):
     def __deepcopy__(self, memodict):
         """Make a deepcopy."""
         result = Info.__new__(Info)
+        # the bads refer back to the instance, which must not be copied twice
+        memodict[id(self)] = result
         result._unlocked = True
         for k, v in self.items():
             # chs is roughly half the time but most are immutable
@@ -1820,13 +1907,15 @@ class Info(dict, SetChannelsMixin, MontageMixin, ContainsMixin):
                     'Bad info: info["chs"][%d]["ch_name"] is not a string, '
                     "got type %s" % (ci, type(ch_name))
                 )
-            for key in _SCALAR_CH_KEYS:
-                val = ch.get(key, 1)
-                if not _is_numeric(val):
-                    raise TypeError(
-                        'Bad info: info["chs"][%d][%r] = %s is type %s, must '
-                        "be float or int" % (ci, key, val, type(val))
-                    )
+            # checking builtin numbers first is much faster than _is_numeric
+            vals = list(map(ch.get, _SCALAR_CH_KEYS, _SCALAR_CH_DEFAULTS))
+            if not all(map(isinstance, vals, _SCALAR_CH_TYPES)):
+                for key, val in zip(_SCALAR_CH_KEYS, vals):
+                    if not _is_numeric(val):
+                        raise TypeError(
+                            'Bad info: info["chs"][%d][%r] = %s is type %s, must '
+                            "be float or int" % (ci, key, val, type(val))
+                        )
             loc = ch["loc"]
             if not (isinstance(loc, np.ndarray) and loc.shape == (12,)):
                 raise TypeError(
@@ -2024,27 +2113,162 @@ def write_fiducials(
 
 
 @verbose
-def read_info(fname, verbose=None):
+def read_info(fname, *, fields=None, n_jobs=None, verbose=None):
     """Read measurement info from a file.
 
     Parameters
     ----------
-    fname : path-like
-        File name.
+    fname : path-like | list of path-like
+        File name. Can also be a list of file names to read the
+        measurement info of many files at once.
+
+        .. versionchanged:: 1.7
+           Support for a list of file names.
+    fields : list of str | None
+        If None (default), read the complete measurement info. Otherwise,
+        only decode the given fields from the measurement info block, which
+        is much faster. Can contain ``"ch_names"``, ``"nchan"``, ``"sfreq"``,
+        ``"meas_date"``, ``"bads"``, ``"highpass"``, ``"lowpass"``,
+        ``"line_freq"``, ``"experimenter"``, and ``"description"``.
+
+        .. versionadded:: 1.7
+    %(n_jobs)s
+        Files are read using threads. Only used when ``fname`` is a list.
+
+        .. versionadded:: 1.7
     %(verbose)s
 
     Returns
     -------
     %(info_not_none)s
+        If ``fields`` is not None, a read-only mapping containing only the
+        requested fields is returned instead. If ``fname`` is a list, a list
+        with one entry per file is returned.
     """
+    if fields is not None:
+        _validate_type(fields, (list, tuple), "fields")
+        for field in fields:
+            _check_option("fields entry", field, _HEADER_FIELDS)
+    if isinstance(fname, (list, tuple)):
+        parallel, p_fun, n_jobs = parallel_func(
+            _read_info, n_jobs, prefer="threads", max_jobs=len(fname)
+        )
+        return parallel(p_fun(this_fname, fields) for this_fname in fname)
+    return _read_info(fname, fields)
+
+
+def _read_info(fname, fields):
     check_fname(fname, "Info", (".fif", ".fif.gz"))
     fname = _check_fname(fname, must_exist=True, overwrite="read")
+    if fields is not None:
+        return _read_info_header(fname, fields)
     f, tree, _ = fiff_open(fname)
     with f as fid:
         info = read_meas_info(fid, tree)[0]
     return info
 
 
+_HEADER_FIELDS = (
+    "ch_names",
+    "nchan",
+    "sfreq",
+    "meas_date",
+    "bads",
+    "highpass",
+    "lowpass",
+    "line_freq",
+    "experimenter",
+    "description",
+)
+
+
+def _read_info_header(fname, fields):
+    """Read some fields of the measurement info block only."""
+    with _fiff_get_fid(fname) as fid:
+        _check_file_id(fname, fid)
+        # Avoid building the tree of the whole file, we only need the
+        # FIFFB_MEAS_INFO block (unless it's already cached)
+        cache_key = _get_index_cache_key(fname, fid)
+        cached = None if cache_key is None else _read_index_cache(cache_key)
+        meas = dict(id=None, parent_id=None)
+        if cached is not None:
+            file_id = cached[0]["id"]
+            meas_info = dir_tree_find(cached[0], FIFF.FIFFB_MEAS_INFO)
+            meas_info = meas_info[0] if len(meas_info) else None
+            meas = (dir_tree_find(cached[0], FIFF.FIFFB_MEAS) or [meas])[0]
+        else:
+            file_id = read_tag(fid, 0).data
+            directory = _read_directory(fname, fid)
+            start = _find_block_start(fid, directory, FIFF.FIFFB_MEAS_INFO)
+            meas_info = None
+            if start is not None:
+                meas_info = make_dir_tree(fid, directory, start)[0]
+            if "meas_date" in fields:
+                start = _find_block_start(fid, directory, FIFF.FIFFB_MEAS)
+                if start is not None:
+                    meas = _read_block_ids(fid, directory, start)
+        if meas_info is None:
+            raise ValueError("Could not find measurement info")
+
+        values = dict(
+            nchan=None,
+            sfreq=None,
+            meas_date=None,
+            highpass=None,
+            lowpass=None,
+            line_freq=None,
+            experimenter=None,
+            description=None,
+        )
+        casts = {
+            FIFF.FIFF_NCHAN: ("nchan", _int_item),
+            FIFF.FIFF_SFREQ: ("sfreq", _float_item),
+            FIFF.FIFF_MEAS_DATE: ("meas_date", tuple),
+            FIFF.FIFF_HIGHPASS: ("highpass", _float_item),
+            FIFF.FIFF_LOWPASS: ("lowpass", _float_item),
+            FIFF.FIFF_LINE_FREQ: ("line_freq", _float_item),
+            FIFF.FIFF_EXPERIMENTER: ("experimenter", str),
+            FIFF.FIFF_DESCRIPTION: ("description", str),
+        }
+        need_chs = "ch_names" in fields or (
+            "bads" in fields and len(dir_tree_find(meas_info, FIFF.FIFFB_CH_INFO))
+        )
+        chs = list()
+        for ent in meas_info["directory"] or []:
+            if ent.kind == FIFF.FIFF_CH_INFO and need_chs:
+                chs.append(read_tag(fid, ent.pos).data)
+            elif ent.kind in casts:
+                key, cast = casts[ent.kind]
+                if key in fields or (key == "sfreq" and "lowpass" in fields):
+                    values[key] = cast(read_tag(fid, ent.pos).data)
+        ch_names_mapping = None
+        if need_chs:
+            ch_names_mapping = _read_extended_ch_info(chs, meas_info, fid)
+        if "bads" in fields:
+            values["bads"] = _read_bad_channels(fid, meas_info, ch_names_mapping)
+        if "meas_date" in fields and values["meas_date"] is None:
+            meas_id = _select_meas_id(meas, meas_info, file_id)
+            values["meas_date"] = (meas_id["secs"], meas_id["usecs"])
+
+    # Same conventions as read_meas_info
+    if values["highpass"] is not None and np.isnan(values["highpass"]):
+        values["highpass"] = None
+    if values["highpass"] is None:
+        values["highpass"] = 0.0
+    if values["lowpass"] is not None and np.isnan(values["lowpass"]):
+        values["lowpass"] = None
+    if values["lowpass"] is None and values["sfreq"] is not None:
+        values["lowpass"] = values["sfreq"] / 2.0
+    if "meas_date" in fields:
+        meas_date = values["meas_date"]
+        if len(meas_date) == 1:  # can happen from old C conversions
+            meas_date = (meas_date[0], 0)
+        values["meas_date"] = _ensure_meas_date_none_or_dt(meas_date)
+    if "ch_names" in fields:
+        values["ch_names"] = [ch["ch_name"] for ch in chs]
+    return MappingProxyType({field: values[field] for field in fields})
+
+
 def read_bad_channels(fid, node):
     """Read bad channels.
 
@@ -2517,20 +2741,7 @@ def read_meas_info(fid, tree, clean_bads=False, verbose=None):
     #   Read processing history
     info["proc_history"] = _read_proc_history(fid, tree)
 
-    #  Make the most appropriate selection for the measurement id
-    if meas_info["parent_id"] is None:
-        if meas_info["id"] is None:
-            if meas["id"] is None:
-                if meas["parent_id"] is None:
-                    info["meas_id"] = info["file_id"]
-                else:
-                    info["meas_id"] = meas["parent_id"]
-            else:
-                info["meas_id"] = meas["id"]
-        else:
-            info["meas_id"] = meas_info["id"]
-    else:
-        info["meas_id"] = meas_info["parent_id"]
+    info["meas_id"] = _select_meas_id(meas, meas_info, info["file_id"])
     info["experimenter"] = experimenter
     info["description"] = description
     info["proj_id"] = proj_id
@@ -2621,6 +2832,36 @@ def _rename_comps(comps, ch_names_mapping):
             data[key][:] = _rename_list(data[key], ch_names_mapping)
 
 
+def _select_meas_id(meas, meas_info, file_id):
+    """Make the most appropriate selection for the measurement id."""
+    for meas_id in (
+        meas_info["parent_id"],
+        meas_info["id"],
+        meas["id"],
+        meas["parent_id"],
+    ):
+        if meas_id is not None:
+            return meas_id
+    return file_id
+
+
+def _read_block_ids(fid, directory, start):
+    """Read the id and parent id of the block starting at directory[start]."""
+    ids = dict(id=None, parent_id=None)
+    keys = {FIFF.FIFF_BLOCK_ID: "id", FIFF.FIFF_PARENT_BLOCK_ID: "parent_id"}
+    depth = 0
+    for ent in directory[start:]:
+        if ent.kind == FIFF.FIFF_BLOCK_START:
+            depth += 1
+        elif ent.kind == FIFF.FIFF_BLOCK_END:
+            depth -= 1
+            if depth == 0:
+                break
+        elif depth == 1 and ent.kind in keys:
+            ids[keys[ent.kind]] = read_tag(fid, ent.pos).data
+    return ids
+
+
 def _ensure_meas_date_none_or_dt(meas_date):
     if meas_date is None or np.array_equal(meas_date, DATE_NONE):
         meas_date = None
@@ -4,6 +4,7 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+import os
 import os.path as op
 from gzip import GzipFile
 from io import SEEK_SET, BytesIO
@@ -11,7 +12,15 @@ from io import SEEK_SET, BytesIO
 import numpy as np
 from scipy.sparse import issparse
 
-from ..utils import _file_like, logger, verbose, warn
+from ..utils import (
+    _file_like,
+    _get_cache_fname,
+    _write_cache_file,
+    get_config,
+    logger,
+    verbose,
+    warn,
+)
 from .constants import FIFF
 from .tag import (
     Tag,
@@ -145,6 +154,33 @@ def _fiff_open(fname, fid, preload):
         with fid as fid_old:
             fid = BytesIO(fid_old.read())
 
+    _check_file_id(fname, fid)
+
+    cache_key = _get_index_cache_key(fname, fid)
+    if cache_key is not None:
+        out = _read_index_cache(cache_key)
+        if out is not None:
+            logger.debug("    Using cached tag directory for %s" % fname)
+            fid.seek(0)
+            return (fid,) + out
+
+    #   Read or create the directory tree
+    logger.debug("    Creating tag directory for %s..." % fname)
+    directory = _read_directory(fname, fid)
+    tree, _ = make_dir_tree(fid, directory)
+    if cache_key is not None:
+        _write_index_cache(cache_key, tree, directory)
+
+    logger.debug("[done]")
+
+    #   Back to the beginning
+    fid.seek(0)
+
+    return fid, tree, directory
+
+
+def _check_file_id(fname, fid):
+    """Check that the file starts with a file ID tag."""
     tag = _read_tag_header(fid, 0)
 
     #   Check that this looks like a fif file
@@ -158,13 +194,13 @@ def _fiff_open(fname, fid, preload):
     if tag.size != 20:
         raise ValueError(f"{prefix} start with a file id tag")
 
-    tag = read_tag(fid, tag.next_pos)
 
-    if tag.kind != FIFF.FIFF_DIR_POINTER:
-        raise ValueError(f"{prefix} have a directory pointer")
+def _read_directory(fname, fid):
+    """Read the tag directory, scanning the whole file if it is missing."""
+    tag = read_tag(fid, _read_tag_header(fid, 0).next_pos)
 
-    #   Read or create the directory tree
-    logger.debug("    Creating tag directory for %s..." % fname)
+    if tag.kind != FIFF.FIFF_DIR_POINTER:
+        raise ValueError(f"file {repr(fname)} does not have a directory pointer")
 
     dirpos = int(tag.data.item())
     read_slow = True
@@ -191,15 +227,142 @@ def _fiff_open(fname, fid, preload):
                 break  # HACK : to fix file ending with empty tag...
             pos = tag.next_pos
             directory.append(tag)
-
-    tree, _ = make_dir_tree(fid, directory)
-
-    logger.debug("[done]")
-
-    #   Back to the beginning
-    fid.seek(0)
-
-    return fid, tree, directory
+    return directory
+
+
+def _find_block_start(fid, directory, kind):
+    """Find the directory index of the first block of a given kind."""
+    for ii, ent in enumerate(directory):
+        if ent.kind == FIFF.FIFF_BLOCK_START:
+            if int(read_tag(fid, ent.pos).data.item()) == kind:
+                return ii
+    return None
+
+
+###############################################################################
+# Tag directory cache
+
+_INDEX_CACHE_VERSION = 1
+_index_cache = dict(dir=None)  # read from the config when first needed
+
+
+def _get_index_cache_key(fname, fid):
+    """Get the cache file and key for a FIF file, or None if caching is off."""
+    if _index_cache["dir"] is None:
+        _index_cache["dir"] = get_config("MNE_FIFF_INDEX_CACHE_DIR", "")
+    cache_dir = _index_cache["dir"]
+    if not cache_dir or _file_like(fname):
+        return None
+    fname = op.realpath(str(fname))
+    stat = os.stat(fname)
+    file_id, _ = _id_to_array(read_tag(fid, 0).data)
+    key = dict(
+        version=_INDEX_CACHE_VERSION,
+        fname=fname,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        file_id=file_id,
+    )
+    return _get_cache_fname(cache_dir, fname, "fif-index"), key
+
+
+def _id_to_array(id_):
+    if id_ is None:
+        return np.zeros(5, np.int64), False
+    return (
+        np.array([id_["version"], *id_["machid"], id_["secs"], id_["usecs"]], np.int64),
+        True,
+    )
+
+
+def _array_to_id(arr, valid):
+    if not valid:
+        return None
+    arr = arr.tolist()
+    return dict(
+        version=arr[0],
+        machid=np.array(arr[1:3], ">i4"),
+        secs=arr[3],
+        usecs=arr[4],
+    )
+
+
+def _write_index_cache(cache_key, tree, directory):
+    """Serialize the tag directory and tree to a cache file."""
+    cache_fname, key = cache_key
+    ent_idx = {id(ent): ii for ii, ent in enumerate(directory)}
+    nodes = dict(parent=[], block=[], ents=[], id=[], has_id=[], pid=[], has_pid=[])
+
+    def _add_node(node, parent):
+        this = len(nodes["parent"])
+        nodes["parent"].append(parent)
+        nodes["block"].append(node["block"])
+        ents = node["directory"] if node["nent"] else []
+        nodes["ents"].append([ent_idx[id(ent)] for ent in ents])
+        for name, id_key in (("id", "id"), ("pid", "parent_id")):
+            arr, valid = _id_to_array(node[id_key])
+            nodes[name].append(arr)
+            nodes[f"has_{name}"].append(valid)
+        for child in node["children"]:
+            _add_node(child, this)
+
+    _add_node(tree, -1)
+    n_ents = [len(ents) for ents in nodes["ents"]]
+    data = dict(
+        directory=np.array(
+            [[ent.kind, ent.type, ent.size, ent.next, ent.pos] for ent in directory],
+            np.int64,
+        ).reshape(-1, 5),
+        node_parent=np.array(nodes["parent"], np.int64),
+        node_block=np.array(nodes["block"], np.int64),
+        node_ents=np.array(sum(nodes["ents"], []), np.int64),
+        node_ptr=np.cumsum([0] + n_ents).astype(np.int64),
+        node_id=np.array(nodes["id"], np.int64),
+        node_has_id=np.array(nodes["has_id"], bool),
+        node_pid=np.array(nodes["pid"], np.int64),
+        node_has_pid=np.array(nodes["has_pid"], bool),
+        **{f"key_{k}": np.asarray(v) for k, v in key.items()},
+    )
+    _write_cache_file(cache_fname, data, "FIF index cache")
+
+
+def _read_index_cache(cache_key):
+    """Read the tag directory and tree from a cache file if it is current."""
+    cache_fname, key = cache_key
+    if not op.isfile(cache_fname):
+        return None
+    try:
+        with np.load(cache_fname, allow_pickle=False) as npz:
+            data = {k: npz[k] for k in npz.files}
+        for k, v in key.items():
+            if not np.array_equal(data[f"key_{k}"], v):
+                logger.debug(f"    FIF index cache is stale ({k} changed)")
+                return None
+        directory = [Tag(*ent) for ent in data["directory"].tolist()]
+        parents = data["node_parent"].tolist()
+        blocks = data["node_block"].tolist()
+        ptr = data["node_ptr"].tolist()
+        ents = data["node_ents"].tolist()
+        nodes = list()
+        for ni, parent in enumerate(parents):
+            node_ents = [directory[ei] for ei in ents[ptr[ni] : ptr[ni + 1]]]
+            node = dict(
+                block=blocks[ni],
+                id=_array_to_id(data["node_id"][ni], data["node_has_id"][ni]),
+                parent_id=_array_to_id(data["node_pid"][ni], data["node_has_pid"][ni]),
+                nent=len(node_ents),
+                nchild=0,
+                directory=node_ents if len(node_ents) else None,
+                children=[],
+            )
+            nodes.append(node)
+            if parent >= 0:
+                nodes[parent]["children"].append(node)
+                nodes[parent]["nchild"] += 1
+    except Exception as exp:
+        logger.debug(f"    Could not read FIF index cache {cache_fname}: {exp}")
+        return None
+    return nodes[0], directory
 
 
 @verbose
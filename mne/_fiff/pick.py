@@ -7,6 +7,7 @@
 
 import re
 from copy import deepcopy
+from operator import itemgetter
 
 import numpy as np
 
@@ -258,6 +259,61 @@ def channel_type(info, idx):
     return first_kind
 
 
+# the channel entries that the cached channel index depends on
+_CH_INDEX_KEYS = itemgetter("kind", "coil_type", "unit")
+
+
+def _channel_index(info):
+    """Get the channel types and the index of each name of an info.
+
+    The index is cached in the info and recomputed when the channels change,
+    which is detected by comparing the names and the entries that define the
+    channel types (with C-level list comparisons).
+    """
+    try:
+        key = list(map(_CH_INDEX_KEYS, info["chs"]))
+    except KeyError:  # e.g., simplified info
+        key = None
+    index = getattr(info, "_ch_index", None)
+    if (
+        key is not None
+        and index is not None
+        and index["key"] == key
+        and index["ch_names"] == info["ch_names"]
+    ):
+        return index
+    types = list()
+    for ci in range(len(info["chs"])):
+        try:
+            types.append(channel_type(info, ci))
+        except ValueError:  # only raise if the channel is used
+            types.append(None)
+    ch_names = list(info["ch_names"])
+    index = dict(
+        key=key,
+        ch_names=ch_names,
+        types=types,
+        unknown=None in types,
+        names={name: ci for ci, name in enumerate(ch_names)},
+    )
+    if key is not None:
+        try:
+            info._ch_index = index
+        except AttributeError:  # e.g., a plain dict
+            pass
+    return index
+
+
+def _channel_types(info, picks=None):
+    """Get the types of the channels in picks (all by default)."""
+    index = _channel_index(info)
+    picks = range(len(index["types"])) if picks is None else picks
+    if index["unknown"]:  # raise for the channels used
+        return [channel_type(info, pick) for pick in picks]
+    types = index["types"]
+    return [types[pick] for pick in picks]
+
+
 @verbose
 def pick_channels(ch_names, include, exclude=(), ordered=None, *, verbose=None):
     """Pick channels by names.
@@ -579,8 +635,7 @@ def pick_types(
         for key in _FNIRS_CH_TYPES_SPLIT:
             param_dict[key] = fnirs
     warned = [False]
-    for k in range(nchan):
-        ch_type = channel_type(info, k)
+    for k, ch_type in enumerate(_channel_types(info)):
         try:
             pick[k] = param_dict[ch_type]
         except KeyError:  # not so simple
@@ -610,15 +665,17 @@ def pick_types(
             ):
                 pick[k] = False
 
-    myinclude = [info["ch_names"][k] for k in range(nchan) if pick[k]]
-    myinclude += include
-
-    if len(myinclude) == 0:
-        sel = np.array([], int)
-    else:
-        sel = pick_channels(info["ch_names"], myinclude, exclude, ordered=False)
-
-    return sel
+    # same as pick_channels(..., ordered=False) but without name lookups
+    _check_excludes_includes(include)
+    _check_excludes_includes(exclude)
+    names = _channel_index(info)["names"]
+    for name in include:
+        if name in names:
+            pick[names[name]] = True
+    for name in exclude:
+        if name in names:
+            pick[names[name]] = False
+    return np.flatnonzero(pick)
 
 
 @verbose
@@ -893,11 +950,9 @@ def channel_indices_by_type(info, picks=None):
         pupil=list(),
     )
     picks = _picks_to_idx(info, picks, none="all", exclude=(), allow_empty=True)
-    for k in picks:
-        ch_type = channel_type(info, k)
-        for key in idx_by_type.keys():
-            if ch_type == key:
-                idx_by_type[key].append(k)
+    for k, ch_type in zip(picks, _channel_types(info, picks)):
+        if ch_type in idx_by_type:
+            idx_by_type[ch_type].append(k)
     return idx_by_type
 
 
@@ -994,7 +1049,7 @@ def _contains_ch_type(info, ch_type):
         raise ValueError(
             f'Cannot check for channels of type "{ch_type}" because info is None'
         )
-    return any(ch_type == channel_type(info, ii) for ii in range(info["nchan"]))
+    return ch_type in _channel_types(info)
 
 
 @fill_doc
@@ -1024,9 +1079,9 @@ def _picks_by_type(info, meg_combined=False, ref_meg=False, exclude="bads"):
         meg_combined = _mag_grad_dependent(info)
     picks_list = []
     picks_list = {ch_type: list() for ch_type in _DATA_CH_TYPES_SPLIT}
-    for k in range(info["nchan"]):
-        if info["chs"][k]["ch_name"] not in exclude:
-            this_type = channel_type(info, k)
+    exclude = set(exclude)
+    for k, this_type in enumerate(_channel_types(info)):
+        if info["ch_names"][k] not in exclude:
             try:
                 picks_list[this_type].append(k)
             except KeyError:
@@ -1337,8 +1392,14 @@ def _picks_str_to_idx(
         if picks[0] in ("all", "data", "data_or_ica"):
             if picks[0] == "all":
                 use_exclude = info["bads"] if exclude == "bads" else exclude
-                picks_generic = pick_channels(
-                    info["ch_names"], info["ch_names"], exclude=use_exclude
+                use_exclude = set(_check_excludes_includes(use_exclude))
+                picks_generic = np.array(
+                    [
+                        ci
+                        for ci, ch_name in enumerate(info["ch_names"])
+                        if ch_name not in use_exclude
+                    ],
+                    int,
                 )
             elif picks[0] == "data":
                 picks_generic = _pick_data_channels(
@@ -1358,10 +1419,11 @@ def _picks_str_to_idx(
 
     bad_names = []
     picks_name = list()
+    names = _channel_index(info)["names"]
     for pick in picks:
         try:
-            picks_name.append(info["ch_names"].index(pick))
-        except ValueError:
+            picks_name.append(names[pick])
+        except KeyError:
             bad_names.append(pick)
 
     #
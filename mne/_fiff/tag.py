@@ -364,16 +364,19 @@ def _read_old_pack(fid, tag, shape, rlims):
 
 def _read_dir_entry_struct(fid, tag, shape, rlims):
     """Read dir entry struct tag."""
-    pos = tag.pos + 16
-    entries = list()
-    for offset in range(1, tag.size // 16):
-        ent = _read_tag_header(fid, pos + offset * 16)
-        # The position of the real tag on disk is stored in the "next" entry within the
-        # directory, so we need to overwrite ent.pos. For safety let's also overwrite
-        # ent.next to point nowhere
-        ent.pos, ent.next = ent.next, FIFF.FIFFV_NEXT_NONE
-        entries.append(ent)
-    return entries
+    # Skip the first entry and read all of the others at once
+    fid.seek(tag.pos + 32, 0)
+    n_bytes = 16 * max(tag.size // 16 - 1, 0)
+    s = fid.read(n_bytes)
+    if len(s) != n_bytes:
+        return None  # truncated file, the caller has to scan the tags instead
+    # The position of the real tag on disk is stored in the "next" entry within the
+    # directory, so we need to use it as ent.pos. For safety let's also set
+    # ent.next to point nowhere
+    return [
+        Tag(kind, type_, size, FIFF.FIFFV_NEXT_NONE, pos)
+        for kind, type_, size, pos in struct.iter_unpack(">iIii", s)
+    ]
 
 
 def _read_julian(fid, tag, shape, rlims):
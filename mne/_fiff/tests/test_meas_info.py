@@ -6,6 +6,7 @@
 
 import pickle
 import string
+from copy import deepcopy
 from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
@@ -365,6 +366,65 @@ def test_io_dig_points(tmp_path):
             read_polhemus_fastscan(dest, on_header_missing="warn")
 
 
+def test_read_info_fields(tmp_path):
+    """Test reading only some fields of the measurement info."""
+    ch_names = ["EEG 001", "EEG with a very long channel name", "EEG 003"]
+    info = create_info(ch_names, 1000.0, "eeg")
+    meas_date = datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+    with info._unlock():
+        info["bads"] = ch_names[1:2]
+        info["line_freq"] = 50.0
+        info["highpass"] = 0.1
+        info["experimenter"] = "foo"
+    info.set_meas_date(meas_date)
+    raw = RawArray(np.zeros((3, 1000)), info)
+    fnames = [tmp_path / f"test{ii}_raw.fif" for ii in range(3)]
+    for fname in fnames:
+        raw.save(fname)
+    fields = ["ch_names", "sfreq", "meas_date", "bads", "highpass", "lowpass"]
+    header = read_info(fnames[0], fields=fields)
+    assert list(header) == fields
+    with pytest.raises(TypeError, match="does not support"):
+        header["sfreq"] = 1.0
+    info = read_info(fnames[0])
+    for key in fields + ["nchan", "line_freq", "experimenter", "description"]:
+        assert read_info(fnames[0], fields=[key])[key] == info[key], key
+    assert header["meas_date"] == meas_date
+    assert header["bads"] == ch_names[1:2]
+    # many files at once
+    infos = read_info(fnames, n_jobs=2)
+    assert all(this["ch_names"] == ch_names for this in infos)
+    headers = read_info(fnames, fields=["bads"])
+    assert [dict(this) for this in headers] == [dict(bads=ch_names[1:2])] * 3
+    with pytest.raises(ValueError, match="Invalid value for the 'fields entry'"):
+        read_info(fnames[0], fields=["chs"])
+    with pytest.raises(ValueError, match="Could not find measurement info"):
+        read_info(event_name, fields=["sfreq"])
+
+
+def test_read_info_fields_meas_id(tmp_path, monkeypatch):
+    """Test that a header read gets the same meas_date as a full read."""
+    secs = iter(range(1_000_000_000, 1_000_001_000, 10))
+
+    def _generate_dated_meas_id():
+        meas_id = _generate_meas_id()
+        meas_id["secs"], meas_id["usecs"] = next(secs), 0
+        return meas_id
+
+    # file and block ids with different dates, and no FIFF_MEAS_DATE tag
+    monkeypatch.setattr("mne._fiff.write._generate_meas_id", _generate_dated_meas_id)
+    info = create_info(2, 1000.0, "eeg")
+    raw = RawArray(np.zeros((2, 1000)), info)
+    raw.set_meas_date(None)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    info = read_info(fname)
+    assert info["meas_date"] is not None
+    assert info["meas_id"]["secs"] != info["file_id"]["secs"]
+    header = read_info(fname, fields=["meas_date"])
+    assert header["meas_date"] == info["meas_date"]
+
+
 def test_io_coord_frame(tmp_path):
     """Test round trip for coordinate frame."""
     fname = tmp_path / "test.fif"
@@ -1094,6 +1154,34 @@ def test_pickle(fname_info, unlocked, protocol):
     assert info_un["bads"]._mne_info is info_un
 
 
+def test_pickle_copy_columns():
+    """Test pickling channels and dig points as columns, and deepcopy."""
+    info = read_info(base_dir / "test-ave.fif.gz")
+    info["bads"] = info["ch_names"][:2]
+    info_un = pickle.loads(pickle.dumps(info))  # nosec B301
+    assert_object_equal(info, info_un)
+    assert list(info_un) == list(info)
+    for ch, ch_un in zip(info["chs"], info_un["chs"]):
+        assert list(ch_un) == list(ch)
+        for key, val in ch.items():
+            assert type(ch_un[key]) is type(val)
+            assert repr(ch_un[key]) == repr(val)
+    assert info_un["dig"][0]["r"].dtype == info["dig"][0]["r"].dtype
+    assert isinstance(info_un["dig"][0], DigPoint)
+    # entries are independent of each other
+    info_un["chs"][0]["loc"][:] = 1.0
+    assert_array_equal(info_un["chs"][1]["loc"], info["chs"][1]["loc"])
+    # irregular entries are pickled as they are
+    info_un["chs"][0]["cal"] = np.float32(1.0)
+    with info_un._unlock():
+        info_un["dig"] = None
+    assert_object_equal(info_un, pickle.loads(pickle.dumps(info_un)))  # nosec B301
+    # the bads of a copy refer to the copy
+    info_copy = deepcopy(info)
+    assert info_copy["bads"]._mne_info is info_copy
+    assert_object_equal(info_copy, info)
+
+
 def test_info_bad():
     """Test our info sanity checkers."""
     info = create_info(5, 1000.0, "eeg")
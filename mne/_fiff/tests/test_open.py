@@ -0,0 +1,69 @@
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from numpy.testing import assert_array_equal
+
+import mne._fiff.open
+from mne._fiff.open import fiff_open
+from mne.io import read_info, read_raw_fif
+from mne.utils import assert_object_equal
+
+base_dir = Path(__file__).parents[2] / "io" / "tests" / "data"
+fname_raw = base_dir / "test_ctf_comp_raw.fif"
+
+
+def test_index_cache(tmp_path, monkeypatch):
+    """Test caching of the FIF tag directory and tree."""
+    monkeypatch.delenv("MNE_FIFF_INDEX_CACHE_DIR", raising=False)
+    monkeypatch.setitem(mne._fiff.open._index_cache, "dir", None)
+    fname = tmp_path / "test_raw.fif"
+    shutil.copyfile(fname_raw, fname)
+    f, tree, directory = fiff_open(fname)
+    f.close()
+    data = read_raw_fif(fname).get_data()
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("MNE_FIFF_INDEX_CACHE_DIR", str(cache_dir))
+    # the config is only read once
+    f, _, _ = fiff_open(fname)
+    f.close()
+    assert not cache_dir.exists()
+    monkeypatch.setitem(mne._fiff.open._index_cache, "dir", None)
+    f, tree_write, directory_write = fiff_open(fname)
+    f.close()
+    assert len(os.listdir(cache_dir)) == 1
+    assert_object_equal(tree_write, tree)
+    assert directory_write == directory
+
+    # now the tree should not be rebuilt
+    def _make_dir_tree(*args, **kwargs):
+        raise RuntimeError("tree should be read from the cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(mne._fiff.open, "make_dir_tree", _make_dir_tree)
+        f, tree_read, directory_read = fiff_open(fname)
+        f.close()
+        assert_object_equal(tree_read, tree)
+        assert directory_read == directory
+        raw = read_raw_fif(fname)
+        info = read_info(fname)
+        assert_array_equal(raw.get_data(), data)
+        assert info["ch_names"] == raw.ch_names
+        # modifying the file invalidates the cache
+        stat = os.stat(fname)
+        os.utime(fname, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+        with pytest.raises(RuntimeError, match="from the cache"):
+            fiff_open(fname)
+    f, tree_read, directory_read = fiff_open(fname)
+    f.close()
+    assert_object_equal(tree_read, tree)
+    # a corrupted cache file is silently rebuilt
+    (cache_fname,) = cache_dir.iterdir()
+    cache_fname.write_bytes(b"foo")
+    f, tree_read, _ = fiff_open(fname)
+    f.close()
+    assert_object_equal(tree_read, tree)
@@ -721,6 +721,34 @@ def test_pick_types_meg():
     assert list(pick_types(info2, eeg=True)) == [0, 1]
 
 
+def test_pick_types_cached_index():
+    """Test that the cached channel index follows changes to the channels."""
+    info = create_info(["a", "b", "c", "d"], 256, ["eeg", "mag", "grad", "misc"])
+    assert list(pick_types(info, meg=True)) == [1, 2]
+    assert info._ch_index["types"] == ["eeg", "mag", "grad", "misc"]
+    index = info._ch_index
+    assert list(pick_types(info, eeg=True, include=["d"])) == [0, 3]
+    assert info._ch_index is index  # reused
+    # changing the channels (in place) updates the index
+    info.set_channel_types(dict(a="eog"), on_unit_change="ignore")
+    assert list(pick_types(info, eeg=True)) == []
+    assert info.get_channel_types() == ["eog", "mag", "grad", "misc"]
+    info["chs"][3]["kind"] = FIFF.FIFFV_EEG_CH
+    assert list(pick_types(info, eeg=True)) == [3]
+    rename_channels(info, dict(d="e"))
+    assert list(_picks_to_idx(info, "e")) == [3]
+    with pytest.raises(ValueError, match="could not be interpreted"):
+        _picks_to_idx(info, "d")
+    info["bads"] = ["e"]
+    assert list(pick_types(info, eeg=True)) == []
+    assert list(_picks_to_idx(info, "all")) == [0, 1, 2]
+    pick_info(info, [0, 3], copy=False)
+    assert list(pick_types(info, eog=True, eeg=True, exclude=[])) == [0, 1]
+    assert info.get_channel_types() == ["eog", "eeg"]
+    # copies and pickles do not carry the index
+    assert not hasattr(deepcopy(info), "_ch_index")
+
+
 def test_pick_types_csd():
     """Test pick_types(csd=True)."""
     # info with laplacian/CSD channels at indices 1, 2
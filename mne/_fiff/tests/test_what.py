@@ -8,7 +8,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from mne import create_info, what
+from mne import create_info, make_fixed_length_epochs, what
 from mne.datasets import testing
 from mne.io import RawArray
 from mne.preprocessing import ICA
@@ -60,3 +60,18 @@ def test_what(tmp_path, verbose_debug):
         assert this == want_dict[kind]
     fname = data_path / "MEG" / "sample" / "sample_audvis-ave_xfit.dip"
     assert what(fname) == "unknown"
+
+
+def test_what_raw(tmp_path):
+    """Test mne.what for raw files without fully parsing them."""
+    raw = RawArray(np.zeros((3, 10)), create_info(3, 1000.0, "eeg"))
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    assert what(fname) == "raw"
+    epochs = make_fixed_length_epochs(raw, duration=0.002)
+    fname = tmp_path / "test-epo.fif"
+    epochs.save(fname)
+    assert what(fname) == "epochs"
+    fname = tmp_path / "test.txt"
+    fname.write_text("foo")
+    assert what(fname) == "unknown"
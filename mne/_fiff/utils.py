@@ -252,6 +252,97 @@ def _read_segments_file(
             _mult_cal_one(data_view, block, idx, cals, mult)
 
 
+class _FileMmap:
+    """Lazily memory-map a file to expose parts of it as arrays.
+
+    The map is created on first access and is never copied or pickled, so
+    copies of a Raw instance re-map the file when they need it. The file size
+    is checked before each access, as reading past the end of a file that was
+    truncated after it was mapped crashes the interpreter.
+    """
+
+    def __init__(self, fname):
+        self.fname = fname
+        self._mmap = None
+
+    @property
+    def size(self):
+        """The (current) file size in bytes."""
+        return _file_size(self.fname)
+
+    def get(self, offset, shape, dtype):
+        """Get a read-only view of part of the file, or None if truncated."""
+        dtype = np.dtype(dtype)
+        if offset + int(np.prod(shape)) * dtype.itemsize > self.size:
+            return None
+        if self._mmap is None:
+            self._mmap = np.memmap(self.fname, dtype=np.uint8, mode="r")
+        return np.ndarray(shape, dtype=dtype, buffer=self._mmap, offset=offset)
+
+    def close(self):
+        self._mmap = None
+
+    def __deepcopy__(self, memodict):
+        return self.__class__(self.fname)
+
+    def __getstate__(self):
+        return dict(fname=self.fname)
+
+    def __setstate__(self, state):
+        self.fname = state["fname"]
+        self._mmap = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} | {self.fname}>"
+
+
+def _read_segments_mmap(
+    raw,
+    data,
+    idx,
+    fi,
+    start,
+    stop,
+    cals,
+    mult,
+    dtype,
+    n_channels=None,
+    offset=0,
+    multiplexed=True,
+    n_samples=None,
+):
+    """Read a chunk of raw data through a memory map of the file.
+
+    Only the requested channels and samples are copied (from a strided view),
+    and calibration is applied in place to the output. Data are stored
+    multiplexed (time by channels) or, if ``multiplexed=False``, vectorized
+    (channels by ``n_samples`` time points). The file is mapped for each
+    call, so no file handle is kept open between reads.
+    """
+    if n_channels is None:
+        n_channels = raw._raw_extras[fi]["orig_nchan"]
+    mm = _FileMmap(raw._filenames[fi])
+    dtype = np.dtype(dtype)
+    n_file = (mm.size - offset) // (n_channels * dtype.itemsize)
+    if n_samples is None:
+        n_samples = n_file
+    if stop > min(n_samples, n_file) or n_samples > n_file:
+        raise RuntimeError(
+            f"Incorrect number of samples ({n_file} < {max(n_samples, stop)}), "
+            "please report this error to MNE-Python developers"
+        )
+    if n_samples == 0 or stop <= start:
+        return
+    shape = (n_samples, n_channels) if multiplexed else (n_channels, n_samples)
+    mm = mm.get(offset, shape, dtype)
+    block = mm[start:stop].T if multiplexed else mm[:, start:stop]
+    if mult is not None:
+        data[:] = mult @ np.asarray(block[idx], np.float64)
+    else:
+        data[:] = block[idx]
+        data *= cals
+
+
 def read_str(fid, count=1):
     """Read string from a binary file in a python version compatible way."""
     dtype = np.dtype(">S%i" % count)
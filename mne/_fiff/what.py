@@ -7,6 +7,8 @@ from collections import OrderedDict
 from inspect import signature
 
 from ..utils import _check_fname, logger
+from .constants import FIFF
+from .open import _check_file_id, _fiff_get_fid, _find_block_start, _read_directory
 
 
 def what(fname):
@@ -41,6 +43,10 @@ def what(fname):
     from .meas_info import read_fiducials
 
     _check_fname(fname, overwrite="read", must_exist=True)
+    # Raw files are the most common and the most costly to fully parse, so
+    # look for a raw data block in the tag directory first
+    if _has_raw_data_block(fname):
+        return "raw"
     checks = OrderedDict()
     checks["raw"] = read_raw_fif
     checks["ica"] = read_ica
@@ -69,3 +75,17 @@ def what(fname):
         else:
             return what
     return "unknown"
+
+
+def _has_raw_data_block(fname):
+    try:
+        with _fiff_get_fid(fname) as fid:
+            _check_file_id(fname, fid)
+            directory = _read_directory(fname, fid)
+            return any(
+                _find_block_start(fid, directory, kind) is not None
+                for kind in (FIFF.FIFFB_RAW_DATA, FIFF.FIFFB_CONTINUOUS_DATA)
+            )
+    except Exception as exp:
+        logger.debug(f"Could not read FIF tag directory: {exp}")
+        return False
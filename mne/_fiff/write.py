@@ -33,11 +33,11 @@ def _write(fid, data, kind, data_size, FIFFT_TYPE, dtype):
     # XXX for string types the data size is used as
     # computed in ``write_string``.
 
-    fid.write(np.array(kind, dtype=">i4").tobytes())
-    fid.write(np.array(FIFFT_TYPE, dtype=">i4").tobytes())
-    fid.write(np.array(data_size, dtype=">i4").tobytes())
-    fid.write(np.array(FIFF.FIFFV_NEXT_SEQ, dtype=">i4").tobytes())
-    fid.write(np.array(data, dtype=dtype).tobytes())
+    fid.write(
+        np.array([kind, FIFFT_TYPE, data_size, FIFF.FIFFV_NEXT_SEQ], ">i4").tobytes()
+    )
+    # avoid an extra copy of (potentially large) data buffers
+    fid.write(np.ascontiguousarray(data, dtype=dtype).data)
 
 
 def _get_split_size(split_size):
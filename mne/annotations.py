@@ -83,14 +83,14 @@ def _check_o_d_s_c(onset, duration, description, ch_names):
         raise ValueError(
             f"Description must be a one dimensional array, got {description.ndim}."
         )
-    _safe_name_list(description, "write", "description")
+    _safe_name_list(np.unique(description), "write", "description")
 
     # ch_names: convert to ndarray of tuples
     _validate_type(ch_names, (None, tuple, list, np.ndarray), "ch_names")
-    if ch_names is None:
-        ch_names = [()] * len(onset)
-    ch_names = list(ch_names)
+    ch_names = [()] * len(onset) if ch_names is None else list(ch_names)
     for ai, ch in enumerate(ch_names):
+        if isinstance(ch, tuple) and not ch:
+            continue  # no channels (the default)
         _validate_type(ch, (list, tuple, np.ndarray), f"ch_names[{ai}]")
         ch_names[ai] = tuple(ch)
         for ci, name in enumerate(ch_names[ai]):
@@ -116,6 +116,85 @@ def _ndarray_ch_names(ch_names):
     return out
 
 
+_us = timedelta(microseconds=1)
+
+
+def _seconds_to_us(seconds):
+    """Convert seconds to integer microseconds, rounding like timedelta."""
+    frac, whole = np.modf(seconds)
+    frac, us = np.modf(frac * 1e6)
+    us = whole.astype(np.int64) * 1_000_000 + us.astype(np.int64)
+    # round half to even (of the total) as timedelta(seconds=...) does
+    odd = us & 1
+    rounded = np.where(
+        np.abs(frac) == 0.5, 2 * np.round((frac + odd) * 0.5) - odd, np.round(frac)
+    )
+    return us + rounded.astype(np.int64)
+
+
+def _match_kinds(description, kinds):
+    """Get which descriptions start with any of the kinds (case insensitive)."""
+    description = np.char.upper(np.asarray(description, str))
+    match = np.zeros(len(description), bool)
+    for kind in kinds:
+        match |= np.char.startswith(description, kind.upper())
+    return match
+
+
+class _IntervalIndex:
+    """Index of intervals for finding those that overlap query windows.
+
+    The intervals are sorted by start, so those starting before the end of a
+    window form a prefix, and the running maximum of their ends gives the first
+    one that can reach into the window, both found by binary search.
+    """
+
+    def __init__(self, starts, ends, idx):
+        order = np.argsort(starts, kind="stable")
+        self.starts = starts[order]
+        self.ends = ends[order]
+        self.idx = idx[order]
+        # NaN ends (durations) never overlap anything
+        self.max_ends = np.maximum.accumulate(
+            np.where(np.isnan(self.ends), -np.inf, self.ends)
+        )
+
+    def overlapping(self, tmin, tmax, closed=True):
+        """Find the intervals overlapping the given windows.
+
+        Parameters
+        ----------
+        tmin, tmax : float | array of float, shape (n_windows,)
+            The window starts and stops.
+        closed : bool
+            If True, intervals overlap windows [tmin, tmax] if they start at
+            or before ``tmax`` and end at or after ``tmin``. If False, they
+            must start before ``tmax`` and end after ``tmin``.
+
+        Returns
+        -------
+        windows : array of int, shape (n_overlaps,)
+            The window of each overlap.
+        idx : array of int, shape (n_overlaps,)
+            The original index of the interval of each overlap, sorted within
+            each window.
+        """
+        tmin, tmax = np.atleast_1d(tmin), np.atleast_1d(tmax)
+        side = "left" if closed else "right"
+        first = np.searchsorted(self.max_ends, tmin, side)
+        last = np.searchsorted(self.starts, tmax, "right" if closed else "left")
+        counts = np.maximum(last - first, 0)
+        windows = np.repeat(np.arange(len(tmin)), counts)
+        # positions first[w], ..., last[w] - 1 for each window w
+        pos = np.arange(counts.sum())
+        pos += np.repeat(first - np.cumsum(counts) + counts, counts)
+        ends = self.ends[pos]
+        keep = ends >= tmin[windows] if closed else ends > tmin[windows]
+        windows, idx = windows[keep], self.idx[pos[keep]]
+        order = np.lexsort((idx, windows))
+        return windows[order], idx[order]
+
+
 @fill_doc
 class Annotations:
     """Annotation object for annotating segments of raw data.
@@ -278,6 +357,8 @@ class Annotations:
     """  # noqa: E501
 
     def __init__(self, onset, duration, description, orig_time=None, ch_names=None):
+        self._index = dict()
+        self._version = 0  # increased when the arrays are set, see _get_index
         self._orig_time = _handle_meas_date(orig_time)
         self.onset, self.duration, self.description, self.ch_names = _check_o_d_s_c(
             onset, duration, description, ch_names
@@ -289,6 +370,39 @@ class Annotations:
         """The time base of the Annotations."""
         return self._orig_time
 
+    # Setting the arrays (including in-place operators like
+    # annotations.onset += 1) invalidates the cached interval indices
+
+    @property
+    def onset(self):
+        """The onsets of the annotations in seconds after ``orig_time``."""
+        return self._onset
+
+    @onset.setter
+    def onset(self, onset):
+        self._onset = onset
+        self._version += 1
+
+    @property
+    def duration(self):
+        """The durations of the annotations in seconds."""
+        return self._duration
+
+    @duration.setter
+    def duration(self, duration):
+        self._duration = duration
+        self._version += 1
+
+    @property
+    def description(self):
+        """The descriptions of the annotations."""
+        return self._description
+
+    @description.setter
+    def description(self, description):
+        self._description = description
+        self._version += 1
+
     def __eq__(self, other):
         """Compare to another Annotations instance."""
         if not isinstance(other, Annotations):
@@ -352,7 +466,7 @@ class Annotations:
         # Figure this out once ahead of time for consistency and speed (for
         # thousands of annotations)
         with_ch_names = self._any_ch_names()
-        for idx in range(len(self.onset)):
+        for idx in range(len(self)):
             yield self.__getitem__(idx, with_ch_names=with_ch_names)
 
     def __getitem__(self, key, *, with_ch_names=None):
@@ -564,15 +678,53 @@ class Annotations:
 
     def _sort(self):
         """Sort in place."""
-        # instead of argsort here we use sorted so that it gives us
-        # the onset-then-duration hierarchy
-        vals = sorted(zip(self.onset, self.duration, range(len(self))))
-        order = list(list(zip(*vals))[-1]) if len(vals) else []
+        # sort by onset, then duration (then original order)
+        if np.isnan(self.onset).any() or np.isnan(self.duration).any():
+            # NaNs compare differently, keep the behavior of sorted() for them
+            vals = sorted(zip(self.onset, self.duration, range(len(self))))
+            order = list(list(zip(*vals))[-1]) if len(vals) else []
+        else:
+            order = np.lexsort((self.duration, self.onset))
         self.onset = self.onset[order]
         self.duration = self.duration[order]
         self.description = self.description[order]
         self.ch_names = self.ch_names[order]
 
+    def _get_index(self, offset=0.0, kinds=None):
+        """Get a (cached) interval index of the annotations.
+
+        Parameters
+        ----------
+        offset : float
+            Offset subtracted from the onsets, e.g. ``raw._first_time`` to get
+            onsets relative to the first sample as in ``_sync_onset``.
+        kinds : tuple of str | None
+            Only index annotations whose description starts with one of these
+            (case insensitive). None indexes all annotations.
+
+        Returns
+        -------
+        index : instance of _IntervalIndex
+            The index.
+
+        Notes
+        -----
+        Indices are cached until ``onset``, ``duration`` or ``description``
+        are set, which includes in-place operators such as
+        ``annotations.onset += 1``. Changing single elements of the arrays
+        (e.g., ``annotations.description[0] = "BAD"``) is not detected.
+        """
+        key = (offset, kinds)
+        if self._index.get(key, (None,))[0] != self._version:
+            if kinds is None:
+                idx = np.arange(len(self))
+            else:
+                idx = np.flatnonzero(_match_kinds(self.description, kinds))
+            starts = self.onset[idx] - offset
+            index = _IntervalIndex(starts, starts + self.duration[idx], idx)
+            self._index[key] = (self._version, index)
+        return self._index[key][1]
+
     @verbose
     def crop(
         self, tmin=None, tmax=None, emit_warning=False, use_orig_time=True, verbose=None
@@ -624,62 +776,40 @@ class Annotations:
             )
         logger.debug(f"Cropping annotations {absolute_tmin} - {absolute_tmax}")
 
-        onsets, durations, descriptions, ch_names = [], [], [], []
-        out_of_bounds, clip_left_elem, clip_right_elem = [], [], []
-        for idx, (onset, duration, description, ch) in enumerate(
-            zip(self.onset, self.duration, self.description, self.ch_names)
-        ):
-            # if duration is NaN behave like a zero
-            if np.isnan(duration):
-                duration = 0.0
-            # convert to absolute times
-            absolute_onset = timedelta(seconds=onset) + offset
-            absolute_offset = absolute_onset + timedelta(seconds=duration)
-            out_of_bounds.append(
-                absolute_onset > absolute_tmax or absolute_offset < absolute_tmin
-            )
-            if out_of_bounds[-1]:
-                clip_left_elem.append(False)
-                clip_right_elem.append(False)
-                logger.debug(
-                    f"  [{idx}] Dropping "
-                    f"({absolute_onset} - {absolute_offset}: {description})"
-                )
-            else:
-                # clip the left side
-                clip_left_elem.append(absolute_onset < absolute_tmin)
-                if clip_left_elem[-1]:
-                    absolute_onset = absolute_tmin
-                clip_right_elem.append(absolute_offset > absolute_tmax)
-                if clip_right_elem[-1]:
-                    absolute_offset = absolute_tmax
-                if clip_left_elem[-1] or clip_right_elem[-1]:
-                    durations.append((absolute_offset - absolute_onset).total_seconds())
-                else:
-                    durations.append(duration)
-                onsets.append((absolute_onset - offset).total_seconds())
-                logger.debug(
-                    f"  [{idx}] Keeping  "
-                    f"({absolute_onset} - {absolute_offset} -> "
-                    f"{onset} - {onset + duration})"
-                )
-                descriptions.append(description)
-                ch_names.append(ch)
-        logger.debug(f"Cropping complete (kept {len(onsets)})")
-        self.onset = np.array(onsets, float)
-        self.duration = np.array(durations, float)
+        # work with integer microseconds relative to the offset, like datetime
+        tmin_us = (absolute_tmin - offset) // _us
+        tmax_us = (absolute_tmax - offset) // _us
+        # if duration is NaN behave like a zero
+        duration = np.where(np.isnan(self.duration), 0.0, self.duration)
+        onset_us = _seconds_to_us(self.onset)
+        offset_us = onset_us + _seconds_to_us(duration)
+        out_of_bounds = (onset_us > tmax_us) | (offset_us < tmin_us)
+        keep = ~out_of_bounds
+        clip_left_elem = keep & (onset_us < tmin_us)
+        clip_right_elem = keep & (offset_us > tmax_us)
+        onset_us = np.maximum(onset_us[keep], tmin_us)
+        offset_us = np.minimum(offset_us[keep], tmax_us)
+        clipped = (clip_left_elem | clip_right_elem)[keep]
+        duration = duration[keep]
+        duration[clipped] = (offset_us[clipped] - onset_us[clipped]) / 1e6
+        logger.debug(
+            f"Cropping complete (kept {keep.sum()}, clipped {clipped.sum()}, "
+            f"dropped {out_of_bounds.sum()})"
+        )
+        self.onset = onset_us / 1e6
+        self.duration = duration
         assert (self.duration >= 0).all()
-        self.description = np.array(descriptions, dtype=str)
-        self.ch_names = _ndarray_ch_names(ch_names)
+        self.description = self.description[keep].astype(str)
+        self.ch_names = self.ch_names[keep]
 
         if emit_warning:
-            omitted = np.array(out_of_bounds).sum()
+            omitted = out_of_bounds.sum()
             if omitted > 0:
                 warn(
                     "Omitted %s annotation(s) that were outside data"
                     " range." % omitted
                 )
-            limited = (np.array(clip_left_elem) | np.array(clip_right_elem)).sum()
+            limited = (clip_left_elem | clip_right_elem).sum()
             if limited > 0:
                 warn(
                     "Limited %s annotation(s) that were expanding outside the"
@@ -722,6 +852,7 @@ class Annotations:
             for stim in mapping:
                 map_idx = [desc == stim for desc in self.description]
                 self.duration[map_idx] = mapping[stim]
+            self._version += 1
 
         elif _is_numeric(mapping):
             self.duration = np.ones(self.description.shape) * mapping
@@ -857,43 +988,35 @@ class EpochAnnotationsMixin:
         epoch_starts, epoch_stops = (
             np.atleast_2d(epoch_tzeros) + np.atleast_2d(self.times[[0, -1]]).T
         )
-        # ... because first_samp isn't accounted for here either
-        annot_starts = self._annotations.onset
-        annot_stops = annot_starts + self._annotations.duration
-
-        # the first two cases (annot_straddles_epoch_{start|end}) will both
-        # (redundantly) capture cases where an annotation fully encompasses
-        # an epoch (e.g., annot from 1-4s, epoch from 2-3s). The redundancy
-        # doesn't matter because results are summed and then cast to bool (all
-        # we care about is presence/absence of overlap).
-        annot_straddles_epoch_start = np.logical_and(
-            np.atleast_2d(epoch_starts) >= np.atleast_2d(annot_starts).T,
-            np.atleast_2d(epoch_starts) < np.atleast_2d(annot_stops).T,
+        # ... because first_samp isn't accounted for here either, and the
+        # interval index gives all annotations overlapping [start, stop] ...
+        epo_ixs, annot_ixs = self._annotations._get_index().overlapping(
+            epoch_starts, epoch_stops
         )
+        epoch_starts, epoch_stops = epoch_starts[epo_ixs], epoch_stops[epo_ixs]
+        annot_starts = self._annotations.onset[annot_ixs]
+        annot_stops = annot_starts + self._annotations.duration[annot_ixs]
 
+        # ... of which we keep those that straddle the epoch start or end, or are
+        # fully contained within the epoch (or exactly coextensive with it), so
+        # not those only touching the epoch from outside
+        annot_straddles_epoch_start = np.logical_and(
+            epoch_starts >= annot_starts, epoch_starts < annot_stops
+        )
         annot_straddles_epoch_end = np.logical_and(
-            np.atleast_2d(epoch_stops) > np.atleast_2d(annot_starts).T,
-            np.atleast_2d(epoch_stops) <= np.atleast_2d(annot_stops).T,
+            epoch_stops > annot_starts, epoch_stops <= annot_stops
         )
-
-        # this captures the only remaining case we care about: annotations
-        # fully contained within an epoch (or exactly coextensive with it).
         annot_fully_within_epoch = np.logical_and(
-            np.atleast_2d(epoch_starts) <= np.atleast_2d(annot_starts).T,
-            np.atleast_2d(epoch_stops) >= np.atleast_2d(annot_stops).T,
+            epoch_starts <= annot_starts, epoch_stops >= annot_stops
         )
-
-        # combine all cases to get array of shape (n_annotations, n_epochs).
-        # Nonzero entries indicate overlap between the corresponding
-        # annotation (row index) and epoch (column index).
-        all_cases = (
+        overlap = (
             annot_straddles_epoch_start
-            + annot_straddles_epoch_end
-            + annot_fully_within_epoch
+            | annot_straddles_epoch_end
+            | annot_fully_within_epoch
         )
 
         # for each Epoch-Annotation overlap occurrence:
-        for annot_ix, epo_ix in zip(*np.nonzero(all_cases)):
+        for annot_ix, epo_ix in zip(annot_ixs[overlap], epo_ixs[overlap]):
             this_annot = self._annotations[annot_ix]
             this_tzero = epoch_tzeros[epo_ix]
             # adjust annotation onset to be relative to epoch tzero...
@@ -987,22 +1110,6 @@ class EpochAnnotationsMixin:
         return self
 
 
-def _combine_annotations(
-    one, two, one_n_samples, one_first_samp, two_first_samp, sfreq
-):
-    """Combine a tuple of annotations."""
-    assert one is not None
-    assert two is not None
-    shift = one_n_samples / sfreq  # to the right by the number of samples
-    shift += one_first_samp / sfreq  # to the right by the offset
-    shift -= two_first_samp / sfreq  # undo its offset
-    onset = np.concatenate([one.onset, two.onset + shift])
-    duration = np.concatenate([one.duration, two.duration])
-    description = np.concatenate([one.description, two.description])
-    ch_names = np.concatenate([one.ch_names, two.ch_names])
-    return Annotations(onset, duration, description, one.orig_time, ch_names)
-
-
 def _handle_meas_date(meas_date):
     """Convert meas_date to datetime or None.
 
@@ -1061,25 +1168,21 @@ def _annotations_starts_stops(raw, kinds, name="skip_by_annotation", invert=Fals
     if len(raw.annotations) == 0:
         onsets, ends = np.array([], int), np.array([], int)
     else:
-        idxs = [
-            idx
-            for idx, desc in enumerate(raw.annotations.description)
-            if any(desc.upper().startswith(kind.upper()) for kind in kinds)
-        ]
-        # onsets are already sorted
-        onsets = raw.annotations.onset[idxs]
-        onsets = _sync_onset(raw, onsets)
-        ends = onsets + raw.annotations.duration[idxs]
-        onsets = raw.time_as_index(onsets, use_rounding=True)
-        ends = raw.time_as_index(ends, use_rounding=True)
+        assert raw.info["meas_date"] == raw.annotations.orig_time
+        index = raw.annotations._get_index(raw._first_time, tuple(kinds))
+        # keep the (sorted) order of the annotations
+        order = np.argsort(index.idx, kind="stable")
+        onsets = raw.time_as_index(index.starts[order], use_rounding=True)
+        ends = raw.time_as_index(index.ends[order], use_rounding=True)
     assert (onsets <= ends).all()  # all durations >= 0
     if invert:
         # We need to eliminate overlaps here, otherwise wacky things happen,
         # so we carefully invert the relationship
-        mask = np.zeros(len(raw.times), bool)
-        for onset, end in zip(onsets, ends):
-            mask[onset:end] = True
-        mask = ~mask
+        n_times = len(raw.times)
+        covered = np.zeros(n_times + 1, int)
+        np.add.at(covered, np.clip(onsets, 0, n_times), 1)
+        np.add.at(covered, np.clip(ends, 0, n_times), -1)
+        mask = np.cumsum(covered[:-1]) == 0
         extras = onsets == ends
         extra_onsets, extra_ends = onsets[extras], ends[extras]
         onsets, ends = _mask_to_onsets_offsets(mask)
@@ -1421,13 +1524,12 @@ def _select_annotations_based_on_description(descriptions, event_id, regexp):
     regexp_comp = re.compile(".*" if regexp is None else regexp)
 
     event_id_ = dict()
-    dropped = []
-    # Iterate over the sorted descriptions so that the Counter mapping
+    # Iterate over the sorted unique descriptions so that the Counter mapping
     # is slightly less arbitrary
-    for desc in sorted(descriptions):
-        if desc in event_id_:
-            continue
-
+    uniques, inverse = np.unique(np.asarray(descriptions, str), return_inverse=True)
+    triggers = np.zeros(len(uniques), int)
+    selected = np.zeros(len(uniques), bool)
+    for ui, desc in enumerate(uniques.tolist()):
         if regexp_comp.match(desc) is None:
             continue
 
@@ -1441,27 +1543,29 @@ def _select_annotations_based_on_description(descriptions, event_id, regexp):
             if trigger is not None:
                 event_id_[desc] = trigger
             else:
-                dropped.append(desc)
+                continue
+        triggers[ui] = event_id_[desc]
+        selected[ui] = True
 
-    event_sel = [ii for ii, kk in enumerate(descriptions) if kk in event_id_]
+    event_sel = np.flatnonzero(selected[inverse])
 
     if len(event_sel) == 0 and regexp is not None:
         raise ValueError("Could not find any of the events you specified.")
 
-    return event_sel, event_id_
+    return event_sel, event_id_, triggers[inverse[event_sel]]
 
 
 def _select_events_based_on_id(events, event_desc):
     """Get a collection of events and returns index of selected."""
     event_desc_ = dict()
     func = event_desc.get if isinstance(event_desc, dict) else event_desc
-    event_ids = events[np.unique(events[:, 2], return_index=True)[1], 2]
+    event_ids = np.unique(events[:, 2])
     for e in event_ids:
         trigger = func(e)
         if trigger is not None:
             event_desc_[e] = trigger
 
-    event_sel = [ii for ii, e in enumerate(events) if e[2] in event_desc_]
+    event_sel = np.flatnonzero(np.isin(events[:, 2], list(event_desc_)))
 
     if len(event_sel) == 0:
         raise ValueError("Could not find any of the events you specified.")
@@ -1600,7 +1704,7 @@ def events_from_annotations(
 
     event_id = _check_event_id(event_id, raw)
 
-    event_sel, event_id_ = _select_annotations_based_on_description(
+    event_sel, event_id_, values = _select_annotations_based_on_description(
         annotations.description, event_id=event_id, regexp=regexp
     )
 
@@ -1610,27 +1714,30 @@ def events_from_annotations(
         )
         if annotations.orig_time is not None:
             inds += raw.first_samp
-        values = [event_id_[kk] for kk in annotations.description[event_sel]]
         inds = inds[event_sel]
     else:
-        inds = values = np.array([]).astype(int)
-        for annot in annotations[event_sel]:
-            annot_offset = annot["onset"] + annot["duration"]
-            _onsets = np.arange(annot["onset"], annot_offset, chunk_duration)
-            good_events = annot_offset - _onsets >= chunk_duration
-            if good_events.any():
-                _onsets = _onsets[good_events]
-                _inds = raw.time_as_index(
-                    _onsets, use_rounding=use_rounding, origin=annotations.orig_time
-                )
-                _inds += raw.first_samp
-                inds = np.append(inds, _inds)
-                _values = np.full(
-                    shape=len(_inds),
-                    fill_value=event_id_[annot["description"]],
-                    dtype=int,
-                )
-                values = np.append(values, _values)
+        onsets = annotations.onset[event_sel]
+        offsets = onsets + annotations.duration[event_sel]
+        # all the np.arange(onset, offset, chunk_duration) at once, with the same
+        # values: the second one is onset + chunk_duration, and the others use the
+        # difference between the first two as the step
+        n_chunks = np.ceil((offsets - onsets) / chunk_duration)
+        n_chunks = np.where(n_chunks > 0, n_chunks, 0).astype(int)  # also for NaN
+        second_onsets = onsets + chunk_duration
+        idx = np.repeat(np.arange(len(onsets)), n_chunks)
+        chunk_idx = np.arange(len(idx))
+        chunk_idx -= np.repeat(np.cumsum(n_chunks) - n_chunks, n_chunks)
+        _onsets = onsets[idx] + chunk_idx * (second_onsets - onsets)[idx]
+        second = chunk_idx == 1
+        _onsets[second] = second_onsets[idx[second]]
+        good_events = offsets[idx] - _onsets >= chunk_duration
+        inds = raw.time_as_index(
+            _onsets[good_events],
+            use_rounding=use_rounding,
+            origin=annotations.orig_time,
+        )
+        inds += raw.first_samp
+        values = values[idx[good_events]]
 
     events = np.c_[inds, np.zeros(len(inds)), values].astype(int)
 
@@ -1696,7 +1803,8 @@ def annotations_from_events(
     event_sel, event_desc_ = _select_events_based_on_id(events, event_desc)
     events_sel = events[event_sel]
     onsets = (events_sel[:, 0] - first_samp) / sfreq
-    descriptions = [event_desc_[e[2]] for e in events_sel]
+    event_ids, inverse = np.unique(events_sel[:, 2], return_inverse=True)
+    descriptions = np.array([event_desc_[e] for e in event_ids], str)[inverse]
     durations = np.zeros(len(events_sel))  # dummy durations
 
     # Create annotations
@@ -613,7 +613,10 @@ class UpdateChannelsMixin:
         msg = "adding, dropping, or reordering channels"
         if isinstance(self, BaseRaw):
             if self._projector is not None:
-                _check_preload(self, f"{msg} after calling .apply_proj()")
+                _check_preload(
+                    self, f"{msg} after calling .apply_proj()", write=False
+                )
+            self._shared = False  # the data are copied below
         else:
             _check_preload(self, msg)
 
@@ -705,7 +708,7 @@ class UpdateChannelsMixin:
 
         # Object-specific checks
         for inst in add_list + [self]:
-            _check_preload(inst, "adding channels")
+            _check_preload(inst, "adding channels", write=inst is self)
         if isinstance(self, BaseRaw):
             con_axis = 0
             comp_class = BaseRaw
@@ -3,12 +3,17 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
 
+from contextlib import contextmanager
+from functools import partial
+
 import numpy as np
-from scipy.fft import irfft, rfft
+from scipy import fft
 
 from .utils import (
     _check_option,
+    _ensure_int,
     _explain_exception,
+    _soft_import,
     fill_doc,
     get_config,
     logger,
@@ -123,6 +128,114 @@ def _set_cuda_device(device_id, verbose=None):
     logger.info(f"Now using CUDA device {device_id}")
 
 
+###############################################################################
+# FFT backends
+
+_FFT_BACKENDS = ("scipy", "numpy", "pyfftw")
+_fft_backend = dict(backend="scipy", workers=None)
+
+
+@verbose
+def set_fft_backend(backend="scipy", *, workers=None, verbose=None):
+    """Set the backend used for FFT-based filtering, resampling and TFRs.
+
+    Parameters
+    ----------
+    backend : str
+        Can be ``"scipy"`` (default), ``"numpy"`` or ``"pyfftw"``. The
+        ``"pyfftw"`` backend requires :mod:`pyfftw` and caches the FFTW plans
+        between calls.
+    workers : int | str | None
+        Number of threads used for each FFT (ignored by the ``"numpy"``
+        backend). None (default) means one thread and negative values count
+        backward from the number of CPUs, as for :func:`scipy.fft.fft`.
+        If ``"n_jobs"``, the ``n_jobs`` parameter of FIR filtering and FFT
+        resampling functions sets the number of FFT threads instead of the
+        number of parallel joblib jobs (not supported by the ``"numpy"``
+        backend, which is single-threaded).
+    %(verbose)s
+
+    Returns
+    -------
+    old_backend : str
+        The previous backend.
+
+    See Also
+    --------
+    mne.use_fft_backend
+
+    Notes
+    -----
+    The backend is a setting of the current process only. Functions that run
+    parallel joblib jobs pass the FFT functions of this backend to the jobs,
+    so the backend does not need to be set in the worker processes.
+
+    .. versionadded:: 1.7
+    """
+    _check_option("backend", backend, _FFT_BACKENDS)
+    if isinstance(workers, str):
+        _check_option("workers", workers, ("n_jobs",))
+        if backend == "numpy":
+            raise ValueError(
+                'workers="n_jobs" is not supported by the "numpy" FFT backend, '
+                "which does not use threads"
+            )
+    elif workers is not None:
+        workers = _ensure_int(workers, "workers", "an int, str, or None")
+    if backend == "pyfftw":
+        pyfftw = _soft_import("pyfftw", "the pyfftw FFT backend")
+        pyfftw.interfaces.cache.enable()
+    old_backend = _fft_backend["backend"]
+    _fft_backend.update(backend=backend, workers=workers)
+    logger.info(f"Using the {backend} FFT backend with workers={workers}")
+    return old_backend
+
+
+@contextmanager
+def use_fft_backend(backend="scipy", *, workers=None):
+    """Create a context using the designated FFT backend.
+
+    See :func:`mne.set_fft_backend` for details.
+
+    Parameters
+    ----------
+    backend : str
+        The FFT backend to use in the context.
+    workers : int | str | None
+        The number of FFT threads to use in the context.
+
+    Notes
+    -----
+    .. versionadded:: 1.7
+    """
+    old = _fft_backend.copy()
+    set_fft_backend(backend, workers=workers, verbose=False)
+    try:
+        yield
+    finally:
+        _fft_backend.update(old)
+
+
+def _get_fft(kind, workers=None):
+    """Get an FFT function (e.g., "rfft") of the current backend."""
+    if _fft_backend["backend"] == "numpy":
+        return getattr(np.fft, kind)
+    if workers is None and _fft_backend["workers"] != "n_jobs":
+        workers = _fft_backend["workers"]
+    if _fft_backend["backend"] == "pyfftw":
+        from pyfftw.interfaces import scipy_fft as mod
+    else:
+        mod = fft
+    return partial(getattr(mod, kind), workers=workers)
+
+
+def _fft_n_jobs(n_jobs):
+    """Split n_jobs into (joblib jobs, FFT threads)."""
+    if _fft_backend["workers"] == "n_jobs" and not isinstance(n_jobs, str):
+        return 1, n_jobs
+    return n_jobs, None
+
+
 ###############################################################################
 # Repeated FFT multiplication
 
@@ -145,8 +258,9 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
     Returns
     -------
     n_jobs : int
-        Sets n_jobs = 1 if n_jobs == 'cuda' was passed in, otherwise
-        original n_jobs is passed.
+        Sets n_jobs = 1 if n_jobs == 'cuda' was passed in (or if n_jobs is
+        used as the number of FFT threads, see :func:`set_fft_backend`),
+        otherwise original n_jobs is passed.
     cuda_dict : dict
         Dictionary with the following CUDA-related variables:
             use_cuda : bool
@@ -167,7 +281,11 @@ def _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft, kind="FFT FIR filtering"
     -----
     This function is designed to be used with fft_multiply_repeated().
     """
-    cuda_dict = dict(n_fft=n_fft, rfft=rfft, irfft=irfft, h_fft=rfft(h, n=n_fft))
+    n_jobs, workers = _fft_n_jobs(n_jobs)
+    rfft = _get_fft("rfft", workers)
+    cuda_dict = dict(
+        n_fft=n_fft, rfft=rfft, irfft=_get_fft("irfft", workers), h_fft=rfft(h, n=n_fft)
+    )
     if isinstance(n_jobs, str):
         _check_option("n_jobs", n_jobs, ("cuda",))
         n_jobs = 1
@@ -215,7 +333,10 @@ def _fft_multiply_repeated(x, cuda_dict):
     """
     # do the fourier-domain operations
     x_fft = cuda_dict["rfft"](x, cuda_dict["n_fft"])
-    x_fft *= cuda_dict["h_fft"]
+    if cuda_dict["h_fft"].ndim > 1:  # several filters at once
+        x_fft = x_fft * cuda_dict["h_fft"]
+    else:
+        x_fft *= cuda_dict["h_fft"]
     x = cuda_dict["irfft"](x_fft, cuda_dict["n_fft"])
     return x
 
@@ -243,8 +364,9 @@ def _setup_cuda_fft_resample(n_jobs, W, new_len):
     Returns
     -------
     n_jobs : int
-        Sets n_jobs = 1 if n_jobs == 'cuda' was passed in, otherwise
-        original n_jobs is passed.
+        Sets n_jobs = 1 if n_jobs == 'cuda' was passed in (or if n_jobs is
+        used as the number of FFT threads, see :func:`set_fft_backend`),
+        otherwise original n_jobs is passed.
     cuda_dict : dict
         Dictionary with the following CUDA-related variables:
             use_cuda : bool
@@ -263,7 +385,10 @@ def _setup_cuda_fft_resample(n_jobs, W, new_len):
     -----
     This function is designed to be used with fft_resample().
     """
-    cuda_dict = dict(use_cuda=False, rfft=rfft, irfft=irfft)
+    n_jobs, workers = _fft_n_jobs(n_jobs)
+    cuda_dict = dict(
+        use_cuda=False, rfft=_get_fft("rfft", workers), irfft=_get_fft("irfft", workers)
+    )
     rfft_len_x = len(W) // 2 + 1
     # fold the window onto inself (should be symmetric) and truncate
     W = W.copy()
@@ -882,29 +882,57 @@ class BaseEpochs(
     @verbose  # verbose is used by mne-realtime
     def _is_good_epoch(self, data, verbose=None):
         """Determine if epoch is good."""
-        if isinstance(data, str):
-            return False, (data,)
-        if data is None:
-            return False, ("NO_DATA",)
+        (bad_tuple,) = self._is_good_epochs([data])
+        return bad_tuple is None, bad_tuple
+
+    def _is_good_epochs(self, epochs):
+        """Determine which epochs are good.
+
+        Parameters
+        ----------
+        epochs : list of (array | str | None) | array
+            The epochs, as returned by ``_detrend_offset_decim``.
+
+        Returns
+        -------
+        bad_tuples : list of tuple | None
+            The reasons to drop each epoch, None if it is good.
+        """
+        bad_tuples = [None] * len(epochs)
         n_times = len(self.times)
-        if data.shape[1] < n_times:
-            # epoch is too short ie at the end of the data
-            return False, ("TOO_SHORT",)
-        if self.reject is None and self.flat is None:
-            return True, None
+        if isinstance(epochs, np.ndarray):
+            check = np.arange(len(epochs))
         else:
-            if self._reject_time is not None:
-                data = data[:, self._reject_time]
-
-            return _is_good(
-                data,
-                self.ch_names,
-                self._channel_type_idx,
-                self.reject,
-                self.flat,
-                full_report=True,
-                ignore_chs=self.info["bads"],
-            )
+            check = list()
+            for ii, data in enumerate(epochs):
+                if isinstance(data, str):
+                    bad_tuples[ii] = (data,)
+                elif data is None:
+                    bad_tuples[ii] = ("NO_DATA",)
+                elif data.shape[1] < n_times:
+                    # epoch is too short ie at the end of the data
+                    bad_tuples[ii] = ("TOO_SHORT",)
+                else:
+                    check.append(ii)
+        if (self.reject is None and self.flat is None) or not len(check):
+            return bad_tuples
+        if isinstance(epochs, np.ndarray):
+            data = epochs
+        else:
+            data = np.array([epochs[ii] for ii in check])
+        if self._reject_time is not None:
+            data = data[..., self._reject_time]
+        check_bad_tuples = _get_bad_tuples(
+            data,
+            self.ch_names,
+            self._channel_type_idx,
+            self.reject,
+            self.flat,
+            ignore_chs=self.info["bads"],
+        )
+        for ii, bad_tuple in zip(check, check_bad_tuples):
+            bad_tuples[ii] = bad_tuple
+        return bad_tuples
 
     @verbose
     def _detrend_offset_decim(self, epoch, picks, verbose=None):
@@ -1557,6 +1585,11 @@ class BaseEpochs(
         """Get a given epoch from disk."""
         raise NotImplementedError
 
+    def _iter_epochs_from_raw(self, idx):
+        """Get the given epochs from disk."""
+        for ii in idx:
+            yield self._get_epoch_from_raw(ii)
+
     def _project_epoch(self, epoch):
         """Process a raw epoch based on the delayed param."""
         # whenever requested, the first epoch is being projected.
@@ -1694,9 +1727,8 @@ class BaseEpochs(
 
             # we need to load from disk, drop, and return data
             detrend_picks = self._detrend_picks
-            for ii, idx in enumerate(use_idx):
+            for ii, epoch_noproj in enumerate(self._iter_epochs_from_raw(use_idx)):
                 # faster to pre-allocate memory here
-                epoch_noproj = self._get_epoch_from_raw(idx)
                 epoch_noproj = self._detrend_offset_decim(epoch_noproj, detrend_picks)
                 if self._do_delayed_proj:
                     epoch_out = epoch_noproj
@@ -1717,41 +1749,52 @@ class BaseEpochs(
             assert n_events == len(self.selection)
             if not self.preload:
                 detrend_picks = self._detrend_picks
-            for idx, sel in enumerate(self.selection):
-                if self.preload:  # from memory
-                    if self._do_delayed_proj:
-                        epoch_noproj = self._data[idx]
+                epochs_from_raw = self._iter_epochs_from_raw(np.arange(n_events))
+            # check the thresholds of ~50 MB of epochs at a time
+            n_batch = len(self.ch_names) * len(self.times) * 8
+            n_batch = max(int(50e6 // n_batch), 1)
+            for batch_start in range(0, n_events, n_batch):
+                batch = range(batch_start, min(batch_start + n_batch, n_events))
+                if self.preload and not self._do_delayed_proj:  # from memory
+                    epochs = epochs_out = self._data[batch_start : batch.stop]
+                else:
+                    epochs, epochs_out = list(), list()
+                    for idx in batch:
+                        if self.preload:  # from memory
+                            epoch_noproj = self._data[idx]
+                        else:  # from disk
+                            epoch_noproj = next(epochs_from_raw)
+                            epoch_noproj = self._detrend_offset_decim(
+                                epoch_noproj, detrend_picks
+                            )
                         epoch = self._project_epoch(epoch_noproj)
-                    else:
-                        epoch_noproj = None
-                        epoch = self._data[idx]
-                else:  # from disk
-                    epoch_noproj = self._get_epoch_from_raw(idx)
-                    epoch_noproj = self._detrend_offset_decim(
-                        epoch_noproj, detrend_picks
-                    )
-                    epoch = self._project_epoch(epoch_noproj)
-
-                epoch_out = epoch_noproj if self._do_delayed_proj else epoch
-                is_good, bad_tuple = self._is_good_epoch(epoch, verbose=verbose)
-                if not is_good:
-                    assert isinstance(bad_tuple, tuple)
-                    assert all(isinstance(x, str) for x in bad_tuple)
-                    drop_log[sel] = drop_log[sel] + bad_tuple
-                    continue
-                good_idx.append(idx)
-
-                # store the epoch if there is a reason to (output or update)
-                if out or self.preload:
-                    # faster to pre-allocate, then trim as necessary
-                    if n_out == 0 and not self.preload:
-                        data = np.empty(
-                            (n_events, epoch_out.shape[0], epoch_out.shape[1]),
-                            dtype=epoch_out.dtype,
-                            order="C",
+                        epochs.append(epoch)
+                        epochs_out.append(
+                            epoch_noproj if self._do_delayed_proj else epoch
                         )
-                    data[n_out] = epoch_out
-                    n_out += 1
+                bad_tuples = self._is_good_epochs(epochs)
+                for idx, epoch_out, bad_tuple in zip(batch, epochs_out, bad_tuples):
+                    if bad_tuple is not None:
+                        assert isinstance(bad_tuple, tuple)
+                        assert all(isinstance(x, str) for x in bad_tuple)
+                        sel = self.selection[idx]
+                        drop_log[sel] = drop_log[sel] + bad_tuple
+                        continue
+                    good_idx.append(idx)
+
+                    # store the epoch if there is a reason to (output or update)
+                    if out or self.preload:
+                        # faster to pre-allocate, then trim as necessary
+                        if n_out == 0 and not self.preload:
+                            data = np.empty(
+                                (n_events, epoch_out.shape[0], epoch_out.shape[1]),
+                                dtype=epoch_out.dtype,
+                                order="C",
+                            )
+                        # preloaded epochs are compacted inplace
+                        if not (self.preload and n_out == idx):
+                            data[n_out] = epoch_out
+                        n_out += 1
             self.drop_log = tuple(drop_log)
             del drop_log
 
@@ -3333,6 +3376,20 @@ class Epochs(BaseEpochs):
             If array, it's the data in the desired range (good segment)
             If None, it means no data is available.
         """
+        start, stop, reject_start, reject_stop = self._get_epoch_windows(idx)
+        if start < 0:
+            return None
+        if self.reject_by_annotation:
+            (description,) = self._raw._bad_segment_descriptions(
+                [reject_start], [reject_stop]
+            )
+            if description is not None:
+                return description
+        logger.debug("    Getting epoch for %d-%d" % (start, stop))
+        return self._raw._getitem((self.picks, slice(start, stop)), return_times=False)
+
+    def _get_epoch_windows(self, idx):
+        """Get the data and rejection windows of epochs in raw samples."""
         if self._raw is None:
             # This should never happen, as raw=None only if preload=True
             raise ValueError(
@@ -3344,7 +3401,7 @@ class Epochs(BaseEpochs):
         event_samp = self.events[idx, 0]
         # Read a data segment from "start" to "stop" in samples
         first_samp = self._raw.first_samp
-        start = int(round(event_samp + self._raw_times[0] * sfreq))
+        start = np.round(event_samp + self._raw_times[0] * sfreq).astype(np.int64)
         start -= first_samp
         stop = start + len(self._raw_times)
 
@@ -3353,7 +3410,7 @@ class Epochs(BaseEpochs):
         reject_tmin = self.reject_tmin
         if reject_tmin is None:
             reject_tmin = self._raw_times[0]
-        reject_start = int(round(event_samp + reject_tmin * sfreq))
+        reject_start = np.round(event_samp + reject_tmin * sfreq).astype(np.int64)
         reject_start -= first_samp
 
         reject_tmax = self.reject_tmax
@@ -3361,17 +3418,59 @@ class Epochs(BaseEpochs):
             reject_tmax = self._raw_times[-1]
         diff = int(round((self._raw_times[-1] - reject_tmax) * sfreq))
         reject_stop = stop - diff
-
-        logger.debug("    Getting epoch for %d-%d" % (start, stop))
-        data = self._raw._check_bad_segment(
-            start,
-            stop,
-            self.picks,
-            reject_start,
-            reject_stop,
-            self.reject_by_annotation,
-        )
-        return data
+        return start, stop, reject_start, reject_stop
+
+    def _iter_epochs_from_raw(self, idx):
+        """Load epochs from disk, coalescing nearby epochs into single reads."""
+        idx = np.asarray(idx, int)
+        start, stop, reject_start, reject_stop = self._get_epoch_windows(idx)
+        raw = self._raw
+        if self.reject_by_annotation:
+            bad = raw._bad_segment_descriptions(reject_start, reject_stop)
+        else:
+            bad = [None] * len(idx)
+        read = (start >= 0) & np.array([b is None for b in bad], bool)
+        # Epochs overlapping or less than an epoch apart are read together,
+        # up to ~50 MB at a time (preloaded data are sliced directly)
+        n_times = len(self._raw_times)
+        n_gap = n_times
+        n_max = max(int(50e6 // (8 * len(self.picks))), n_times)
+        if raw.preload:
+            n_max = 0
+        ii = 0
+        while ii < len(idx):
+            if not read[ii]:
+                yield None if start[ii] < 0 else bad[ii]
+                ii += 1
+                continue
+            read_start, read_stop = start[ii], stop[ii]
+            end = ii + 1
+            while end < len(idx):
+                if read[end]:
+                    if (
+                        start[end] > read_stop + n_gap
+                        or stop[end] < read_start - n_gap
+                        or max(read_stop, stop[end]) - min(read_start, start[end])
+                        > n_max
+                    ):
+                        break
+                    read_start = min(read_start, start[end])
+                    read_stop = max(read_stop, stop[end])
+                end += 1
+            logger.debug(
+                f"    Getting {read[ii:end].sum()} epochs for {read_start}-{read_stop}"
+            )
+            data = raw._getitem(
+                (self.picks, slice(read_start, read_stop)), return_times=False
+            )
+            for jj in range(ii, end):
+                if not read[jj]:
+                    yield None if start[jj] < 0 else bad[jj]
+                    continue
+                epoch = data[:, start[jj] - read_start : stop[jj] - read_start]
+                # epochs are modified inplace, so they cannot share memory
+                yield epoch.copy() if end - ii > 1 else epoch
+            ii = end
 
 
 @fill_doc
@@ -3670,42 +3769,76 @@ def _is_good(
     If full_report=True, it will give True/False as well as a list of all
     offending channels.
     """
-    bad_tuple = tuple()
-    has_printed = False
-    checkable = np.ones(len(ch_names), dtype=bool)
-    checkable[np.array([c in ignore_chs for c in ch_names], dtype=bool)] = False
-    for refl, f, t in zip([reject, flat], [np.greater, np.less], ["", "flat"]):
-        if refl is not None:
-            for key, thresh in refl.items():
-                idx = channel_type_idx[key]
-                name = key.upper()
-                if len(idx) > 0:
-                    e_idx = e[idx]
-                    deltas = np.max(e_idx, axis=1) - np.min(e_idx, axis=1)
-                    checkable_idx = checkable[idx]
-                    idx_deltas = np.where(
-                        np.logical_and(f(deltas, thresh), checkable_idx)
-                    )[0]
-
-                    if len(idx_deltas) > 0:
-                        bad_names = [ch_names[idx[i]] for i in idx_deltas]
-                        if not has_printed:
-                            logger.info(
-                                f"    Rejecting {t} epoch based on {name} : {bad_names}"
-                            )
-                            has_printed = True
-                        if not full_report:
-                            return False
-                        else:
-                            bad_tuple += tuple(bad_names)
-
+    (bad_tuple,) = _get_bad_tuples(
+        e[np.newaxis], ch_names, channel_type_idx, reject, flat, ignore_chs
+    )
     if not full_report:
-        return True
+        return bad_tuple is None
     else:
-        if bad_tuple == ():
-            return True, None
-        else:
-            return False, bad_tuple
+        return bad_tuple is None, bad_tuple
+
+
+def _get_bad_tuples(data, ch_names, channel_type_idx, reject, flat, ignore_chs=()):
+    """Test which data segments are good according to reject and flat.
+
+    Parameters
+    ----------
+    data : array, shape (n_segments, n_channels, n_times)
+        The data segments.
+    ch_names : list of str
+        The channel names.
+    channel_type_idx : dict
+        The channel indices of each channel type.
+    reject, flat : dict | None
+        The peak-to-peak thresholds of each channel type.
+    ignore_chs : list of str
+        Channels that are never checked.
+
+    Returns
+    -------
+    bad_tuples : list of tuple | None
+        The offending channels of each segment, None if it is good.
+    """
+    checkable = np.array([c not in ignore_chs for c in ch_names], dtype=bool)
+    ch_names = np.array(ch_names, object)
+    # peak-to-peak amplitudes of all channels that are checked, in one pass
+    used = [
+        channel_type_idx[key]
+        for refl in (reject, flat)
+        if refl is not None
+        for key in refl
+    ]
+    used = np.unique(np.concatenate([[]] + used).astype(int))
+    if len(used) == data.shape[1]:
+        used_data = data
+    else:
+        used_data = data[:, used]
+    used_ptps = np.max(used_data, axis=-1) - np.min(used_data, axis=-1)
+    ptps = np.zeros(data.shape[:2], used_ptps.dtype)
+    ptps[:, used] = used_ptps
+    bads, groups, first = list(), list(), dict()
+    for refl, f, t in zip([reject, flat], [np.greater, np.less], ["", "flat"]):
+        if refl is None:
+            continue
+        for key, thresh in refl.items():
+            idx = channel_type_idx[key]
+            if len(idx) == 0:
+                continue
+            deltas = ptps[:, idx]
+            bads.append(np.logical_and(f(deltas, thresh), checkable[idx]))
+            groups.append((t, key.upper(), ch_names[idx]))
+            # the log only mentions the first offending channel type
+            for ii in np.flatnonzero(bads[-1].any(axis=1)):
+                first.setdefault(ii, len(groups) - 1)
+    bad_tuples = [None] * len(data)
+    for ii in sorted(first):
+        t, name, names = groups[first[ii]]
+        bad_names = list(names[bads[first[ii]][ii]])
+        logger.info(f"    Rejecting {t} epoch based on {name} : {bad_names}")
+        bad_tuples[ii] = tuple(
+            ch_name for bad, group in zip(bads, groups) for ch_name in group[2][bad[ii]]
+        )
+    return bad_tuples
 
 
 def _read_one_epoch_file(f, tree, preload):
@@ -3925,10 +4058,53 @@ class _RawContainer:
         self.cals = cals
         self.proj = False
         self.fmt = fmt
+        # offset index: sorted event samples -> epoch index within the tag
+        self._order = np.argsort(event_samps, kind="stable")
+        self._sorted_samps = event_samps[self._order]
+        self._epoch_size = int(np.prod(epoch_shape)) * np.dtype(fmt).itemsize
 
     def __del__(self):  # noqa: D105
         self.fid.close()
 
+    def _find(self, event_samps):
+        """Get the indices of epochs in this file (-1 if not present)."""
+        pos = np.searchsorted(self._sorted_samps, event_samps)
+        pos = np.minimum(pos, len(self._sorted_samps) - 1)
+        found = self._sorted_samps[pos] == event_samps
+        return np.where(found, self._order[pos], -1)
+
+    def _read(self, idx):
+        """Read epochs from disk, coalescing contiguous reads."""
+        # the following is equivalent to this, but faster:
+        #
+        # >>> data = read_tag(raw.fid, raw.data_tag.pos).data.astype(float)
+        # >>> data *= raw.cals[np.newaxis, :, :]
+        # >>> data = data[idx]
+        use_idx, inverse = np.unique(idx, return_inverse=True)
+        buf = np.empty((len(use_idx),) + tuple(self.epoch_shape), self.fmt)
+        # split into runs of consecutive epochs, each one read at once
+        breaks = np.where(np.diff(use_idx) != 1)[0] + 1
+        starts = np.concatenate([[0], breaks])
+        stops = np.concatenate([breaks, [len(use_idx)]])
+        for start, stop in zip(starts, stops):
+            offset = use_idx[start] * self._epoch_size + 16  # 16 = Tag header
+            self.fid.seek(self.data_tag.pos + offset, 0)
+            view = buf[start:stop].reshape(-1).view(np.uint8)
+            n_read = self.fid.readinto(view)
+            if n_read != view.size:
+                raise RuntimeError(
+                    f"Could only read {n_read}/{view.size} bytes of epochs data, "
+                    "the file may be truncated"
+                )
+        if self.fmt in (">c8", ">c16"):
+            data = buf.astype(np.complex128)
+        else:
+            data = buf.astype(np.float64)
+        data *= self.cals
+        if len(use_idx) != len(idx) or (use_idx != idx).any():
+            data = data[inverse.reshape(-1)]
+        return data
+
 
 @fill_doc
 class EpochsFIF(BaseEpochs):
@@ -4111,48 +4287,40 @@ class EpochsFIF(BaseEpochs):
     @verbose
     def _get_epoch_from_raw(self, idx, verbose=None):
         """Load one epoch from disk."""
-        # Find the right file and offset to use
-        event_samp = self.events[idx, 0]
+        return self._get_epochs_from_raw([idx])[0]
+
+    def _get_epochs_from_raw(self, idx):
+        """Load multiple epochs from disk."""
+        event_samps = self.events[idx, 0]
+        data = None
+        found = np.zeros(len(event_samps), bool)
         for raw in self._raw:
-            idx = np.where(raw.event_samps == event_samp)[0]
-            if len(idx) == 1:
-                fmt = raw.fmt
-                idx = idx[0]
-                size = np.prod(raw.epoch_shape) * np.dtype(fmt).itemsize
-                offset = idx * size + 16  # 16 = Tag header
-                break
-        else:
-            # read the correct subset of the data
+            raw_idx = raw._find(event_samps)
+            mask = raw_idx >= 0
+            if not mask.any():
+                continue
+            this_data = raw._read(raw_idx[mask])
+            if data is None:
+                data = np.empty(
+                    (len(event_samps),) + this_data.shape[1:], this_data.dtype
+                )
+            data[mask] = this_data
+            found |= mask
+        if not found.all():
             raise RuntimeError(
                 "Correct epoch could not be found, please "
                 "contact mne-python developers"
             )
-        # the following is equivalent to this, but faster:
-        #
-        # >>> data = read_tag(raw.fid, raw.data_tag.pos).data.astype(float)
-        # >>> data *= raw.cals[np.newaxis, :, :]
-        # >>> data = data[idx]
-        #
-        # Eventually this could be refactored in io/tag.py if other functions
-        # could make use of it
-        raw.fid.seek(raw.data_tag.pos + offset, 0)
-        if fmt == ">c8":
-            read_fmt = ">f4"
-        elif fmt == ">c16":
-            read_fmt = ">f8"
-        else:
-            read_fmt = fmt
-        data = np.frombuffer(raw.fid.read(size), read_fmt)
-        if read_fmt != fmt:
-            data = data.view(fmt)
-            data = data.astype(np.complex128)
-        else:
-            data = data.astype(np.float64)
-
-        data.shape = raw.epoch_shape
-        data *= raw.cals
         return data
 
+    def _iter_epochs_from_raw(self, idx):
+        """Load epochs from disk in batches."""
+        raw = self._raw[0]
+        # read ~50 MB at a time
+        n_batch = max(int(50e6 // (raw._epoch_size * 2)), 1)
+        for start in range(0, len(idx), n_batch):
+            yield from self._get_epochs_from_raw(idx[start : start + n_batch])
+
 
 @fill_doc
 def bootstrap(epochs, random_state=None):
@@ -379,49 +379,102 @@ def write_events(filename, events, *, overwrite=False, verbose=None):
                 f.write("%6d %6d %3d\n" % tuple(e))
 
 
-def _find_stim_steps(data, first_samp, pad_start=None, pad_stop=None, merge=0):
-    changed = np.diff(data, axis=1) != 0
-    idx = np.where(np.all(changed, axis=0))[0]
-    if len(idx) == 0:
-        return np.empty((0, 3), dtype="int32")
+# Number of samples of the stim channel(s) read at once when finding events
+_STIM_CHUNK_SAMPLES = 100_000
 
-    pre_step = data[0, idx]
-    idx += 1
-    post_step = data[0, idx]
-    idx += first_samp
-    steps = np.c_[idx, pre_step, post_step]
-
-    if pad_start is not None:
-        v = steps[0, 1]
-        if v != pad_start:
-            steps = np.insert(steps, 0, [0, pad_start, v], axis=0)
-
-    if pad_stop is not None:
-        v = steps[-1, 2]
-        if v != pad_stop:
-            last_idx = len(data[0]) + first_samp
-            steps = np.append(steps, [[last_idx, v, pad_stop]], axis=0)
-
-    if merge != 0:
-        diff = np.diff(steps[:, 0])
-        idx = diff <= abs(merge)
-        if np.any(idx):
-            where = np.where(idx)[0]
-            keep = np.logical_not(idx)
-            if merge > 0:
-                # drop the earlier event
-                steps[where + 1, 1] = steps[where, 1]
-                keep = np.append(keep, True)
-            else:
-                # drop the later event
-                steps[where, 2] = steps[where + 1, 2]
-                keep = np.insert(keep, 0, True)
 
-            is_step = steps[:, 1] != steps[:, 2]
-            keep = np.logical_and(keep, is_step)
-            steps = steps[keep]
+class _StimSteps:
+    """Find the steps of stim channel data fed in consecutive chunks.
+
+    The last sample of each chunk is carried over to the next one so that
+    steps across chunk boundaries are found, and only the (few) steps are
+    accumulated, so the data can be streamed from disk.
+    """
 
-    return steps
+    def __init__(self, first_samp, uint_cast=False):
+        self.first_samp = first_samp
+        self.uint_cast = uint_cast
+        self.n_samples = 0
+        self.initial_value = None
+        self.negative = False
+        self._last = None
+        self._steps = list()
+
+    def feed(self, data):
+        """Add the next chunk of data, shape (n_channels, n_samples)."""
+        if data.shape[1] == 0:
+            return
+        data = data.astype(np.int64)
+        if self.uint_cast:
+            data = data.astype(np.uint16).astype(np.int64)
+        if data.min() < 0:
+            self.negative = True
+            data = np.abs(data)  # make sure trig channel is positive
+        if self._last is None:
+            self.initial_value = data[0, 0]
+            offset = 1
+        else:
+            data = np.concatenate([self._last, data], axis=1)
+            offset = 0
+        changed = np.diff(data, axis=1) != 0
+        idx = np.where(np.all(changed, axis=0))[0]
+        if len(idx):
+            self._steps.append(
+                np.c_[
+                    idx + (self.first_samp + self.n_samples + offset),
+                    data[0, idx],
+                    data[0, idx + 1],
+                ]
+            )
+        self.n_samples += data.shape[1] - 1 + offset
+        self._last = data[:, -1:]
+
+    def get_steps(self, pad_start=None, pad_stop=None, merge=0):
+        """Get the steps found in all data fed so far."""
+        if len(self._steps) == 0:
+            return np.empty((0, 3), dtype="int32")
+        steps = np.concatenate(self._steps, axis=0)
+
+        if pad_start is not None:
+            v = steps[0, 1]
+            if v != pad_start:
+                steps = np.insert(steps, 0, [0, pad_start, v], axis=0)
+
+        if pad_stop is not None:
+            v = steps[-1, 2]
+            if v != pad_stop:
+                last_idx = self.n_samples + self.first_samp
+                steps = np.append(steps, [[last_idx, v, pad_stop]], axis=0)
+
+        if merge != 0:
+            diff = np.diff(steps[:, 0])
+            idx = diff <= abs(merge)
+            if np.any(idx):
+                where = np.where(idx)[0]
+                keep = np.logical_not(idx)
+                if merge > 0:
+                    # drop the earlier event
+                    steps[where + 1, 1] = steps[where, 1]
+                    keep = np.append(keep, True)
+                else:
+                    # drop the later event
+                    steps[where, 2] = steps[where + 1, 2]
+                    keep = np.insert(keep, 0, True)
+
+                is_step = steps[:, 1] != steps[:, 2]
+                keep = np.logical_and(keep, is_step)
+                steps = steps[keep]
+
+        return steps
+
+
+def _iter_stim_data(raw, picks):
+    """Read the data of the given (stim) channels in chunks."""
+    # use whole buffers, which are the smallest unit read from FIF files
+    n_buffer = max(raw._get_buffer_size(), 1)
+    n_chunk = n_buffer * max(_STIM_CHUNK_SAMPLES // n_buffer, 1)
+    for start in range(0, raw.n_times, n_chunk):
+        yield raw._getitem((picks, slice(start, start + n_chunk)), return_times=False)
 
 
 def find_stim_steps(raw, pad_start=None, pad_stop=None, merge=0, stim_channel=None):
@@ -467,35 +520,26 @@ def find_stim_steps(raw, pad_start=None, pad_stop=None, merge=0, stim_channel=No
     picks = pick_channels(raw.info["ch_names"], include=stim_channel, ordered=False)
     if len(picks) == 0:
         raise ValueError("No stim channel found to extract event triggers.")
-    data, _ = raw[picks, :]
-    if np.any(data < 0):
+    stim_steps = _StimSteps(raw.first_samp)
+    for data in _iter_stim_data(raw, picks):
+        stim_steps.feed(data)
+    if stim_steps.negative:
         warn("Trigger channel contains negative values, using absolute value.")
-        data = np.abs(data)  # make sure trig channel is positive
-    data = data.astype(np.int64)
-
-    return _find_stim_steps(
-        data, raw.first_samp, pad_start=pad_start, pad_stop=pad_stop, merge=merge
-    )
+    return stim_steps.get_steps(pad_start=pad_start, pad_stop=pad_stop, merge=merge)
 
 
-@verbose
-def _find_events(
-    data,
-    first_samp,
+def _events_from_steps(
+    stim_steps,
     *,
-    verbose=None,
     output="onset",
     consecutive="increasing",
     min_samples=0,
     mask=None,
-    uint_cast=False,
     mask_type="and",
     initial_event=False,
     ch_name=None,
 ):
-    """Help find events."""
-    assert data.shape[0] == 1  # data should be only a row vector
-
+    """Find events from the steps of a single stim channel."""
     if min_samples > 0:
         merge = int(min_samples // 1)
         if merge == min_samples:
@@ -503,21 +547,18 @@ def _find_events(
     else:
         merge = 0
 
-    data = data.astype(np.int64)
-    if uint_cast:
-        data = data.astype(np.uint16).astype(np.int64)
-    if data.min() < 0:
+    if stim_steps.negative:
         warn(
             "Trigger channel contains negative values, using absolute "
             "value. If data were acquired on a Neuromag system with "
             "STI016 active, consider using uint_cast=True to work around "
             "an acquisition bug"
         )
-        data = np.abs(data)  # make sure trig channel is positive
 
-    events = _find_stim_steps(data, first_samp, pad_stop=0, merge=merge)
-    initial_value = data[0, 0]
-    if initial_value != 0:
+    first_samp = stim_steps.first_samp
+    events = stim_steps.get_steps(pad_stop=0, merge=merge)
+    initial_value = stim_steps.initial_value
+    if initial_value is not None and initial_value != 0:
         if initial_event:
             events = np.insert(events, 0, [first_samp, 0, initial_value], axis=0)
         else:
@@ -771,19 +812,20 @@ def find_events(
     picks = pick_channels(raw.info["ch_names"], include=stim_channel)
     if len(picks) == 0:
         raise ValueError("No stim channel found to extract event triggers.")
-    data, _ = raw[picks, :]
+    # the stim channels are read in chunks, so only the steps are kept in memory
+    stim_steps = [_StimSteps(raw.first_samp, uint_cast=uint_cast) for _ in picks]
+    for data in _iter_stim_data(raw, picks):
+        for this_steps, d in zip(stim_steps, data):
+            this_steps.feed(d[np.newaxis, :])
 
     events_list = []
-    for d, ch_name in zip(data, stim_channel):
-        events = _find_events(
-            d[np.newaxis, :],
-            raw.first_samp,
-            verbose=verbose,
+    for this_steps, ch_name in zip(stim_steps, stim_channel):
+        events = _events_from_steps(
+            this_steps,
             output=output,
             consecutive=consecutive,
             min_samples=min_samples,
             mask=mask,
-            uint_cast=uint_cast,
             mask_type=mask_type,
             initial_event=initial_event,
             ch_name=ch_name,
@@ -4,6 +4,7 @@
 # Copyright the MNE-Python contributors.
 
 import datetime as dt
+import math
 
 import numpy as np
 
@@ -28,9 +29,6 @@ def _export_raw(fname, raw, physical_range, add_ch_type):
     digital_min = -32767
     digital_max = 32767
 
-    # load data first
-    raw.load_data()
-
     # remove extra STI channels
     orig_ch_types = raw.get_channel_types()
     drop_chs = []
@@ -64,14 +62,33 @@ def _export_raw(fname, raw, physical_range, add_ch_type):
     ch_names = [ch for ch in raw.ch_names if ch not in drop_chs]
     ch_types = np.array(raw.get_channel_types(picks=ch_names))
     n_times = raw.n_times
+    signal_labels = []
+    for ch, ch_type in zip(ch_names, ch_types):
+        signal_label = f"{ch_type.upper()} {ch}" if add_ch_type else ch
+        if len(signal_label) > 16:
+            raise RuntimeError(
+                f"Signal label for {ch} ({ch_type}) is "
+                f"longer than 16 characters, which is not "
+                f"supported in EDF. Please shorten the "
+                f"channel name before exporting to EDF."
+            )
+        signal_labels.append(signal_label)
 
-    # get the entire dataset in uV
-    data = raw.get_data(units=units, picks=ch_names)
+    # The data are read (in uV) one buffer at a time and stored as digital
+    # values, so that the full recording is never held in memory as floats
+    buffer_size = raw._get_buffer_size()
+
+    def _iter_data():
+        for start in range(0, n_times, buffer_size):
+            stop = min(start + buffer_size, n_times)
+            data = raw.get_data(units=units, picks=ch_names, start=start, stop=stop)
+            yield start, stop, data
 
     # Sampling frequency in EDF only supports integers, so to allow for
     # float sampling rates from Raw, we adjust the output sampling rate
     # for all channels and the data record duration.
     sfreq = raw.info["sfreq"]
+    pad_width = 0
     if float(sfreq).is_integer():
         out_sfreq = int(sfreq)
         data_record_duration = None
@@ -83,7 +100,6 @@ def _export_raw(fname, raw, physical_range, add_ch_type):
                 "zeros were appended to all channels when writing the "
                 "final block."
             )
-            data = np.pad(data, (0, int(pad_width)))
     else:
         data_record_duration = round_float_to_8_characters(
             np.floor(sfreq) / sfreq, round
@@ -101,15 +117,19 @@ def _export_raw(fname, raw, physical_range, add_ch_type):
     filter_str_info = f"HP:{highpass}Hz LP:{lowpass}Hz N:{linefreq}Hz"
 
     if physical_range == "auto":
-        # get max and min for each channel type data
+        # get max and min for each channel type data in a first pass
+        ch_max = np.full(len(ch_names), -np.inf)
+        ch_min = np.full(len(ch_names), np.inf)
+        for _, _, data in _iter_data():
+            np.maximum(ch_max, data.max(axis=1), out=ch_max)
+            np.minimum(ch_min, data.min(axis=1), out=ch_min)
         ch_types_phys_max = dict()
         ch_types_phys_min = dict()
-
         for _type in np.unique(ch_types):
-            _picks = [n for n, t in zip(ch_names, ch_types) if t == _type]
-            _data = raw.get_data(units=units, picks=_picks)
-            ch_types_phys_max[_type] = _data.max()
-            ch_types_phys_min[_type] = _data.min()
+            ch_types_phys_max[_type] = ch_max[ch_types == _type].max()
+            ch_types_phys_min[_type] = ch_min[ch_types == _type].min()
+        pmins = [ch_types_phys_min[_type] for _type in ch_types]
+        pmaxs = [ch_types_phys_max[_type] for _type in ch_types]
     else:
         # get the physical min and max of the data in uV
         # Physical ranges of the data in uV is usually set by the manufacturer
@@ -120,48 +140,62 @@ def _export_raw(fname, raw, physical_range, add_ch_type):
         # levels of their input amplifiers & ADC).
         # For full discussion, see: https://github.com/sccn/eeglab/issues/246
         pmin, pmax = physical_range[0], physical_range[1]
+        pmins = [pmin] * len(ch_names)
+        pmaxs = [pmax] * len(ch_names)
 
+    # convert to digital values the same way as edfio does, using the physical
+    # ranges as they will be stored in the header
+    header_pmins = [round_float_to_8_characters(p, math.floor) for p in pmins]
+    header_pmaxs = [round_float_to_8_characters(p, math.ceil) for p in pmaxs]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gains = np.subtract(header_pmaxs, header_pmins) / (digital_max - digital_min)
+        offsets = header_pmaxs / gains - digital_max
+    digital = np.empty((len(ch_names), n_times + pad_width), np.int16)
+    data_max, data_min = -np.inf, np.inf
+    for start, stop, data in _iter_data():
+        if physical_range != "auto":
+            data_max = max(data_max, data.max())
+            data_min = min(data_min, data.min())
+            data = np.clip(data, pmin, pmax)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            digital[:, start:stop] = np.round(
+                data / gains[:, np.newaxis] - offsets[:, np.newaxis]
+            )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pad_values = np.clip(np.round(-offsets), digital_min, digital_max)
+    digital[:, n_times:] = pad_values[:, np.newaxis]
+    if physical_range != "auto":
         # check that physical min and max is not exceeded
-        if data.max() > pmax:
+        if data_max > pmax:
             warn(
-                f"The maximum μV of the data {data.max()} is "
+                f"The maximum μV of the data {data_max} is "
                 f"more than the physical max passed in {pmax}.",
             )
-        if data.min() < pmin:
+        if data_min < pmin:
             warn(
-                f"The minimum μV of the data {data.min()} is "
+                f"The minimum μV of the data {data_min} is "
                 f"less than the physical min passed in {pmin}.",
             )
-        data = np.clip(data, pmin, pmax)
-    signals = []
-    for idx, ch in enumerate(ch_names):
-        ch_type = ch_types[idx]
-        signal_label = f"{ch_type.upper()} {ch}" if add_ch_type else ch
-        if len(signal_label) > 16:
-            raise RuntimeError(
-                f"Signal label for {ch} ({ch_type}) is "
-                f"longer than 16 characters, which is not "
-                f"supported in EDF. Please shorten the "
-                f"channel name before exporting to EDF."
-            )
-
-        if physical_range == "auto":
-            # take the channel type minimum and maximum
-            pmin = ch_types_phys_min[ch_type]
-            pmax = ch_types_phys_max[ch_type]
 
+    signals = []
+    for idx, signal_label in enumerate(signal_labels):
+        # reconstruct the physical values, which edfio converts back to the
+        # same digital values
+        data = (digital[idx] + offsets[idx]) * gains[idx]
+        np.clip(data, pmins[idx], pmaxs[idx], out=data)
         signals.append(
             EdfSignal(
-                data[idx],
+                data,
                 out_sfreq,
                 label=signal_label,
                 transducer_type="",
                 physical_dimension="uV",
-                physical_range=(pmin, pmax),
+                physical_range=(pmins[idx], pmaxs[idx]),
                 digital_range=(digital_min, digital_max),
                 prefiltering=filter_str_info,
             )
         )
+    del digital
 
     # set patient info
     subj_info = raw.info.get("subject_info")
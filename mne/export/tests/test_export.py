@@ -190,6 +190,28 @@ def test_double_export_edf(tmp_path):
     assert_array_equal(orig_ch_types, read_ch_types)
 
 
+@edfio_mark()
+@pytest.mark.parametrize("physical_range", ["auto", (-100, 100)])
+def test_export_edf_not_preloaded(tmp_path, physical_range):
+    """Test exporting data that are not preloaded to EDF."""
+    raw = _create_raw_for_edf_tests()
+    raw.crop(0, 1.4925)  # not an integer number of seconds, will be padded
+    raw._data -= 5e-6  # make sure zero (used for padding) is in range
+    raw.save(tmp_path / "test_raw.fif", buffer_size_sec=0.3)
+    raw_lazy = read_raw_fif(tmp_path / "test_raw.fif")
+    fname, fname_lazy = tmp_path / "test.edf", tmp_path / "test_lazy.edf"
+    with pytest.warns(RuntimeWarning, match="EDF format requires"):
+        raw_lazy.copy().load_data().export(fname, physical_range=physical_range)
+    with pytest.warns(RuntimeWarning, match="EDF format requires"):
+        raw_lazy.export(fname_lazy, physical_range=physical_range)
+    assert not raw_lazy.preload
+    assert fname.read_bytes() == fname_lazy.read_bytes()
+    raw_read = read_raw_edf(fname_lazy, preload=True)
+    data_read = raw_read.get_data()
+    assert_allclose(data_read[:, : raw.n_times], raw_lazy.get_data(), atol=2e-9)
+    assert_allclose(data_read[:, raw.n_times :], 0, atol=2e-9)
+
+
 @edfio_mark()
 def test_export_edf_annotations(tmp_path):
     """Test that exporting EDF preserves annotations."""
@@ -2,10 +2,12 @@
 # Copyright the MNE-Python contributors.
 """IIR and FIR filtering and resampling functions."""
 
-from collections import Counter
+import os.path as op
+from collections import Counter, OrderedDict
 from copy import deepcopy
 from functools import partial
 from math import gcd
+from threading import Lock
 
 import numpy as np
 from scipy import fft, signal
@@ -25,8 +27,11 @@ from .utils import (
     _check_option,
     _check_preload,
     _ensure_int,
+    _get_cache_fname,
     _pl,
     _validate_type,
+    _write_cache_file,
+    get_config,
     logger,
     sum_squared,
     verbose,
@@ -297,6 +302,37 @@ def next_fast_len(target):
     return match
 
 
+def _get_overlap_add_n_fft(n_h, n_x, n_fft):
+    """Determine the FFT length to use for overlap-add filtering."""
+    min_fft = 2 * n_h - 1
+    if n_fft is None:
+        max_fft = n_x
+        if max_fft >= min_fft:
+            # cost function based on number of multiplications
+            N = 2 ** np.arange(
+                np.ceil(np.log2(min_fft)), np.ceil(np.log2(max_fft)) + 1, dtype=int
+            )
+            cost = (
+                np.ceil(n_x / (N - n_h + 1).astype(np.float64)) * N * (np.log2(N) + 1)
+            )
+
+            # add a heuristic term to prevent too-long FFT's which are slow
+            # (not predicted by mult. cost alone, 4e-5 exp. determined)
+            cost += 4e-5 * N * n_x
+
+            n_fft = N[np.argmin(cost)]
+        else:
+            # Use only a single block
+            n_fft = next_fast_len(min_fft)
+    logger.debug("FFT block length:   %s" % n_fft)
+    if n_fft < min_fft:
+        raise ValueError(
+            f"n_fft is too short, has to be at least 2 * len(h) - 1 ({min_fft}), got "
+            f"{n_fft}"
+        )
+    return n_fft
+
+
 def _overlap_add_filter(
     x,
     h,
@@ -354,46 +390,18 @@ def _overlap_add_filter(
     if phase == "zero-double":
         h = np.convolve(h, h[::-1])
 
-    # Determine FFT length to use
-    min_fft = 2 * len(h) - 1
-    if n_fft is None:
-        max_fft = n_x
-        if max_fft >= min_fft:
-            # cost function based on number of multiplications
-            N = 2 ** np.arange(
-                np.ceil(np.log2(min_fft)), np.ceil(np.log2(max_fft)) + 1, dtype=int
-            )
-            cost = (
-                np.ceil(n_x / (N - len(h) + 1).astype(np.float64))
-                * N
-                * (np.log2(N) + 1)
-            )
-
-            # add a heuristic term to prevent too-long FFT's which are slow
-            # (not predicted by mult. cost alone, 4e-5 exp. determined)
-            cost += 4e-5 * N * n_x
-
-            n_fft = N[np.argmin(cost)]
-        else:
-            # Use only a single block
-            n_fft = next_fast_len(min_fft)
-    logger.debug("FFT block length:   %s" % n_fft)
-    if n_fft < min_fft:
-        raise ValueError(
-            f"n_fft is too short, has to be at least 2 * len(h) - 1 ({min_fft}), got "
-            f"{n_fft}"
-        )
+    n_fft = _get_overlap_add_n_fft(len(h), n_x, n_fft)
 
     # Figure out if we should use CUDA
     n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h, n_fft)
 
     # Process each row separately
     picks = _picks_to_idx(len(x), picks)
-    parallel, p_fun, _ = parallel_func(_1d_overlap_filter, n_jobs)
+    parallel, p_fun, n_jobs = parallel_func(_1d_overlap_filter, n_jobs)
     if n_jobs == 1:
         for p in picks:
-            x[p] = _1d_overlap_filter(
-                x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft
+            _1d_overlap_filter(
+                x[p], len(h), n_edge, phase, cuda_dict, pad, n_fft, out=x[p]
             )
     else:
         data_new = parallel(
@@ -406,36 +414,101 @@ def _overlap_add_filter(
     return x
 
 
-def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft):
-    """Do one-dimensional overlap-add FFT FIR filtering."""
-    # pad to reduce ringing
-    x_ext = _smart_pad(x, (n_edge, n_edge), pad)
-    n_x = len(x_ext)
-    x_filtered = np.zeros_like(x_ext)
+def _overlap_add_filter_bank(x, hs, phase, picks, n_jobs, pad, out):
+    """Filter the rows ``x[picks]`` with each FIR filter in ``hs``.
+
+    The forward FFT of each block is computed once and shared by all filters.
+    ``out`` has shape ``(len(hs), len(picks), n_times)``.
+    """
+    n_times = x.shape[1]
+    for h in hs:
+        _check_zero_phase_length(len(h), phase)
+    n_edge = max(max(min(len(h), n_times) for h in hs) - 1, 0)
+    if phase == "zero-double":
+        hs = [np.convolve(h, h[::-1]) for h in hs]
+    # zero-pad the filters to a common length without changing their delays
+    # (centered for zero-phase filters, at the end for causal ones)
+    n_h = max(len(h) for h in hs)
+    h_all = np.zeros((len(hs), n_h))
+    for hi, h in enumerate(hs):
+        start = (n_h - len(h)) // 2 if phase.startswith("zero") else 0
+        h_all[hi, start : start + len(h)] = h
+    n_fft = _get_overlap_add_n_fft(n_h, n_times + 2 * n_edge, None)
+    n_jobs, cuda_dict = _setup_cuda_fft_multiply_repeated(n_jobs, h_all, n_fft)
+    parallel, p_fun, n_jobs = parallel_func(_1d_overlap_filter, n_jobs)
+    if n_jobs == 1:
+        for pi, p in enumerate(picks):
+            _1d_overlap_filter(
+                x[p], n_h, n_edge, phase, cuda_dict, pad, n_fft, out=out[:, pi]
+            )
+    else:
+        data_new = parallel(
+            p_fun(x[p], n_h, n_edge, phase, cuda_dict, pad, n_fft) for p in picks
+        )
+        for pi, data in enumerate(data_new):
+            out[:, pi] = data
+    return out
+
+
+# padding modes that only depend on the samples next to each edge
+_LOCAL_PADS = ("reflect_limited", "reflect", "symmetric", "edge", "constant")
+
+
+def _1d_overlap_filter(x, n_h, n_edge, phase, cuda_dict, pad, n_fft, out=None):
+    """Do one-dimensional overlap-add FFT FIR filtering.
+
+    The padded signal is never materialized: segments are assembled on the fly
+    and each output block is written as soon as it is final, so only
+    ``O(n_fft)`` temporary memory is used and ``out`` may be ``x`` itself
+    (e.g., a row of a memory-mapped array).
+    """
+    n_x = len(x)
+    if out is None:
+        out = np.empty(cuda_dict["h_fft"].shape[:-1] + x.shape, x.dtype)
+    # pad to reduce ringing (only the edges are needed)
+    left = right = x[:0]
+    if n_edge > 0:
+        if pad in _LOCAL_PADS:
+            left = _smart_pad(x[: n_edge + 1], (n_edge, 0), pad)[:n_edge]
+            right = _smart_pad(x[-n_edge - 1 :], (0, n_edge), pad)[-n_edge:]
+        else:
+            x_ext = _smart_pad(x, (n_edge, n_edge), pad)
+            left, right = x_ext[:n_edge].copy(), x_ext[-n_edge:].copy()
+            del x_ext
+    n_x_ext = n_x + 2 * n_edge
 
     n_seg = n_fft - n_h + 1
-    n_segments = int(np.ceil(n_x / float(n_seg)))
+    n_segments = int(np.ceil(n_x_ext / float(n_seg)))
     shift = ((n_h - 1) // 2 if phase.startswith("zero") else 0) + n_edge
 
     # Now the actual filtering step is identical for zero-phase (filtfilt-like)
-    # or single-pass
+    # or single-pass. "pending" holds the output samples starting at
+    # start - shift that later segments can still contribute to (one row per
+    # filter if cuda_dict["h_fft"] holds several).
+    seg = np.empty(n_fft)
+    pending = np.zeros(out.shape[:-1] + (n_fft + n_seg,))
     for seg_idx in range(n_segments):
         start = seg_idx * n_seg
-        stop = (seg_idx + 1) * n_seg
-        seg = x_ext[start:stop]
-        seg = np.concatenate([seg, np.zeros(n_fft - len(seg))])
+        stop = min((seg_idx + 1) * n_seg, n_x_ext)
+        seg.fill(0.0)
+        for piece, offset in ((left, 0), (x, n_edge), (right, n_edge + n_x)):
+            lo = max(start, offset)
+            hi = min(stop, offset + len(piece))
+            if lo < hi:
+                seg[lo - start : hi - start] = piece[lo - offset : hi - offset]
 
         prod = _fft_multiply_repeated(seg, cuda_dict)
-
-        start_filt = max(0, start - shift)
-        stop_filt = min(start - shift + n_fft, n_x)
-        start_prod = max(0, shift - start)
-        stop_prod = start_prod + stop_filt - start_filt
-        x_filtered[start_filt:stop_filt] += prod[start_prod:stop_prod]
-
-    # Remove mirrored edges that we added and cast (n_edge can be zero)
-    x_filtered = x_filtered[: n_x - 2 * n_edge].astype(x.dtype)
-    return x_filtered
+        pending[..., :n_fft] += prod
+
+        # these output samples will not receive any more contributions
+        start_filt = start - shift
+        n_final = n_seg if seg_idx < n_segments - 1 else n_fft
+        lo = max(0, start_filt)
+        hi = min(start_filt + n_final, n_x)
+        if lo < hi:
+            out[..., lo:hi] = pending[..., lo - start_filt : hi - start_filt]
+        pending[..., :n_fft] = pending[..., n_seg : n_seg + n_fft]
+    return out
 
 
 def _filter_attenuation(h, freq, gain):
@@ -451,7 +524,7 @@ def _filter_attenuation(h, freq, gain):
 
 def _prep_for_filtering(x, copy, picks=None):
     """Set up array as 2D for filtering ease."""
-    x = _check_filterable(x)
+    x = _check_filterable(x, float32=True)
     if copy is True:
         x = x.copy()
     orig_shape = x.shape
@@ -516,6 +589,155 @@ def _firwin_design(N, freq, gain, window, sfreq):
     return h
 
 
+###############################################################################
+# Filter design cache
+
+_FILTER_CACHE_SIZE = 128
+_FILTER_CACHE_VERSION = 1
+
+
+class _FilterCache:
+    """LRU cache of designed filters, optionally backed by files on disk.
+
+    Values are dicts of arrays (or scalars) and copies are returned, so
+    callers can modify them freely.
+    """
+
+    def __init__(self, maxsize=_FILTER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._lock = Lock()  # filters can be designed from several threads
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._cache = OrderedDict()
+            self._cache_dir = None  # read from the config when first needed
+            self.hits = self.misses = self.disk_hits = 0
+
+    def get(self, key, design):
+        """Get the filter for ``key``, calling ``design()`` if needed."""
+        key = (_FILTER_CACHE_VERSION,) + key
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                logger.debug("Using cached filter design")
+                return self._copy(self._cache[key])
+            if self._cache_dir is None:
+                self._cache_dir = get_config("MNE_FILTER_CACHE_DIR", "")
+            cache_dir = self._cache_dir
+        # the files and the design are handled without holding the lock
+        fname = None
+        value = None
+        if cache_dir:
+            fname = _get_cache_fname(cache_dir, repr(key), "filter")
+            value = self._read(fname, key)
+        from_disk = value is not None
+        if from_disk:
+            logger.debug(f"Using filter design cached in {fname}")
+        else:
+            value = design()
+            if fname is not None:
+                self._write(fname, key, value)
+        with self._lock:
+            if from_disk:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+            self._cache[key] = self._copy(value)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return value
+
+    @staticmethod
+    def _copy(value):
+        return {
+            k: v.copy() if isinstance(v, np.ndarray) else v for k, v in value.items()
+        }
+
+    @staticmethod
+    def _read(fname, key):
+        if not op.isfile(fname):
+            return None
+        try:
+            with np.load(fname, allow_pickle=False) as npz:
+                if npz["key"].item() != repr(key):
+                    return None
+                return {
+                    k[6:]: npz[k] if npz[k].ndim else npz[k].item()
+                    for k in npz.files
+                    if k.startswith("value_")
+                }
+        except Exception as exp:
+            logger.debug(f"Could not read filter cache {fname}: {exp}")
+            return None
+
+    @staticmethod
+    def _write(fname, key, value):
+        data = {f"value_{k}": np.asarray(v) for k, v in value.items()}
+        _write_cache_file(fname, dict(key=np.array(repr(key)), **data), "filter cache")
+
+
+_filter_cache = _FilterCache()
+
+
+def _float_key(x):
+    """Convert frequencies to a hashable cache key."""
+    return tuple(float(xx) for xx in np.atleast_1d(x).ravel())
+
+
+def filter_cache_info():
+    """Get statistics of the filter design cache.
+
+    FIR filters and IIR coefficients designed by :func:`create_filter` (and
+    hence by the ``filter`` methods and :func:`filter_data`) are kept in an
+    in-memory least-recently-used cache, so filters with identical parameters
+    are designed only once. If the ``MNE_FILTER_CACHE_DIR`` config variable is
+    set, designed filters are also stored in this directory and reused across
+    sessions. The config variable is read when the cache is first used and
+    again after :func:`clear_filter_cache`.
+
+    Returns
+    -------
+    info : dict
+        The number of cache ``"hits"`` (in memory), ``"disk_hits"`` and
+        ``"misses"`` (filters that had to be designed), the number of cached
+        filters ``"currsize"`` and the maximum number of cached filters
+        ``"maxsize"``.
+
+    See Also
+    --------
+    clear_filter_cache
+
+    Notes
+    -----
+    .. versionadded:: 1.7
+    """
+    return dict(
+        hits=_filter_cache.hits,
+        disk_hits=_filter_cache.disk_hits,
+        misses=_filter_cache.misses,
+        currsize=len(_filter_cache._cache),
+        maxsize=_filter_cache.maxsize,
+    )
+
+
+def clear_filter_cache():
+    """Clear the in-memory filter design cache and reset its statistics.
+
+    Files stored in ``MNE_FILTER_CACHE_DIR`` (if any) are not removed.
+
+    See Also
+    --------
+    filter_cache_info
+
+    Notes
+    -----
+    .. versionadded:: 1.7
+    """
+    _filter_cache.clear()
+
+
 def _construct_fir_filter(
     sfreq, freq, gain, filter_length, phase, fir_window, fir_design
 ):
@@ -556,11 +778,6 @@ def _construct_fir_filter(
         Filter coefficients.
     """
     assert freq[0] == 0
-    if fir_design == "firwin2":
-        fir_design = signal.firwin2
-    else:
-        assert fir_design == "firwin"
-        fir_design = partial(_firwin_design, sfreq=sfreq)
     # issue a warning if attenuation is less than this
     min_att_db = 12 if phase == "minimum" else 20
 
@@ -574,14 +791,35 @@ def _construct_fir_filter(
 
     # Use overlap-add filter with a fixed length
     N = _check_zero_phase_length(filter_length, phase, gain[-1])
-    # construct symmetric (linear phase) filter
-    if phase == "minimum":
-        h = fir_design(N * 2 - 1, freq, gain, window=fir_window)
-        h = signal.minimum_phase(h)
-    else:
-        h = fir_design(N, freq, gain, window=fir_window)
-    assert h.size == N
-    att_db, att_freq = _filter_attenuation(h, freq, gain)
+
+    def design():
+        if fir_design == "firwin2":
+            design_fun = signal.firwin2
+        else:
+            assert fir_design == "firwin"
+            design_fun = partial(_firwin_design, sfreq=sfreq)
+        # construct symmetric (linear phase) filter
+        if phase == "minimum":
+            h = design_fun(N * 2 - 1, freq, gain, window=fir_window)
+            h = signal.minimum_phase(h)
+        else:
+            h = design_fun(N, freq, gain, window=fir_window)
+        assert h.size == N
+        att_db, att_freq = _filter_attenuation(h, freq, gain)
+        return dict(h=h, att_db=att_db, att_freq=att_freq)
+
+    key = (
+        "fir",
+        float(sfreq),
+        _float_key(freq),
+        _float_key(gain),
+        N,
+        phase,
+        repr(fir_window),
+        fir_design,
+    )
+    design = _filter_cache.get(key, design)
+    h, att_db, att_freq = design["h"], design["att_db"], design["att_freq"]
     if phase == "zero-double":
         att_db += 6
     if att_db < min_att_db:
@@ -617,45 +855,102 @@ def _check_coefficients(system):
         )
 
 
+# number of samples filtered at once by _1d_iir_filter
+_IIR_BLOCK = 2**16
+
+
 def _iir_filter(x, iir_params, picks, n_jobs, copy, phase="zero"):
     """Call filtfilt or lfilter."""
     # set up array for filtering, reshape to 2D, operate on last axis
     x, orig_shape, picks = _prep_for_filtering(x, copy, picks)
+    if "sos" in iir_params:
+        _check_coefficients(iir_params["sos"])
+    else:
+        _check_coefficients((iir_params["b"], iir_params["a"]))
+    padlen = None
     if phase in ("zero", "zero-double"):
         padlen = min(iir_params["padlen"], x.shape[-1] - 1)
-        if "sos" in iir_params:
-            fun = partial(
-                signal.sosfiltfilt, sos=iir_params["sos"], padlen=padlen, axis=-1
-            )
-            _check_coefficients(iir_params["sos"])
-        else:
-            fun = partial(
-                signal.filtfilt,
-                b=iir_params["b"],
-                a=iir_params["a"],
-                padlen=padlen,
-                axis=-1,
-            )
-            _check_coefficients((iir_params["b"], iir_params["a"]))
-    else:
-        if "sos" in iir_params:
-            fun = partial(signal.sosfilt, sos=iir_params["sos"], axis=-1)
-            _check_coefficients(iir_params["sos"])
-        else:
-            fun = partial(signal.lfilter, b=iir_params["b"], a=iir_params["a"], axis=-1)
-            _check_coefficients((iir_params["b"], iir_params["a"]))
-    parallel, p_fun, n_jobs = parallel_func(fun, n_jobs)
+    if x.dtype == np.float32:  # filter in single precision
+        iir_params = {
+            key: np.asarray(val, np.float32) if key in ("sos", "b", "a") else val
+            for key, val in iir_params.items()
+        }
+    # the SciPy filtering functions release the GIL, so threads can work
+    # in place on blocks of channels of the same array
+    parallel, p_fun, n_jobs = parallel_func(
+        _iir_filter_picks, n_jobs, prefer="threads", max_jobs=len(picks)
+    )
     if n_jobs == 1:
-        for p in picks:
-            x[p] = fun(x=x[p])
+        _iir_filter_picks(x, picks, iir_params, padlen)
     else:
-        data_new = parallel(p_fun(x=x[p]) for p in picks)
-        for pp, p in enumerate(picks):
-            x[p] = data_new[pp]
+        parallel(
+            p_fun(x, these_picks, iir_params, padlen)
+            for these_picks in np.array_split(picks, n_jobs)
+        )
     x.shape = orig_shape
     return x
 
 
+def _iir_filter_picks(x, picks, iir_params, padlen):
+    """Filter the given rows of x in place."""
+    for p in picks:
+        _1d_iir_filter(x[p], iir_params, padlen, out=x[p])
+
+
+def _1d_iir_filter(x, iir_params, padlen, out=None, block=_IIR_BLOCK):
+    """Apply an IIR filter forward (and backward if padlen is not None).
+
+    The signal is processed in blocks carrying the filter state over, which
+    gives the same result as :func:`scipy.signal.sosfiltfilt` (or
+    :func:`scipy.signal.filtfilt`, or the forward-only variants) while only
+    using ``O(block)`` temporary memory, so ``out`` may be ``x`` itself.
+    """
+    if out is None:
+        out = np.empty_like(x)
+    if "sos" in iir_params:
+        sos = np.asarray(iir_params["sos"])
+        fun = partial(signal.sosfilt, sos)
+        dtype = np.result_type(sos, np.float32)  # float32 only if sos is
+        zi = signal.sosfilt_zi(sos).astype(dtype, copy=False)
+        zeros = np.zeros((len(sos), 2), dtype)
+    else:
+        b, a = np.atleast_1d(iir_params["b"]), np.atleast_1d(iir_params["a"])
+        fun = partial(signal.lfilter, b, a)
+        dtype = np.result_type(b, a, np.float32)
+        zi = signal.lfilter_zi(b, a).astype(dtype, copy=False)
+        zeros = np.zeros(max(len(a), len(b)) - 1, dtype)
+    n_x = len(x)
+    if padlen is None:  # forward only
+        state = zeros
+        for start in range(0, n_x, block):
+            out[start : start + block], state = fun(x[start : start + block], zi=state)
+        return out
+    # forward pass over the odd extension, then backward pass over the result
+    # (see scipy.signal.filtfilt)
+    if padlen > 0:
+        left = 2 * x[0] - x[padlen:0:-1]
+        right = 2 * x[-1] - x[-2 : -(padlen + 2) : -1]
+        x0 = left[0]
+        _, state = fun(left, zi=zi * x0)
+    else:
+        x0 = x[0]
+        state = zi * x0
+    for start in range(0, n_x, block):
+        out[start : start + block], state = fun(x[start : start + block], zi=state)
+    if padlen > 0:
+        right, _ = fun(right, zi=state)
+        y0 = right[-1]
+        _, state = fun(right[::-1], zi=zi * y0)
+    else:
+        y0 = out[-1]
+        state = zi * y0
+    for stop in range(n_x, 0, -block):
+        start = max(stop - block, 0)
+        y, state = fun(out[start:stop][::-1], zi=state)
+        out[start:stop] = y[::-1]
+    return out
+
+
 def estimate_ringing_samples(system, max_try=100000):
     """Estimate filter ringing.
 
@@ -715,6 +1010,14 @@ _ftype_dict = {
 }
 
 
+def _get_iir_system(cache_key, design, output):
+    """Design IIR filter coefficients (or get them from the cache)."""
+    if output == "sos":
+        return _filter_cache.get(cache_key, lambda: dict(sos=design()))["sos"]
+    system = _filter_cache.get(cache_key, lambda: dict(zip("ba", design())))
+    return system["b"], system["a"]
+
+
 @verbose
 def construct_iir_filter(
     iir_params,
@@ -860,7 +1163,7 @@ def construct_iir_filter(
     if not isinstance(iir_params, dict):
         raise TypeError("iir_params must be a dict, got %s" % type(iir_params))
     # if the filter has been designed, we're good to go
-    Wp = None
+    Wp = cache_key = None
     if "sos" in iir_params:
         system = iir_params["sos"]
         output = "sos"
@@ -919,7 +1222,13 @@ def construct_iir_filter(
             for key in ("rp", "rs"):
                 if key in iir_params:
                     kwargs[key] = iir_params[key]
-            system = signal.iirfilter(**kwargs)
+            cache_key = ("iir",) + tuple(
+                (key, val if isinstance(val, str) else _float_key(val))
+                for key, val in sorted(kwargs.items())
+            )
+            system = _get_iir_system(
+                cache_key, partial(signal.iirfilter, **kwargs), output
+            )
             if phase in ("zero", "zero-double"):
                 ptype, pmul = "(effective, after forward-backward)", 2
             else:
@@ -941,13 +1250,27 @@ def construct_iir_filter(
                     "N"
                     ") entries"
                 )
-            system = signal.iirdesign(
-                Wp,
-                Ws,
-                iir_params["gpass"],
-                iir_params["gstop"],
-                ftype=ftype,
-                output=output,
+            cache_key = (
+                "iir",
+                _float_key(Wp),
+                _float_key(Ws),
+                float(iir_params["gpass"]),
+                float(iir_params["gstop"]),
+                ftype,
+                output,
+            )
+            system = _get_iir_system(
+                cache_key,
+                partial(
+                    signal.iirdesign,
+                    Wp,
+                    Ws,
+                    iir_params["gpass"],
+                    iir_params["gstop"],
+                    ftype=ftype,
+                    output=output,
+                ),
+                output,
             )
 
     if system is None:
@@ -969,7 +1292,13 @@ def construct_iir_filter(
         logger.info(f"- Cutoff{_pl(f_pass)} at {edge_freqs} Hz: {cutoffs} dB")
     # now deal with padding
     if "padlen" not in iir_params:
-        padlen = estimate_ringing_samples(system)
+        if cache_key is None:
+            padlen = estimate_ringing_samples(system)
+        else:
+            padlen = _filter_cache.get(
+                cache_key + ("padlen",),
+                lambda: dict(padlen=estimate_ringing_samples(system)),
+            )["padlen"]
     else:
         padlen = iir_params["padlen"]
 
@@ -1030,7 +1359,8 @@ def filter_data(
     Parameters
     ----------
     data : ndarray, shape (..., n_times)
-        The data to filter.
+        The data to filter. Can be float32 to filter in single precision,
+        which halves the memory needed (see Notes).
     sfreq : float
         The sample frequency in Hz.
     %(l_freq)s
@@ -1086,11 +1416,20 @@ def filter_data(
               ``len(picks) * n_times`` additional time points need to
               be temporarily stored in memory.
 
+    With ``method='iir'``, channels are filtered in place by ``n_jobs``
+    threads, so no additional memory is needed. float32 ``data`` are
+    filtered with float32 coefficients and returned as float32, which is
+    less accurate (especially for low cutoff frequencies) but halves the
+    memory use.
+
+    .. versionchanged:: 1.7
+       Support for float32 data and threaded IIR filtering.
+
     For more information, see the tutorials
     :ref:`disc-filtering` and :ref:`tut-filter-resample` and
     :func:`mne.filter.create_filter`.
     """
-    data = _check_filterable(data)
+    data = _check_filterable(data, float32=True)
     iir_params, method = _check_method(method, iir_params)
     filt = create_filter(
         data,
@@ -1113,6 +1452,137 @@ def filter_data(
     return data
 
 
+@verbose
+def filter_bank(
+    inst,
+    bands,
+    picks=None,
+    filter_length="auto",
+    l_trans_bandwidth="auto",
+    h_trans_bandwidth="auto",
+    n_jobs=None,
+    phase="zero",
+    fir_window="hamming",
+    fir_design="firwin",
+    skip_by_annotation=("edge", "bad_acq_skip"),
+    pad=None,
+    *,
+    output="array",
+    verbose=None,
+):
+    """Filter data into several frequency bands at once.
+
+    This gives the same result as calling :meth:`mne.io.Raw.filter` (with
+    ``method='fir'``) once per band, but the FFT of the data is only computed
+    once and shared by all filters.
+
+    Parameters
+    ----------
+    inst : instance of Raw | Epochs | Evoked
+        The data to filter. The data must be loaded.
+    bands : list of tuple
+        The ``(l_freq, h_freq)`` frequencies of each band, with the same
+        meaning as in :meth:`mne.io.Raw.filter` (e.g., ``(8., 12.)`` for a
+        band-pass or ``(None, 4.)`` for a low-pass filter).
+    %(picks_all_data)s
+    %(filter_length)s
+    %(l_trans_bandwidth)s
+    %(h_trans_bandwidth)s
+    %(n_jobs_fir)s
+    %(phase)s
+    %(fir_window)s
+    %(fir_design)s
+    %(skip_by_annotation)s
+    %(pad_fir)s
+        If None (default), use the default of the ``filter`` method of
+        ``inst``, i.e., ``'reflect_limited'`` for Raw and ``'edge'`` otherwise.
+    output : ``'array'`` | ``'instance'``
+        If ``'array'`` (default), return the filtered data of the picked
+        channels stacked along a new first axis. If ``'instance'``, return one
+        copy of ``inst`` per band with the picked channels filtered.
+    %(verbose)s
+
+    Returns
+    -------
+    data : ndarray, shape (n_bands, [n_epochs,] n_picks, n_times) | list of instance
+        The filtered data or instances, in the order of ``bands``.
+
+    See Also
+    --------
+    create_filter
+    filter_data
+    mne.io.Raw.filter
+
+    Notes
+    -----
+    .. versionadded:: 1.7
+    """
+    from .annotations import _annotations_starts_stops
+    from .epochs import BaseEpochs
+    from .evoked import Evoked
+    from .io import BaseRaw
+
+    _validate_type(inst, (BaseRaw, BaseEpochs, Evoked), "inst")
+    _check_preload(inst, "filter_bank", write=False)
+    _check_option("output", output, ("array", "instance"))
+    bands = [tuple(band) for band in bands]
+    if len(bands) == 0 or any(len(band) != 2 for band in bands):
+        raise ValueError(
+            f"bands must be a non-empty list of (l_freq, h_freq) tuples, got {bands}"
+        )
+    picks = _picks_to_idx(inst.info, picks, "data_or_ica", exclude=())
+    data = inst._data
+    n_times = data.shape[-1]
+    x = data.reshape(-1, n_times)
+    # the rows of x to filter, epoch by epoch
+    rows = (np.arange(0, len(x), len(inst.ch_names))[:, np.newaxis] + picks).ravel()
+    if pad is None:
+        pad = "reflect_limited" if isinstance(inst, BaseRaw) else "edge"
+    if isinstance(inst, BaseRaw):
+        onsets, ends = _annotations_starts_stops(inst, skip_by_annotation, invert=True)
+        logger.info(
+            "Filtering raw data in %d contiguous segment%s"
+            % (len(onsets), _pl(onsets))
+        )
+    else:
+        onsets, ends = np.array([0]), np.array([n_times])
+    max_idx = (ends - onsets).argmax()
+    hs = [
+        create_filter(
+            x[:, onsets[max_idx] : ends[max_idx]],
+            inst.info["sfreq"],
+            l_freq,
+            h_freq,
+            filter_length,
+            l_trans_bandwidth,
+            h_trans_bandwidth,
+            "fir",
+            None,
+            phase,
+            fir_window,
+            fir_design,
+        )
+        for l_freq, h_freq in bands
+    ]
+    # samples outside of the segments are left untouched
+    out = np.repeat(x[np.newaxis, rows], len(bands), axis=0)
+    for start, stop in zip(onsets, ends):
+        _overlap_add_filter_bank(
+            x[:, start:stop], hs, phase, rows, n_jobs, pad, out[..., start:stop]
+        )
+    out = out.reshape((len(bands),) + data.shape[:-2] + (len(picks), n_times))
+    if output == "array":
+        return out
+    insts = list()
+    for (l_freq, h_freq), band_data in zip(bands, out):
+        band_inst = inst.copy()
+        band_inst._data[..., picks, :] = band_data
+        update_info, _ = _filt_check_picks(band_inst.info, picks, l_freq, h_freq)
+        _filt_update_info(band_inst.info, update_info, l_freq, h_freq)
+        insts.append(band_inst)
+    return insts
+
+
 @verbose
 def create_filter(
     data,
@@ -1526,7 +1996,8 @@ def notch_filter(
     Parameters
     ----------
     x : array
-        Signal to filter.
+        Signal to filter. Can be float32 to filter in single precision
+        (see :func:`mne.filter.filter_data`).
     Fs : float
         Sampling rate in Hz.
     freqs : float | array of float | None
@@ -1602,7 +2073,7 @@ def notch_filter(
     & Hemant Bokil, Oxford University Press, New York, 2008. Please
     cite this in publications if method 'spectrum_fit' is used.
     """
-    x = _check_filterable(x, "notch filtered", "notch_filter")
+    x = _check_filterable(x, "notch filtered", "notch_filter", float32=True)
     iir_params, method = _check_method(method, iir_params, ["spectrum_fit"])
 
     if freqs is not None:
@@ -1612,24 +2083,12 @@ def notch_filter(
 
     # Only have to deal with notch_widths for non-autodetect
     if freqs is not None:
-        if notch_widths is None:
-            notch_widths = freqs / 200.0
-        elif np.any(notch_widths < 0):
-            raise ValueError("notch_widths must be >= 0")
-        else:
-            notch_widths = np.atleast_1d(notch_widths)
-            if len(notch_widths) == 1:
-                notch_widths = notch_widths[0] * np.ones_like(freqs)
-            elif len(notch_widths) != len(freqs):
-                raise ValueError(
-                    "notch_widths must be None, scalar, or the " "same length as freqs"
-                )
+        notch_widths = _check_notch_widths(freqs, notch_widths)
 
     if method in ("fir", "iir"):
         # Speed this up by computing the fourier coefficients once
         tb_2 = trans_bandwidth / 2.0
-        lows = [freq - nw / 2.0 - tb_2 for freq, nw in zip(freqs, notch_widths)]
-        highs = [freq + nw / 2.0 + tb_2 for freq, nw in zip(freqs, notch_widths)]
+        lows, highs = _notch_stop_bands(freqs, notch_widths, trans_bandwidth)
         xf = filter_data(
             x,
             Fs,
@@ -1665,6 +2124,30 @@ def notch_filter(
     return xf
 
 
+def _check_notch_widths(freqs, notch_widths):
+    if notch_widths is None:
+        notch_widths = freqs / 200.0
+    elif np.any(notch_widths < 0):
+        raise ValueError("notch_widths must be >= 0")
+    else:
+        notch_widths = np.atleast_1d(notch_widths)
+        if len(notch_widths) == 1:
+            notch_widths = notch_widths[0] * np.ones_like(freqs)
+        elif len(notch_widths) != len(freqs):
+            raise ValueError(
+                "notch_widths must be None, scalar, or the " "same length as freqs"
+            )
+    return notch_widths
+
+
+def _notch_stop_bands(freqs, notch_widths, trans_bandwidth):
+    """Get the band-stop edges used to build a FIR or IIR notch filter."""
+    tb_2 = trans_bandwidth / 2.0
+    lows = [freq - nw / 2.0 - tb_2 for freq, nw in zip(freqs, notch_widths)]
+    highs = [freq + nw / 2.0 + tb_2 for freq, nw in zip(freqs, notch_widths)]
+    return lows, highs
+
+
 def _get_window_thresh(n_times, sfreq, mt_bandwidth, p_value):
     from .time_frequency.multitaper import _compute_mt_params
 
@@ -1678,6 +2161,10 @@ def _get_window_thresh(n_times, sfreq, mt_bandwidth, p_value):
     return window_fun, threshold
 
 
+# number of samples read at once by _mt_spectrum_remove_win
+_MT_BLOCK = 2**16
+
+
 def _mt_spectrum_proc(
     x,
     sfreq,
@@ -1698,33 +2185,43 @@ def _mt_spectrum_proc(
     if filter_length is None:
         filter_length = x.shape[-1]
     filter_length = min(_to_samples(filter_length, sfreq, "", ""), x.shape[-1])
-    get_wt = partial(
-        _get_window_thresh, sfreq=sfreq, mt_bandwidth=mt_bandwidth, p_value=p_value
+    # all channels of a window are processed at once, and the FFTs release
+    # the GIL so threads can process blocks of channels in place in parallel
+    parallel, p_fun, n_jobs = parallel_func(
+        _mt_spectrum_feed, n_jobs, prefer="threads", max_jobs=len(picks)
     )
-    window_fun, threshold = get_wt(filter_length)
-    parallel, p_fun, n_jobs = parallel_func(_mt_spectrum_remove_win, n_jobs)
+    # the overlap-add helpers and the tapers are set up here rather than in
+    # the threads, because this temporarily changes the (global) log level.
+    # The tapers only depend on the window length, so they are computed once
+    # for each length (all windows but the last have the same length).
+    window_thresh = dict()
+    blocks = [
+        _mt_spectrum_setup(
+            x,
+            these_picks,
+            window_thresh,
+            sfreq=sfreq,
+            line_freqs=line_freqs,
+            notch_widths=notch_widths,
+            n_samples=filter_length,
+        )
+        for these_picks in np.array_split(picks, n_jobs)
+    ]
+    cola = blocks[0][1]
+    for n_times in np.unique(cola.stops - cola.starts):
+        window_thresh[n_times] = _get_window_thresh(
+            n_times, sfreq, mt_bandwidth, p_value
+        )
     if n_jobs == 1:
-        freq_list = list()
-        for ii, x_ in enumerate(x):
-            if ii in picks:
-                x[ii], f = _mt_spectrum_remove_win(
-                    x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt
-                )
-                freq_list.append(f)
+        _mt_spectrum_feed(x, picks, cola)
     else:
-        data_new = parallel(
-            p_fun(x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_wt)
-            for xi, x_ in enumerate(x)
-            if xi in picks
-        )
-        freq_list = [d[1] for d in data_new]
-        data_new = np.array([d[0] for d in data_new])
-        x[picks, :] = data_new
+        parallel(p_fun(x, these_picks, cola) for these_picks, cola, _ in blocks)
+    freq_list = sum((rm_freqs for _, _, rm_freqs in blocks), list())
 
     # report found frequencies, but do some sanitizing first by binning into
     # 1 Hz bins
     counts = Counter(
-        sum((np.unique(np.round(ff)).tolist() for f in freq_list for ff in f), list())
+        sum((np.unique(np.round(ff)).tolist() for ff in freq_list), list())
     )
     kind = "Detected" if line_freqs is None else "Removed"
     found_freqs = (
@@ -1740,48 +2237,58 @@ def _mt_spectrum_proc(
     return x
 
 
-def _mt_spectrum_remove_win(
-    x, sfreq, line_freqs, notch_widths, window_fun, threshold, get_thresh
+def _mt_spectrum_setup(
+    x, picks, window_thresh, *, sfreq, line_freqs, notch_widths, n_samples
 ):
+    """Set up the in-place removal of line frequencies from rows of x.
+
+    The data are written back as soon as all overlapping windows are done,
+    so x can be a memory-mapped array. Returns the picks, the overlap-add
+    helper to feed with :func:`_mt_spectrum_feed` and the list that will
+    hold the removed frequencies for each channel of each window.
+    """
     n_times = x.shape[-1]
-    n_samples = window_fun.shape[1]
     n_overlap = (n_samples + 1) // 2
-    x_out = np.zeros_like(x)
     rm_freqs = list()
     idx = [0]
 
     # Define how to process a chunk of data
     def process(x_):
         out = _mt_spectrum_remove(
-            x_, sfreq, line_freqs, notch_widths, window_fun, threshold, get_thresh
+            x_, sfreq, line_freqs, notch_widths, *window_thresh[x_.shape[-1]]
         )
-        rm_freqs.append(out[1])
+        rm_freqs.extend(out[1])
         return (out[0],)  # must return a tuple
 
     # Define how to store a chunk of fully processed data (it's trivial)
     def store(x_):
         stop = idx[0] + x_.shape[-1]
-        x_out[..., idx[0] : stop] += x_
+        x[picks, idx[0] : stop] = x_
         idx[0] = stop
 
-    _COLA(process, store, n_times, n_samples, n_overlap, sfreq, verbose=False).feed(x)
-    assert idx[0] == n_times
-    return x_out, rm_freqs
+    cola = _COLA(process, store, n_times, n_samples, n_overlap, sfreq, verbose=False)
+    return picks, cola, rm_freqs
 
 
-def _mt_spectrum_remove(
-    x, sfreq, line_freqs, notch_widths, window_fun, threshold, get_thresh
-):
+def _mt_spectrum_feed(x, picks, cola):
+    """Feed the given rows of x in blocks to an overlap-add helper."""
+    # the output lags behind the input, so data are overwritten only after
+    # they have been read
+    for start in range(0, x.shape[-1], _MT_BLOCK):
+        cola.feed(x[picks, start : start + _MT_BLOCK])
+
+
+def _mt_spectrum_remove(x, sfreq, line_freqs, notch_widths, window_fun, threshold):
     """Use MT-spectrum to remove line frequencies.
 
     Based on Chronux. If line_freqs is specified, all freqs within notch_width
-    of each line_freq is set to zero.
+    of each line_freq is set to zero. Operates on all channels of
+    x (n_channels, n_times) at once.
     """
     from .time_frequency.multitaper import _mt_spectra
 
-    assert x.ndim == 1
-    if x.shape[-1] != window_fun.shape[-1]:
-        window_fun, threshold = get_thresh(x.shape[-1])
+    assert x.ndim == 2
+    assert x.shape[-1] == window_fun.shape[-1]
     # drop the even tapers
     n_tapers = len(window_fun)
     tapers_odd = np.arange(0, n_tapers, 2)
@@ -1795,12 +2302,12 @@ def _mt_spectrum_remove(
     H0_sq = sum_squared(H0)
 
     # make "time" vector
-    rads = 2 * np.pi * (np.arange(x.size) / float(sfreq))
+    rads = 2 * np.pi * (np.arange(x.shape[-1]) / float(sfreq))
 
     # compute mt_spectrum (returning n_ch, n_tapers, n_freq)
-    x_p, freqs = _mt_spectra(x[np.newaxis, :], window_fun, sfreq)
+    x_p, freqs = _mt_spectra(x, window_fun, sfreq)
 
-    # sum of the product of x_p and H0 across tapers (1, n_freqs)
+    # sum of the product of x_p and H0 across tapers (n_ch, n_freqs)
     x_p_H0 = np.sum(x_p[:, tapers_odd, :] * H0[np.newaxis, :, np.newaxis], axis=1)
 
     # resulting calculated amplitudes for all freqs
@@ -1810,7 +2317,7 @@ def _mt_spectrum_remove(
         # figure out which freqs to remove using F stat
 
         # estimated coefficient
-        x_hat = A * H0[:, np.newaxis]
+        x_hat = A[:, np.newaxis] * H0[:, np.newaxis]
 
         # numerator for F-statistic
         num = (n_tapers - 1) * (A * A.conj()).real * H0_sq
@@ -1821,9 +2328,8 @@ def _mt_spectrum_remove(
         den[den == 0] = np.inf
         f_stat = num / den
 
-        # find frequencies to remove
-        indices = np.where(f_stat > threshold)[1]
-        rm_freqs = freqs[indices]
+        # find frequencies to remove (for each channel)
+        mask = f_stat > threshold
     else:
         # specify frequencies
         indices_1 = np.unique([np.argmin(np.abs(freqs - lf)) for lf in line_freqs])
@@ -1833,24 +2339,21 @@ def _mt_spectrum_remove(
         ]
         indices_2 = np.where(np.any(np.array(indices_2), axis=0))[0]
         indices = np.unique(np.r_[indices_1, indices_2])
-        rm_freqs = freqs[indices]
-
-    fits = list()
-    for ind in indices:
-        c = 2 * A[0, ind]
-        fit = np.abs(c) * np.cos(freqs[ind] * rads + np.angle(c))
-        fits.append(fit)
-
-    if len(fits) == 0:
-        datafit = 0.0
-    else:
-        # fitted sinusoids are summed, and subtracted from data
-        datafit = np.sum(fits, axis=0)
-
+        mask = np.zeros(A.shape, bool)
+        mask[:, indices] = True
+    rm_freqs = [freqs[m] for m in mask]
+
+    # fitted sinusoids |c| cos(2 pi f t + angle(c)) = Re(c exp(2j pi f t))
+    # are summed, and subtracted from data
+    indices = np.where(mask.any(axis=0))[0]
+    if len(indices) == 0:
+        return x, rm_freqs
+    c = np.where(mask[:, indices], 2 * A[:, indices], 0)
+    datafit = (c @ np.exp(1j * freqs[indices, np.newaxis] * rads)).real
     return x - datafit, rm_freqs
 
 
-def _check_filterable(x, kind="filtered", alternative="filter"):
+def _check_filterable(x, kind="filtered", alternative="filter", float32=False):
     # Let's be fairly strict about this -- users can easily coerce to ndarray
     # at their end, and we already should do it internally any time we are
     # using these low-level functions. At the same time, let's
@@ -1873,7 +2376,7 @@ def _check_filterable(x, kind="filtered", alternative="filter"):
             )
     _validate_type(x, (np.ndarray, list, tuple), f"Data to be {kind}")
     x = np.asanyarray(x)
-    if x.dtype != np.float64:
+    if x.dtype != np.float64 and not (float32 and x.dtype == np.float32):
         raise ValueError(f"Data to be {kind} must be real floating, got {x.dtype}")
     return x
 
@@ -2012,6 +2515,118 @@ def _resample_polyphase(x, *, up, down, pad, window, n_jobs):
     return y
 
 
+# number of input samples resampled at once by _resample_polyphase_blocks
+_RESAMPLE_BLOCK = 2**16
+# signal.upfirdn extension modes that only depend on the samples near each edge
+_UPFIRDN_LOCAL_PADS = (
+    "constant",
+    "edge",
+    "smooth",
+    "symmetric",
+    "reflect",
+    "antisymmetric",
+    "antireflect",
+)
+
+
+def _upfirdn_output_len(len_h, n_in, up, down):
+    """Compute the output length of signal.upfirdn."""
+    n = (n_in + (len_h + (-len_h % up)) // up - 1) * up
+    return n // down + bool(n % down)
+
+
+def _resample_polyphase_blocks(
+    read, n_in, out, *, up, down, pad, window, stim_picks=(), block=_RESAMPLE_BLOCK
+):
+    """Resample with polyphase filtering one block of samples at a time.
+
+    ``read(start, stop)`` must return the 2D input data between the two
+    input samples, and the resampled data are written to ``out`` (which can be
+    a memmap). Each block is computed with :func:`scipy.signal.upfirdn` over
+    the input samples it depends on, which gives the same result as
+    :func:`scipy.signal.resample_poly` (as called by
+    :func:`_resample_polyphase`) while only holding ``O(block)`` samples in
+    memory. Rows in ``stim_picks`` are resampled with
+    :func:`_resample_stim_channels` block by block instead.
+    """
+    poly = _prep_polyphase_blocks(n_in, up=up, down=down, pad=pad, window=window)
+    assert out.shape[-1] == poly["n_out"]
+    # block boundaries must be multiples of down (input) and up (output) so that
+    # the polyphase filter (and the stim channel windows) stay aligned
+    block = max(block // poly["down"], 1) * poly["up"]
+    for o_start in range(0, poly["n_out"], block):
+        o_stop = min(o_start + block, poly["n_out"])
+        _resample_polyphase_block(
+            read, o_start, out[:, o_start:o_stop], poly=poly, stim_picks=stim_picks
+        )
+    return out
+
+
+def _prep_polyphase_blocks(n_in, *, up, down, pad, window):
+    """Get the filter that signal.resample_poly uses for n_in samples."""
+    if pad == "auto":
+        pad = "reflect"
+    _check_option("pad", pad, _UPFIRDN_LOCAL_PADS, extra="when resampling in blocks")
+    g_ = gcd(up, down)
+    up, down = up // g_, down // g_
+    n_out = n_in * up
+    n_out = n_out // down + bool(n_out % down)
+    half_len = (len(window) - 1) // 2
+    h = np.array(window, float) * up
+    n_pre_pad = down - half_len % down
+    n_post_pad = 0
+    n_pre_remove = (half_len + n_pre_pad) // down
+    while (
+        _upfirdn_output_len(len(h) + n_pre_pad + n_post_pad, n_in, up, down)
+        < n_out + n_pre_remove
+    ):
+        n_post_pad += 1
+    h = np.concatenate([np.zeros(n_pre_pad), h, np.zeros(n_post_pad)])
+    return dict(
+        h=h,
+        up=up,
+        down=down,
+        pad=pad,
+        n_in=n_in,
+        n_out=n_out,
+        n_pre_remove=n_pre_remove,
+    )
+
+
+def _resample_polyphase_block(read, o_start, out, *, poly, stim_picks=()):
+    """Compute the resampled samples starting at o_start into out.
+
+    ``o_start`` must be a multiple of ``poly["up"]``, and the block must end
+    at such a multiple or at the last output sample, for the stim channels
+    to be resampled like :func:`_resample_stim_channels` does for the full
+    signal.
+    """
+    h, up, down, n_in = poly["h"], poly["up"], poly["down"], poly["n_in"]
+    n_pre_remove = poly["n_pre_remove"]
+    n_h_phase = -(-len(h) // up)  # input samples used per output sample
+    o_stop = o_start + out.shape[-1]
+    stim_picks = np.array(stim_picks, int)
+    data_picks = np.setdiff1d(np.arange(out.shape[0]), stim_picks)
+    # input sample of the last filter tap for each output sample
+    first = (o_start + n_pre_remove) * down // up
+    last = (o_stop - 1 + n_pre_remove) * down // up
+    i_start = o_start // up * down
+    i_stop = min(o_stop * down // up, n_in)
+    start = min(max(first - n_h_phase + 1, 0) // down * down, i_start)
+    stop = min(max(last + 1, i_stop), n_in)
+    data = read(start, stop)
+    offset = start * up // down - n_pre_remove
+    y = signal.upfirdn(h, data[data_picks], up, down, axis=-1, mode=poly["pad"])
+    out[data_picks] = y[:, o_start - offset : o_stop - offset]
+    if len(stim_picks):
+        out[stim_picks] = _resample_stim_channels(
+            data[stim_picks, i_start - start : i_stop - start],
+            o_stop - o_start,
+            i_stop - i_start,
+        )
+    return out
+
+
 def _resample_fft(x_flat, *, ratio, final_len, pad, window, npad, n_jobs):
     x_len = x_flat.shape[-1]
     pad = "reflect_limited" if pad == "auto" else pad
@@ -2421,7 +3036,7 @@ def _triage_filter_params(
 
     # If we have data supplied, do a sanity check
     if x is not None:
-        x = _check_filterable(x)
+        x = _check_filterable(x, float32=True)
         len_x = x.shape[-1]
         if method != "fir":
             filter_length = len_x
@@ -2581,7 +3196,11 @@ class FilterMixin:
         The data are modified inplace.
 
         The object has to have the data loaded e.g. with ``preload=True``
-        or ``self.load_data()``.
+        or ``self.load_data()``. For data that do not fit in memory, pass a
+        filename as ``preload`` to use a memory-mapped file: FIR and IIR
+        filtering process each channel in blocks and write the result in
+        place, so only a bounded amount of additional memory is used
+        (with ``n_jobs=1``).
 
         ``l_freq`` and ``h_freq`` are the frequencies below which and above
         which, respectively, to filter out of the data. Thus the uses are:
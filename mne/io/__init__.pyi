@@ -2,6 +2,7 @@ __all__ = [
     "BaseRaw",
     "Raw",
     "RawArray",
+    "RawPipeline",
     "anonymize_info",
     "concatenate_raws",
     "constants",
@@ -86,4 +87,5 @@ from .nihon import read_raw_nihon
 from .nirx import read_raw_nirx
 from .nsx import read_raw_nsx
 from .persyst import read_raw_persyst
+from .pipeline import RawPipeline
 from .snirf import read_raw_snirf
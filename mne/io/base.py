@@ -14,7 +14,8 @@ import os
 import os.path as op
 import shutil
 from collections import defaultdict
-from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, nullcontext
 from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import timedelta
@@ -38,7 +39,7 @@ from .._fiff.pick import (
     pick_types,
 )
 from .._fiff.proj import ProjMixin, _proj_equal, activate_proj, setup_proj
-from .._fiff.utils import _check_orig_units, _make_split_fnames
+from .._fiff.utils import _check_orig_units, _make_split_fnames, _mult_cal_one
 from .._fiff.write import (
     _NEXT_FILE_BUFFER,
     _get_split_size,
@@ -57,7 +58,6 @@ from .._fiff.write import (
 from ..annotations import (
     Annotations,
     _annotations_starts_stops,
-    _combine_annotations,
     _handle_meas_date,
     _sync_onset,
     _write_annotations,
@@ -70,10 +70,13 @@ from ..channels.channels import (
 from ..defaults import _handle_default
 from ..event import concatenate_events, find_events
 from ..filter import (
+    _UPFIRDN_LOCAL_PADS,
     FilterMixin,
     _check_fun,
     _check_resamp_noop,
+    _prep_polyphase,
     _resamp_ratio_len,
+    _resample_polyphase_blocks,
     _resample_stim_channels,
     notch_filter,
     resample,
@@ -299,6 +302,7 @@ class BaseRaw(
         self._orig_units = orig_units or dict()  # always a dict
         self._projectors = list()
         self._projector = None
+        self._shared = False  # data are a read-only view of another instance's
         self._dtype_ = dtype
         self.set_annotations(None)
         self._cropped_samp = first_samps[0]
@@ -443,13 +447,16 @@ class BaseRaw(
             cals = cals[idx, np.newaxis]
             assert cals.shape == (n_out, 1)
             need_idx = idx  # sufficient just to read the given channels
+            proj = None
         else:
-            mult = mult[idx] * cals
+            proj = mult[idx]
+            mult = proj * cals
             cals = None  # shouldn't be used
             assert mult.shape == (n_out, len(self.ch_names))
             # read all necessary for proj
             need_idx = np.where(np.any(mult, axis=0))[0]
             mult = mult[:, need_idx]
+            proj = proj[:, need_idx]
             logger.debug(
                 f"Reading {len(need_idx)}/{len(self.ch_names)} channels "
                 f"due to projection"
@@ -475,15 +482,25 @@ class BaseRaw(
             this_sl = slice(offset, offset + n_read)
             # reindex back to original file
             orig_idx = _convert_slice(self._read_picks[fi][need_idx])
-            _ReadSegmentFileProtector(self)._read_segment_file(
-                data[:, this_sl],
-                orig_idx,
-                fi,
-                int(start_file),
-                int(stop_file),
-                cals,
-                mult,
-            )
+            if "source" in self._raw_extras[fi]:
+                _read_virtual_file(
+                    data[:, this_sl],
+                    orig_idx,
+                    self._raw_extras[fi],
+                    int(start_file),
+                    int(stop_file),
+                    proj,
+                )
+            else:
+                _ReadSegmentFileProtector(self)._read_segment_file(
+                    data[:, this_sl],
+                    orig_idx,
+                    fi,
+                    int(start_file),
+                    int(stop_file),
+                    cals,
+                    mult,
+                )
             offset += n_read
         return data
 
@@ -520,51 +537,37 @@ class BaseRaw(
         """
         raise NotImplementedError
 
-    def _check_bad_segment(
-        self, start, stop, picks, reject_start, reject_stop, reject_by_annotation=False
-    ):
-        """Check if data segment is bad.
-
-        If the slice is good, returns the data in desired range.
-        If rejected based on annotation, returns description of the
-        bad segment as a string.
+    def _bad_segment_descriptions(self, reject_start, reject_stop):
+        """Get the first bad annotation overlapping each of many segments.
 
         Parameters
         ----------
-        start : int
-            First sample of the slice.
-        stop : int
-            End of the slice.
-        picks : array of int
-            Channel picks.
-        reject_start : int
-            First sample to check for overlaps with bad annotations.
-        reject_stop : int
-            Last sample to check for overlaps with bad annotations.
-        reject_by_annotation : bool
-            Whether to perform rejection based on annotations.
-            False by default.
+        reject_start : array of int
+            First sample of each segment to check for overlaps.
+        reject_stop : array of int
+            Last sample of each segment to check for overlaps.
 
         Returns
         -------
-        data : array | str
-            Data in the desired range (good segment) or description of the bad
-            segment.
+        descriptions : list of str | None
+            The description of the first bad annotation overlapping each
+            segment, or None if the segment is good.
         """
-        if start < 0:
-            return None
-        if reject_by_annotation and len(self.annotations) > 0:
-            annot = self.annotations
-            sfreq = self.info["sfreq"]
-            onset = _sync_onset(self, annot.onset)
-            overlaps = np.where(onset < reject_stop / sfreq)
-            overlaps = np.where(
-                onset[overlaps] + annot.duration[overlaps] > reject_start / sfreq
-            )
-            for descr in annot.description[overlaps]:
-                if descr.lower().startswith("bad"):
-                    return descr
-        return self._getitem((picks, slice(start, stop)), return_times=False)
+        descriptions = [None] * len(reject_start)
+        annot = self.annotations
+        if len(annot) == 0:
+            return descriptions
+        assert self.info["meas_date"] == annot.orig_time
+        sfreq = self.info["sfreq"]
+        tmin = np.asarray(reject_start) / sfreq
+        tmax = np.asarray(reject_stop) / sfreq
+        index = annot._get_index(self._first_time, ("bad",))
+        windows, idx = index.overlapping(tmin, tmax, closed=False)
+        # overlaps are sorted by annotation within each segment
+        windows, first = np.unique(windows, return_index=True)
+        for window, ii in zip(windows, idx[first]):
+            descriptions[window] = annot.description[ii]
+        return descriptions
 
     @verbose
     def load_data(self, verbose=None):
@@ -665,9 +668,12 @@ class BaseRaw(
                 0, self._first_time
             )
             delta = (origin - first_samp_in_abs_time).total_seconds()
-        times = np.atleast_1d(times) + delta
-
-        return super().time_as_index(times, use_rounding)
+        # same as TimeMixin.time_as_index, but self.times[0] is always zero, so we
+        # avoid computing (all of) self.times
+        index = (np.atleast_1d(times) + delta) * self.info["sfreq"]
+        if use_rounding:
+            index = np.round(index)
+        return index.astype(int)
 
     @property
     def _raw_lengths(self):
@@ -750,7 +756,11 @@ class BaseRaw(
 
     def __del__(self):  # noqa: D105
         # remove file for memmap
-        if hasattr(self, "_data") and getattr(self._data, "filename", None) is not None:
+        if (
+            hasattr(self, "_data")
+            and getattr(self._data, "filename", None) is not None
+            and not getattr(self, "_shared", False)
+        ):
             # First, close the file out; happens automatically on del
             filename = self._data.filename
             del self._data
@@ -1218,11 +1228,16 @@ class BaseRaw(
         "picks". By default the data of the Raw object is modified inplace.
 
         The Raw object has to have the data loaded e.g. with ``preload=True``
-        or ``self.load_data()``.
+        or ``self.load_data()``. For data that do not fit in memory, pass a
+        filename as ``preload`` to use a memory-mapped file: with
+        ``method='spectrum_fit'`` (and ``method='iir'``), the data are read
+        and written back in blocks, and ``n_jobs`` threads process blocks of
+        channels in place.
 
         .. note:: If n_jobs > 1, more memory is required as
                   ``len(picks) * n_times`` additional time points need to
-                  be temporarily stored in memory.
+                  be temporarily stored in memory (except for
+                  ``method='spectrum_fit'`` and ``method='iir'``).
 
         For details, see :func:`mne.filter.notch_filter`.
         """
@@ -1267,6 +1282,7 @@ class BaseRaw(
         events=None,
         pad="auto",
         method="fft",
+        preload=None,
         verbose=None,
     ):
         """Resample all channels.
@@ -1313,6 +1329,12 @@ class BaseRaw(
             .. versionadded:: 0.15
         %(method_resample)s
 
+            .. versionadded:: 1.7
+        preload : str | None
+            If a string, it is the file name of a memory-mapped file used to
+            store the resampled data on the hard drive (see Notes). If None
+            (default), the resampled data are kept in memory.
+
             .. versionadded:: 1.7
         %(verbose)s
 
@@ -1337,7 +1359,15 @@ class BaseRaw(
         object has to have the data loaded e.g. with ``preload=True`` or
         ``self.load_data()``, but this increases memory requirements. The
         resulting raw object will have the data loaded into memory.
+
+        With ``method="polyphase"``, data that are not preloaded are instead
+        read and resampled in blocks of samples, giving the same result as
+        resampling the preloaded data. Combined with a file name as
+        ``preload``, the resampled data are written to disk as they are
+        computed, so recordings larger than the available memory can be
+        resampled.
         """
+        _validate_type(preload, (None, "path-like"), "preload")
         sfreq = float(sfreq)
         o_sfreq = float(self.info["sfreq"])
         if _check_resamp_noop(sfreq, o_sfreq):
@@ -1383,11 +1413,33 @@ class BaseRaw(
         )
         ratio, n_news = ratio[0], np.array(n_news, int)
         new_offsets = np.cumsum([0] + list(n_news))
-        if self.preload:
-            new_data = np.empty((len(self.ch_names), new_offsets[-1]), self._data.dtype)
+        blocks = (
+            not self.preload
+            and method == "polyphase"
+            and (pad == "auto" or pad in _UPFIRDN_LOCAL_PADS)
+        )
+        if self.preload or blocks:
+            dtype = self._data.dtype if self.preload else self._dtype
+            new_data = _allocate_data(
+                preload, (len(self.ch_names), new_offsets[-1]), dtype
+            )
         for ri, (n_orig, n_new) in enumerate(zip(self._raw_lengths, n_news)):
             this_sl = slice(new_offsets[ri], new_offsets[ri + 1])
-            if self.preload:
+            if blocks:
+                up, down, poly_window = _prep_polyphase(ratio, n_orig, n_new, window)
+                _resample_polyphase_blocks(
+                    lambda start, stop: self._read_segment(
+                        offsets[ri] + start, offsets[ri] + stop
+                    ),
+                    n_orig,
+                    new_data[:, this_sl],
+                    up=up,
+                    down=down,
+                    pad=pad,
+                    window=poly_window,
+                    stim_picks=stim_picks,
+                )
+            elif self.preload:
                 data_chunk = self._data[:, offsets[ri] : offsets[ri + 1]]
                 new_data[:, this_sl] = resample(data_chunk, **kwargs)
                 # In empirical testing, it was faster to resample all channels
@@ -1404,8 +1456,10 @@ class BaseRaw(
                         ci, offsets[ri], offsets[ri + 1], verbose="error"
                     )[0]
                     if ci == 0 and ri == 0:
-                        new_data = np.empty(
-                            (len(self.ch_names), new_offsets[-1]), data_chunk.dtype
+                        new_data = _allocate_data(
+                            preload,
+                            (len(self.ch_names), new_offsets[-1]),
+                            data_chunk.dtype,
                         )
                     if ci in stim_picks:
                         resamp = _resample_stim_channels(
@@ -1421,6 +1475,7 @@ class BaseRaw(
         self._raw_lengths[ri] = list(n_news)
         assert np.array_equal(n_news, self._last_samps - self._first_samps + 1)
         self._data = new_data
+        self._shared = False
         self.preload = True
         lowpass = self.info.get("lowpass")
         lowpass = np.inf if lowpass is None else lowpass
@@ -1521,8 +1576,10 @@ class BaseRaw(
         self._raw_extras = [self._raw_extras[ri] for ri in keepers]
         self._filenames = [self._filenames[ri] for ri in keepers]
         if self.preload:
-            # slice and copy to avoid the reference to large array
-            self._data = self._data[:, smin : smax + 1].copy()
+            self._data = self._data[:, smin : smax + 1]
+            if not self._shared:
+                # copy to avoid the reference to large array
+                self._data = self._data.copy()
 
         annotations = self.annotations
         # now call setter to filter out annotations outside of interval
@@ -1967,8 +2024,17 @@ class BaseRaw(
                 preload = False
 
         if preload is False:
+            # the data of preloaded instances are read from them when needed
             if self.preload:
-                self._data = None
+                (
+                    self._first_samps,
+                    self._last_samps,
+                    self._read_picks,
+                    self._raw_extras,
+                    self._filenames,
+                ) = _virtual_files(self)
+                del self._data
+                self._shared = False
             self.preload = False
         else:
             # do the concatenation ourselves since preload might be a string
@@ -1995,38 +2061,59 @@ class BaseRaw(
             self._data = _data
             self.preload = True
 
-        # now combine information from each raw file to construct new self
+        # now combine information from each raw file to construct new self,
+        # all at once so that appending many instances scales linearly
+        sfreq = self.info["sfreq"]
         annotations = self.annotations
         assert annotations.orig_time == self.info["meas_date"]
-        edge_samps = list()
-        for ri, r in enumerate(raws):
-            n_samples = self.last_samp - self.first_samp + 1
-            annotations = _combine_annotations(
-                annotations,
-                r.annotations,
-                n_samples,
-                self.first_samp,
-                r.first_samp,
-                self.info["sfreq"],
-            )
-            edge_samps.append(sum(self._last_samps) - sum(self._first_samps) + (ri + 1))
-            self._first_samps = np.r_[self._first_samps, r._first_samps]
-            self._last_samps = np.r_[self._last_samps, r._last_samps]
-            self._read_picks += r._read_picks
-            self._raw_extras += r._raw_extras
-            self._filenames += r._filenames
+        edge_samps = np.cumsum([r.n_times for r in all_raws])[:-1]
+        onsets, durations, descriptions, ch_names = (
+            [annotations.onset],
+            [annotations.duration],
+            [annotations.description],
+            [annotations.ch_names],
+        )
+        files = [
+            (r._first_samps, r._last_samps, r._read_picks, r._raw_extras, r._filenames)
+            if preload is not False or not r.preload
+            else _virtual_files(r)
+            for r in raws
+        ]
+        for r, n_samples in zip(raws, edge_samps):
+            # shift to the right by the number of samples and the offset, and
+            # undo the offset of the appended instance
+            shift = n_samples / sfreq + self.first_samp / sfreq - r.first_samp / sfreq
+            onsets.append(r.annotations.onset + shift)
+            durations.append(r.annotations.duration)
+            descriptions.append(r.annotations.description)
+            ch_names.append(r.annotations.ch_names)
+        annotations = Annotations(
+            np.concatenate(onsets),
+            np.concatenate(durations),
+            np.concatenate(descriptions),
+            annotations.orig_time,
+            np.concatenate(ch_names),
+        )
+        self._first_samps = np.concatenate([self._first_samps] + [f[0] for f in files])
+        self._last_samps = np.concatenate([self._last_samps] + [f[1] for f in files])
+        for f in files:
+            self._read_picks += f[2]
+            self._raw_extras += f[3]
+            self._filenames += f[4]
         assert annotations.orig_time == self.info["meas_date"]
-        # The above _combine_annotations gets everything synchronized to
-        # first_samp. set_annotations (with no absolute time reference) assumes
-        # that the annotations being set are relative to first_samp, and will
-        # add it back on. So here we have to remove it:
+        # The above gets everything synchronized to first_samp. set_annotations
+        # (with no absolute time reference) assumes that the annotations being
+        # set are relative to first_samp, and will add it back on. So here we
+        # have to remove it:
         if annotations.orig_time is None:
-            annotations.onset -= self.first_samp / self.info["sfreq"]
+            annotations.onset -= self.first_samp / sfreq
         self.set_annotations(annotations)
-        for edge_samp in edge_samps:
-            onset = _sync_onset(self, (edge_samp) / self.info["sfreq"], True)
-            self.annotations.append(onset, 0.0, "BAD boundary")
-            self.annotations.append(onset, 0.0, "EDGE boundary")
+        if len(edge_samps):
+            self.annotations.append(
+                np.repeat(_sync_onset(self, edge_samps / sfreq, True), 2),
+                0.0,
+                ["BAD boundary", "EDGE boundary"] * len(edge_samps),
+            )
         if not (
             len(self._first_samps)
             == len(self._last_samps)
@@ -2037,22 +2124,84 @@ class BaseRaw(
             raise RuntimeError("Append error")  # should never happen
 
     def close(self):
-        """Clean up the object.
+        """Release any memory maps of the underlying files.
 
-        Does nothing for objects that close their file descriptors.
-        Things like Raw will override this method.
+        The files are mapped again if data need to be read afterward.
         """
-        pass  # noqa
+        for raw_extra in self._raw_extras:
+            if isinstance(raw_extra, dict) and raw_extra.get("mmap") is not None:
+                raw_extra["mmap"].close()
 
-    def copy(self):
+    def copy(self, *, view=False):
         """Return copy of Raw instance.
 
+        Parameters
+        ----------
+        view : bool
+            If True and the data are loaded, the copy shares the data of this
+            instance instead of copying them, and cropping it only takes a
+            view of the data. This makes ``raw.copy(view=True).crop(tmin,
+            tmax)`` cheap, e.g. to process many short windows of a long
+            recording. The data are shared copy-on-write: methods of either
+            instance that modify the data in place (e.g., :meth:`filter`)
+            copy them first. Unlike the data, the measurement info is not
+            shared but copied, because it is modified in place by many
+            functions.
+
+            .. versionadded:: 1.7
+
         Returns
         -------
         inst : instance of Raw
             A copy of the instance.
         """
-        return deepcopy(self)
+        memo = self._copy_memo()
+        view = view and self.preload
+        if view:
+            data = self._data.view()
+            data.flags.writeable = False
+            memo[id(self._data)] = data
+            self._shared = True
+        out = deepcopy(self, memo)
+        out._shared = view
+        return out
+
+    def _copy_memo(self):
+        """Get the objects that copies share with this instance."""
+        # the instances virtual files read from are shared
+        return {
+            id(extras["source"]): extras["source"]
+            for extras in self._raw_extras
+            if "source" in extras
+        }
+
+    def _unshare(self):
+        """Copy the data shared with another instance before modifying them."""
+        if self._shared:
+            self._data = self._data.copy()
+            self._shared = False
+
+    def lazy(self):
+        """Record preprocessing steps and only apply them when reading data.
+
+        Returns
+        -------
+        raw : instance of RawPipeline
+            A pipeline reading from this instance. Filtering, resampling,
+            re-referencing, projection, cropping and picking are recorded and
+            applied chunk by chunk when the data are read or saved.
+
+        See Also
+        --------
+        mne.io.RawPipeline
+
+        Notes
+        -----
+        .. versionadded:: 1.7
+        """
+        from .pipeline import RawPipeline
+
+        return RawPipeline(self)
 
     def __repr__(self):  # noqa: D105
         name = self.filenames[0]
@@ -2528,6 +2677,48 @@ class _ReadSegmentFileProtector:
         )
 
 
+def _virtual_files(raw):
+    """Get the file entries that read the data of a preloaded instance."""
+    # the data are shared copy-on-write, the rest is copied so that later
+    # changes to the instance do not change what is read
+    source = raw.copy(view=True)
+    extras = dict(
+        source=source,
+        steps=[],
+        first_samp=source.first_samp,
+        orig_nchan=source.info["nchan"],
+    )
+    return (
+        np.array([source.first_samp]),
+        np.array([source.last_samp]),
+        [np.arange(source.info["nchan"])],
+        [extras],
+        [source._filenames[0]],
+    )
+
+
+def _read_virtual_file(data, idx, extras, start, stop, proj):
+    """Read a chunk of a file whose data are read from another instance."""
+    offset = extras["first_samp"]
+    one = _read_steps(extras["source"], extras["steps"], start - offset, stop - offset)
+    # the data read are already calibrated
+    cals = None if proj is not None else np.ones((len(data), 1))
+    _mult_cal_one(data, one, idx, cals, proj)
+
+
+def _read_steps(source, steps, start, stop):
+    """Read samples start:stop of the output of the last step."""
+    if len(steps) == 0:
+        if source.preload:
+            return source._data[:, start:stop]
+        return source._read_segment(start, stop)
+    return steps[-1].compute(
+        lambda start, stop: _read_steps(source, steps[:-1], start, stop),
+        start,
+        stop,
+    )
+
+
 class _RawShell:
     """Create a temporary raw object."""
 
@@ -2764,12 +2955,26 @@ def _write_raw_data(
                 )
 
     cals = [ch["cal"] * ch["range"] for ch in info["chs"]]
+    skips = [
+        do_skips and ((first >= sk_onsets) & (last <= sk_ends)).any()
+        for first, last in zip(firsts, lasts)
+    ]
+    # Reading (and projecting) the next buffer happens in a separate thread
+    # while the current one is converted and written
+    buffers = _read_ahead(
+        _read_raw_buffer,
+        [
+            (raw, picks, projector, first, last)
+            for first, last, skip in zip(firsts, lasts, skips)
+            if not skip
+        ],
+    )
     # Write the blocks
     n_current_skip = 0
     new_start = start
-    for first, last in zip(firsts, lasts):
-        if do_skips:
-            if ((first >= sk_onsets) & (last <= sk_ends)).any():
+    with closing(buffers):
+        for first, last, skip in zip(firsts, lasts, skips):
+            if skip:
                 # Track how many we have
                 n_current_skip += 1
                 continue
@@ -2781,56 +2986,52 @@ def _write_raw_data(
                 # write_nop(fid)
                 # write_nop(fid)
                 n_current_skip = 0
-        data, times = raw[picks, first:last]
-        assert len(times) == last - first
-
-        if projector is not None:
-            data = np.dot(projector, data)
-
-        if drop_small_buffer and (first > start) and (len(times) < buffer_size):
-            logger.info("Skipping data chunk due to small buffer ... " "[done]")
-            break
-        logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
-        _write_raw_buffer(fid, data, cals, fmt)
-
-        pos = fid.tell()
-        this_buff_size_bytes = pos - pos_prev
-        overage = pos - split_size + _NEXT_FILE_BUFFER
-        if overage > 0:
-            # This should occur on the first buffer write of the file, so
-            # we should mention the space required for the meas info
-            raise ValueError(
-                "buffer size (%s) is too large for the given split size (%s) "
-                "by %s bytes after writing info (%s) and leaving enough space "
-                'for end tags (%s): decrease "buffer_size_sec" or increase '
-                '"split_size".'
-                % (
-                    this_buff_size_bytes,
-                    split_size,
-                    overage,
-                    pos_prev,
-                    _NEXT_FILE_BUFFER,
+            data = next(buffers)
+
+            if drop_small_buffer and (first > start) and (last - first < buffer_size):
+                logger.info("Skipping data chunk due to small buffer ... " "[done]")
+                break
+            logger.debug(f"Writing FIF {first:6d} ... {last:6d} ...")
+            _write_raw_buffer(fid, data, cals, fmt)
+
+            pos = fid.tell()
+            this_buff_size_bytes = pos - pos_prev
+            overage = pos - split_size + _NEXT_FILE_BUFFER
+            if overage > 0:
+                # This should occur on the first buffer write of the file, so
+                # we should mention the space required for the meas info
+                raise ValueError(
+                    "buffer size (%s) is too large for the given split size (%s) "
+                    "by %s bytes after writing info (%s) and leaving enough space "
+                    'for end tags (%s): decrease "buffer_size_sec" or increase '
+                    '"split_size".'
+                    % (
+                        this_buff_size_bytes,
+                        split_size,
+                        overage,
+                        pos_prev,
+                        _NEXT_FILE_BUFFER,
+                    )
                 )
-            )
 
-        new_start = last
-        # Split files if necessary, leave some space for next file info
-        # make sure we check to make sure we actually *need* another buffer
-        # with the "and" check
-        if (
-            pos >= split_size - this_buff_size_bytes - _NEXT_FILE_BUFFER
-            and first + buffer_size < stop
-        ):
-            start_block(fid, FIFF.FIFFB_REF)
-            write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
-            write_string(fid, FIFF.FIFF_REF_FILE_NAME, op.basename(next_fname))
-            if info["meas_id"] is not None:
-                write_id(fid, FIFF.FIFF_REF_FILE_ID, info["meas_id"])
-            write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx + 1)
-            end_block(fid, FIFF.FIFFB_REF)
-
-            break
-        pos_prev = pos
+            new_start = last
+            # Split files if necessary, leave some space for next file info
+            # make sure we check to make sure we actually *need* another buffer
+            # with the "and" check
+            if (
+                pos >= split_size - this_buff_size_bytes - _NEXT_FILE_BUFFER
+                and first + buffer_size < stop
+            ):
+                start_block(fid, FIFF.FIFFB_REF)
+                write_int(fid, FIFF.FIFF_REF_ROLE, FIFF.FIFFV_ROLE_NEXT_FILE)
+                write_string(fid, FIFF.FIFF_REF_FILE_NAME, op.basename(next_fname))
+                if info["meas_id"] is not None:
+                    write_id(fid, FIFF.FIFF_REF_FILE_ID, info["meas_id"])
+                write_int(fid, FIFF.FIFF_REF_FILE_NUM, part_idx + 1)
+                end_block(fid, FIFF.FIFFB_REF)
+
+                break
+            pos_prev = pos
 
     end_block(fid, data_kind)
     return new_start
@@ -2870,6 +3071,28 @@ def _write_raw_metadata(fid, info, data_type, reset_range, annotations):
         _write_annotations(fid, annotations)
 
 
+def _read_raw_buffer(raw, picks, projector, first, last):
+    """Read (and project) a raw buffer for writing."""
+    data, times = raw[picks, first:last]
+    assert len(times) == last - first
+    if projector is not None:
+        data = np.dot(projector, data)
+    return data
+
+
+def _read_ahead(func, args_list):
+    """Yield func(*args) for each args, computed one step ahead in a thread."""
+    if len(args_list) == 0:
+        return
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(func, *args_list[0])
+        for args in args_list[1:]:
+            result = future.result()
+            future = executor.submit(func, *args)
+            yield result
+        yield future.result()
+
+
 def _write_raw_buffer(fid, buf, cals, fmt):
     """Write raw buffer.
 
@@ -21,7 +21,7 @@ import numpy as np
 
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import _empty_info
-from ..._fiff.utils import _mult_cal_one, _read_segments_file
+from ..._fiff.utils import _mult_cal_one, _read_segments_mmap
 from ...annotations import Annotations, read_annotations
 from ...channels import make_dig_montage
 from ...defaults import HEAD_SIZE_DEFAULT
@@ -141,11 +141,9 @@ class RawBrainVision(BaseRaw):
         # read data
         n_data_ch = self._raw_extras[fi]["orig_nchan"]
         fmt = self._raw_extras[fi]["fmt"]
-        if self._raw_extras[fi]["order"] == "C":
-            _read_segments_c(self, data, idx, fi, start, stop, cals, mult)
-        elif isinstance(fmt, str):
-            dtype = _fmt_dtype_dict[fmt]
-            _read_segments_file(
+        if isinstance(fmt, str):
+            multiplexed = self._raw_extras[fi]["order"] != "C"
+            _read_segments_mmap(
                 self,
                 data,
                 idx,
@@ -154,8 +152,10 @@ class RawBrainVision(BaseRaw):
                 stop,
                 cals,
                 mult,
-                dtype=dtype,
+                dtype=_fmt_dtype_dict[fmt],
                 n_channels=n_data_ch,
+                multiplexed=multiplexed,
+                n_samples=None if multiplexed else self._raw_extras[fi]["n_samples"],
             )
         else:
             offsets = self._raw_extras[fi]["offsets"]
@@ -191,22 +191,6 @@ class RawBrainVision(BaseRaw):
             _mult_cal_one(data, block, idx, cals, mult)
 
 
-def _read_segments_c(raw, data, idx, fi, start, stop, cals, mult):
-    """Read chunk of vectorized raw data."""
-    n_samples = raw._raw_extras[fi]["n_samples"]
-    fmt = raw._raw_extras[fi]["fmt"]
-    dtype = _fmt_dtype_dict[fmt]
-    n_bytes = _fmt_byte_dict[fmt]
-    n_channels = raw._raw_extras[fi]["orig_nchan"]
-    block = np.zeros((n_channels, stop - start))
-    with open(raw._filenames[fi], "rb", buffering=0) as fid:
-        ids = np.arange(idx.start, idx.stop) if isinstance(idx, slice) else idx
-        for ch_id in ids:
-            fid.seek(start * n_bytes + ch_id * n_bytes * n_samples)
-            block[ch_id] = np.fromfile(fid, dtype, stop - start)
-    _mult_cal_one(data, block, idx, cals, mult)
-
-
 def _read_mrk(fname):
     """Read annotations from a vmrk/amrk file.
 
@@ -993,7 +977,7 @@ class _BVEventParser(_DefaultEventParser):
 
 
 def _check_bv_annot(descriptions):
-    markers_basename = set([dd.rstrip("0123456789 ") for dd in descriptions])
+    markers_basename = set(dd.rstrip("0123456789 ") for dd in np.unique(descriptions))
     bv_markers = set(_BV_EVENT_IO_OFFSETS.keys()).union(
         set(_OTHER_ACCEPTED_MARKERS.keys())
     )
@@ -8,6 +8,7 @@
 import datetime
 import re
 import shutil
+from contextlib import nullcontext
 from pathlib import Path
 
 import numpy as np
@@ -608,6 +609,46 @@ def test_brainvision_vectorized_data():
     assert_allclose(raw._data[:, :2], first_two_samples_all_chs)
 
 
+def test_brainvision_lazy_reads(tmp_path):
+    """Test reading subsets of BrainVision data without preloading."""
+    for fname, ctx in (
+        (vhdr_path, nullcontext()),  # multiplexed
+        (vhdr_old_path, pytest.warns(RuntimeWarning, match="filter|DataPoints")),
+    ):
+        with ctx:
+            raw = read_raw_brainvision(fname, preload=True)
+            raw_lazy = read_raw_brainvision(fname)
+        for picks, start, stop in (([3, 1, 1], 17, 200), (slice(2, 9), 0, None)):
+            assert_array_equal(
+                raw_lazy.get_data(picks, start, stop), raw.get_data(picks, start, stop)
+            )
+        # no map is kept between reads
+        assert "mmap" not in raw_lazy._raw_extras[0]
+    # truncated data, also after data have been read
+    for ff in (vhdr_path, vmrk_path, eeg_path):
+        shutil.copyfile(ff, tmp_path / ff.name)
+    raw = read_raw_brainvision(tmp_path / vhdr_path.name)
+    raw.get_data(start=0, stop=10)
+    with open(tmp_path / eeg_path.name, "r+b") as fid:
+        fid.truncate(eeg_path.stat().st_size // 2)
+    with pytest.raises(RuntimeError, match="Incorrect number of samples"):
+        raw.get_data()
+    with pytest.raises(RuntimeError, match="Incorrect number of samples"):
+        raw.load_data()
+    # the file is not held open
+    (tmp_path / eeg_path.name).rename(tmp_path / "moved.eeg")
+    # truncated vectorized data, where the header gives the number of samples
+    eeg_old_path = vhdr_old_path.with_suffix(".eeg")
+    for ff in (vhdr_old_path, vhdr_old_path.with_suffix(".vmrk"), eeg_old_path):
+        shutil.copyfile(ff, tmp_path / ff.name)
+    with pytest.warns(RuntimeWarning, match="filter|DataPoints"):
+        raw = read_raw_brainvision(tmp_path / vhdr_old_path.name)
+    with open(tmp_path / eeg_old_path.name, "r+b") as fid:
+        fid.truncate(eeg_old_path.stat().st_size // 2)
+    with pytest.raises(RuntimeError, match="Incorrect number of samples"):
+        raw.get_data(start=0, stop=10)
+
+
 def test_coodinates_extraction():
     """Test reading of [Coordinates] section if present."""
     # vhdr 2 has a Coordinates section
@@ -333,10 +333,11 @@ def _read_ch(fid, subtype, samp, dtype_byte, dtype=None):
     # BDF
     if subtype == "bdf":
         ch_data = np.fromfile(fid, dtype=dtype, count=samp * dtype_byte)
-        ch_data = ch_data.reshape(-1, 3).astype(INT32)
-        ch_data = (ch_data[:, 0]) + (ch_data[:, 1] << 8) + (ch_data[:, 2] << 16)
-        # 24th bit determines the sign
-        ch_data[ch_data >= (1 << 23)] -= 1 << 24
+        # view each 3-byte sample (preceded by one extra byte) as an int32 so
+        # that an arithmetic shift drops the extra byte and extends the sign
+        buf = np.empty(len(ch_data) + 1, np.uint8)
+        buf[1:] = ch_data
+        ch_data = np.ndarray((len(ch_data) // 3,), INT32, buf, 0, (3,)) >> 8
 
     # GDF data and EDF data
     else:
@@ -374,6 +375,28 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
     # Otherwise we can end up with e.g. 18,181 chunks for a 20 MB file!
     # Let's do ~10 MB chunks:
     n_per = max(10 * 1024 * 1024 // (ch_offsets[-1] * dtype_byte), 1)
+
+    # Channels with the same number of samples per block (and the same stim
+    # handling) are decoded together, the annotation channel(s) separately
+    is_tal = np.isin(read_sel, tal_idx)
+    data_ii = np.where(~is_tal[: len(idx_arr)])[0]
+    assert (read_sel[data_ii] == orig_sel[idx_arr[data_ii]]).all()
+    tal_sel = read_sel[is_tal]
+    ch_groups = list()
+    for n_samp in np.unique(n_samps[read_sel[data_ii]]):
+        for is_stim in (False, True):
+            this_ii = data_ii[
+                (n_samps[read_sel[data_ii]] == n_samp)
+                & (np.isin(idx_arr[data_ii], stim_channel_idxs) == is_stim)
+            ]
+            if len(this_ii) == 0:
+                continue
+            orig_idx = idx_arr[this_ii]
+            cols = ch_offsets[read_sel[this_ii]][:, np.newaxis] + np.arange(n_samp)
+            if (np.diff(cols.ravel()) == 1).all():  # use a view when possible
+                cols = slice(cols[0, 0], cols[-1, -1] + 1)
+            ch_groups.append((n_samp, is_stim, orig_idx, cols))
+
     with open(filenames, "rb", buffering=0) as fid:
         # Extract data
         start_offset = data_offset + block_start_idx * ch_offsets[-1] * dtype_byte
@@ -383,7 +406,7 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
         # row. Ignore TAL/annotations channel and only store `orig_sel`
         ones = np.zeros((len(orig_sel), data.shape[-1]), dtype=data.dtype)
         # save how many samples have already been read per channel
-        n_smp_read = [0 for _ in range(len(orig_sel))]
+        n_smp_read = np.zeros(len(orig_sel), int)
 
         # read data in chunks
         for ai in range(0, len(r_lims), n_per):
@@ -397,63 +420,64 @@ def _read_segment_file(data, idx, fi, start, stop, raw_extras, filenames, cals,
             r_sidx = r_lims[ai][0]
             r_eidx = buf_len * (n_read - 1) + r_lims[ai + n_read - 1][1]
 
-            # loop over selected channels, ci=channel selection
-            for ii, ci in enumerate(read_sel):
-                # This now has size (n_chunks_read, n_samp[ci])
-                ch_data = many_chunk[:, ch_offsets[ci] : ch_offsets[ci + 1]].copy()
-
-                # annotation channel has to be treated separately
-                if ci in tal_idx:
-                    tal_data.append(ch_data)
-                    continue
-
-                orig_idx = idx_arr[ii]
-                ch_data = ch_data * cal[orig_idx]
-                ch_data += offsets[orig_idx]
-                ch_data *= gains[orig_idx]
-
-                assert ci == orig_sel[orig_idx]
+            # annotation channel has to be treated separately
+            for ci in tal_sel:
+                ch_data = many_chunk[:, ch_offsets[ci] : ch_offsets[ci + 1]]
+                tal_data.append(ch_data.copy())
+
+            for n_samp, is_stim, orig_idx, cols in ch_groups:
+                # This now has size (n_ch, n_chunks_read, n_samp)
+                ch_data = many_chunk[:, cols].reshape(n_read, len(orig_idx), n_samp)
+                ch_data = np.multiply(
+                    ch_data.transpose(1, 0, 2),
+                    cal[orig_idx][:, np.newaxis, np.newaxis],
+                    order="C",
+                )
+                ch_data += offsets[orig_idx][:, np.newaxis, np.newaxis]
+                ch_data *= gains[orig_idx][:, np.newaxis, np.newaxis]
 
-                if n_samps[ci] != buf_len:
-                    if orig_idx in stim_channel_idxs:
+                if n_samp != buf_len:
+                    if is_stim:
                         # Stim channel will be interpolated
-                        old = np.linspace(0, 1, n_samps[ci] + 1, True)
+                        old = np.linspace(0, 1, n_samp + 1, True)
                         new = np.linspace(0, 1, buf_len, False)
-                        ch_data = np.append(ch_data, np.zeros((len(ch_data), 1)), -1)
+                        ch_data = np.append(
+                            ch_data, np.zeros(ch_data.shape[:2] + (1,)), -1
+                        )
                         ch_data = interp1d(old, ch_data, kind="zero", axis=-1)(new)
-                elif orig_idx in stim_channel_idxs:
+                elif is_stim:
                     ch_data = np.bitwise_and(ch_data.astype(int), 2**17 - 1)
 
-                one_i = ch_data.ravel()[r_sidx:r_eidx]
+                one_i = ch_data.reshape(len(orig_idx), -1)[:, r_sidx:r_eidx]
 
                 # note how many samples have been read
-                smp_read = n_smp_read[orig_idx]
-                ones[orig_idx, smp_read : smp_read + len(one_i)] = one_i
-                n_smp_read[orig_idx] += len(one_i)
+                smp_read = n_smp_read[orig_idx[0]]
+                ones[orig_idx, smp_read : smp_read + one_i.shape[1]] = one_i
+                n_smp_read[orig_idx] += one_i.shape[1]
 
         # skip if no data was requested, ie. only annotations were read
-        if sum(n_smp_read) > 0:
+        if n_smp_read.sum() > 0:
             # expected number of samples, equals maximum sfreq
             smp_exp = data.shape[-1]
-            assert max(n_smp_read) == smp_exp
+            assert n_smp_read.max() == smp_exp
 
             # resample data after loading all chunks to prevent edge artifacts
             resampled = False
-            for i, smp_read in enumerate(n_smp_read):
+            for smp_read in np.unique(n_smp_read):
                 # nothing read, nothing to resample
-                if smp_read == 0:
+                if smp_read in (0, smp_exp):
                     continue
                 # upsample if n_samples is lower than from highest sfreq
-                if smp_read != smp_exp:
-                    assert (ones[i, smp_read:] == 0).all()  # sanity check
-                    ones[i, :] = resample(
-                        ones[i, :smp_read].astype(np.float64),
-                        smp_exp,
-                        smp_read,
-                        npad=0,
-                        axis=-1,
-                    )
-                    resampled = True
+                rows = np.where(n_smp_read == smp_read)[0]
+                assert (ones[rows, smp_read:] == 0).all()  # sanity check
+                ones[rows, :] = resample(
+                    ones[rows, :smp_read].astype(np.float64),
+                    smp_exp,
+                    smp_read,
+                    npad=0,
+                    axis=-1,
+                )
+                resampled = True
 
             # give warning if we resampled a subselection
             if resampled and raw_extras["nsamples"] != (stop - start):
@@ -208,6 +208,29 @@ def test_bdf_data():
     assert (raw_py.info["chs"][63]["loc"]).any()
 
 
+def test_bdf_24bit_decode(tmp_path):
+    """Test decoding of 24-bit BDF samples."""
+    want = np.array([0, 1, -1, 2**23 - 1, -(2**23), 12345, -12345], np.int32)
+    fname = tmp_path / "test.bin"
+    fname.write_bytes(want.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3].tobytes())
+    with open(fname, "rb") as fid:
+        got = _read_ch(fid, "bdf", len(want), 3, np.uint8)
+    assert_array_equal(got, want)
+
+
+def test_edf_lazy_segments():
+    """Test lazy reading of segments and duplicate picks."""
+    for reader, fname in ((read_raw_bdf, bdf_path), (read_raw_edf, edf_path)):
+        raw = reader(fname, preload=True)
+        raw_lazy = reader(fname)
+        n_times = raw.n_times
+        picks = [0, 5, 5, len(raw.ch_names) - 1]
+        start, stop = n_times // 7, n_times // 7 + n_times // 3
+        assert_array_equal(
+            raw_lazy.get_data(picks, start, stop), raw.get_data(picks, start, stop)
+        )
+
+
 @testing.requires_testing_data
 def test_bdf_crop_save_stim_channel(tmp_path):
     """Test EDF with various sampling rates."""
@@ -10,15 +10,16 @@
 import copy
 import os
 import os.path as op
+from contextlib import nullcontext
 
 import numpy as np
 
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import read_meas_info
 from ..._fiff.open import _fiff_get_fid, _get_next_fname, fiff_open
-from ..._fiff.tag import _call_dict, read_tag
+from ..._fiff.tag import _call_dict, _simple_dict, read_tag
 from ..._fiff.tree import dir_tree_find
-from ..._fiff.utils import _mult_cal_one
+from ..._fiff.utils import _FileMmap, _mult_cal_one
 from ...annotations import Annotations, _read_annotations_fif
 from ...channels import fix_mag_coil_types
 from ...event import AcqParserFIF
@@ -63,7 +64,7 @@ class Raw(BaseRaw):
         generally not be loaded directly, but should first be processed using
         SSS/tSSS to remove the compensation signals that may also affect brain
         activity. Can also be "yes" to load without eliciting a warning.
-    %(preload)s
+    %(preload_fif)s
     %(on_split_missing)s
     %(verbose)s
 
@@ -99,6 +100,7 @@ class Raw(BaseRaw):
         verbose=None,
     ):
         raws = []
+        mmap = _is_mmap(preload)
         do_check_ext = not _file_like(fname)
         next_fname = fname
         while next_fname is not None:
@@ -155,7 +157,7 @@ class Raw(BaseRaw):
 
             self._annotations += annot
 
-        if preload:
+        if preload and not mmap:
             self._preload_data(preload)
         else:
             self.preload = False
@@ -186,11 +188,15 @@ class Raw(BaseRaw):
             # filename
             fname = str(_check_fname(fname, "read", True, "fname"))
             ext = os.path.splitext(fname)[1].lower()
+            if _is_mmap(preload) and ".gz" in ext:
+                raise ValueError(
+                    'preload="mmap" cannot be used with compressed (.gz) files'
+                )
             whole_file = preload if ".gz" in ext else False
             del ext
         else:
             # file-like
-            if not preload:
+            if not preload or _is_mmap(preload):
                 raise ValueError("preload must be used with file-like objects")
             whole_file = True
         fname_rep = _get_fname_rep(fname)
@@ -338,6 +344,8 @@ class Raw(BaseRaw):
         )
         raw_extras["bounds"] = bounds
         assert len(raw_extras["bounds"]) == len(raw_extras["ent"]) + 1
+        if _is_mmap(preload):
+            raw_extras["mmap"] = _RawFifMmap(fname)
         # store the original buffer size
         buffer_size_sec = np.median(raw_extras["nsamp"]) / info["sfreq"]
         del raw_extras["first"]
@@ -397,7 +405,9 @@ class Raw(BaseRaw):
     def _read_segment_file(self, data, idx, fi, start, stop, cals, mult):
         """Read a segment of data from a file."""
         n_bad = 0
-        with _fiff_get_fid(self._filenames[fi]) as fid:
+        mmap = self._raw_extras[fi].get("mmap")
+        fid_ctx = _fiff_get_fid(self._filenames[fi]) if mmap is None else nullcontext()
+        with fid_ctx as fid:
             bounds = self._raw_extras[fi]["bounds"]
             ents = self._raw_extras[fi]["ent"]
             nchan = self._raw_extras[fi]["orig_nchan"]
@@ -417,6 +427,20 @@ class Raw(BaseRaw):
                 # only read data if it exists
                 if ent is None:
                     continue  # just use zeros for gaps
+                if mmap is not None:
+                    one = mmap.get_buffer(ent, nsamp, nchan)
+                    if one is None:
+                        n_bad += picksamp
+                        continue
+                    # only the requested samples and channels get converted
+                    _mult_cal_one(
+                        data[:, this_start:this_stop],
+                        one[first_pick:last_pick].T[idx],
+                        slice(None),
+                        cals,
+                        mult,
+                    )
+                    continue
                 # faster to always read full tag, taking advantage of knowing the header
                 # already (cutting out some of read_tag) ...
                 fid.seek(ent.pos + 16, 0)
@@ -487,6 +511,32 @@ class Raw(BaseRaw):
         return self._acqparser
 
 
+def _is_mmap(preload):
+    return isinstance(preload, str) and preload == "mmap"
+
+
+# FIF data buffer tag types and their on-disk (big-endian) dtypes
+_mmap_dtypes = {
+    FIFF.FIFFT_DAU_PACK16: _simple_dict[FIFF.FIFFT_DAU_PACK16],
+    FIFF.FIFFT_SHORT: _simple_dict[FIFF.FIFFT_SHORT],
+    FIFF.FIFFT_FLOAT: _simple_dict[FIFF.FIFFT_FLOAT],
+    FIFF.FIFFT_DOUBLE: _simple_dict[FIFF.FIFFT_DOUBLE],
+    FIFF.FIFFT_INT: _simple_dict[FIFF.FIFFT_INT],
+    FIFF.FIFFT_COMPLEX_FLOAT: ">c8",
+    FIFF.FIFFT_COMPLEX_DOUBLE: ">c16",
+}
+
+
+class _RawFifMmap(_FileMmap):
+    """Lazily memory-map a FIF file to expose its data buffers as views."""
+
+    def get_buffer(self, ent, nsamp, nchan):
+        """Get a read-only (nsamp, nchan) view of a data buffer tag."""
+        dtype = _mmap_dtypes[ent.type]
+        offset = ent.pos + 16  # skip the tag header
+        return self.get(offset, (nsamp, nchan), dtype)  # None if truncated
+
+
 def _check_entry(first, nent):
     """Sanity check entries."""
     if first >= nent:
@@ -516,7 +566,7 @@ def read_raw_fif(
         generally not be loaded directly, but should first be processed using
         SSS/tSSS to remove the compensation signals that may also affect brain
         activity. Can also be "yes" to load without eliciting a warning.
-    %(preload)s
+    %(preload_fif)s
     %(on_split_missing)s
     %(verbose)s
 
@@ -1452,6 +1452,26 @@ def test_resample(tmp_path, preload, n, npad, method):
     assert len(raw) == 10
 
 
+def test_resample_polyphase_not_preloaded(tmp_path):
+    """Test resampling non-preloaded data in blocks with polyphase."""
+    raw = read_raw_fif(ctf_comp_fname).pick([0, 1, 50, 300])
+    raw = concatenate_raws([raw, raw.copy()])
+    raw_preload = raw.copy().load_data()
+    for sfreq in (100.0, 960.0):
+        want = raw_preload.copy().resample(sfreq, method="polyphase")
+        got = raw.copy().resample(sfreq, method="polyphase")
+        assert got.preload
+        assert_array_equal(got._data, want._data)
+        # written to disk as it is computed
+        fname = tmp_path / "resamp.dat"
+        got = raw.copy().resample(sfreq, method="polyphase", preload=fname)
+        assert isinstance(got._data, np.memmap)
+        assert_array_equal(got._data, want._data)
+        del got
+    with pytest.raises(TypeError, match="preload must be"):
+        raw.copy().resample(100.0, method="polyphase", preload=True)
+
+
 def test_resample_stim():
     """Test stim_picks argument."""
     data = np.ones((2, 1000))
@@ -1971,6 +1991,64 @@ def test_memmap(tmp_path):
     # require them.
 
 
+def test_preload_mmap(tmp_path):
+    """Test reading memory-mapped data buffers with preload="mmap"."""
+    raw = read_raw_fif(ctf_comp_fname)
+    raw_mmap = read_raw_fif(ctf_comp_fname, preload="mmap")
+    assert not raw_mmap.preload
+    assert raw_mmap._raw_extras[0]["mmap"] is not None
+    # random windows, channel subsets, and projection/compensation
+    picks = [0, 5, 3, 200]
+    for start, stop in [(0, 10), (17, 120), (0, raw.n_times), (230, 241)]:
+        assert_array_equal(raw_mmap[:, start:stop][0], raw[:, start:stop][0])
+        assert_array_equal(raw_mmap[picks, start:stop][0], raw[picks, start:stop][0])
+    raw.apply_gradient_compensation(1)
+    raw_mmap.apply_gradient_compensation(1)
+    assert_allclose(raw_mmap.get_data(), raw.get_data(), rtol=1e-12, atol=0)
+    # copies and pickling do not carry the map
+    raw_copy = raw_mmap.copy()
+    assert raw_copy._raw_extras[0]["mmap"]._mmap is None
+    assert_array_equal(raw_copy.get_data(), raw_mmap.get_data())
+    raw_pickle = pickle.loads(pickle.dumps(raw_mmap))
+    assert_array_equal(raw_pickle.get_data(), raw_mmap.get_data())
+    # split files, one map per split
+    raw = read_raw_fif(ctf_comp_fname, preload=True).crop(0, 0.4)
+    raw = concatenate_raws([raw.copy() for _ in range(20)])
+    out_fname = tmp_path / "test_raw.fif"
+    raw.save(out_fname, split_size="2MB", buffer_size_sec=0.05)
+    raw_mmap = read_raw_fif(out_fname, preload="mmap")
+    assert len(raw_mmap.filenames) > 1
+    assert_array_equal(raw_mmap[:10, 150:3500][0], raw[:10, 150:3500][0])
+    raw_mmap.load_data()
+    assert raw_mmap.preload
+    assert_array_equal(raw_mmap.get_data(), raw.get_data())
+    with pytest.raises(ValueError, match="file-like"):
+        with open(ctf_comp_fname, "rb") as fid:
+            read_raw_fif(fid, preload="mmap")
+    gz_fname = tmp_path / "test_raw.fif.gz"
+    raw.save(gz_fname)
+    with pytest.raises(ValueError, match="compressed"):
+        read_raw_fif(gz_fname, preload="mmap")
+
+
+def test_save_read_ahead(tmp_path):
+    """Test that buffers read ahead while writing are written in order."""
+    rng = np.random.default_rng(0)
+    info = create_info(5, 1000.0, "eeg")
+    raw = RawArray(rng.standard_normal((5, 3000)) * 1e-5, info)
+    out_fname = tmp_path / "test_raw.fif"
+    for kwargs in (dict(), dict(buffer_size_sec=0.01)):
+        raw.save(out_fname, overwrite=True, fmt="double", **kwargs)
+        raw_read = read_raw_fif(out_fname)
+        assert_array_equal(raw_read.get_data(), raw.get_data())
+    # acquisition skips are not read, and are read back as zeros
+    raw.set_annotations(Annotations([0.5], [0.5], ["BAD_ACQ_SKIP"]))
+    raw.save(out_fname, overwrite=True, fmt="double", buffer_size_sec=0.1)
+    data = raw.get_data()
+    data[:, 500:1000] = 0
+    assert_array_equal(read_raw_fif(out_fname).get_data(), data)
+
+
 # These are slow on Azure Windows so let's do a subset
 @pytest.mark.parametrize(
     "kind",
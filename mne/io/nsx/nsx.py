@@ -9,7 +9,7 @@ import numpy as np
 
 from ..._fiff.constants import FIFF
 from ..._fiff.meas_info import _empty_info
-from ..._fiff.utils import _file_size, _read_segments_file
+from ..._fiff.utils import _file_size, _read_segments_mmap
 from ...annotations import Annotations
 from ...utils import fill_doc, logger, warn
 from ..base import BaseRaw, _get_scaling
@@ -232,7 +232,7 @@ class RawNSX(BaseRaw):
                 continue
             i_start = max(start, first_samp)
             i_stop = min(stop, first_samp + recording_extent)
-            _read_segments_file(
+            _read_segments_mmap(
                 self,
                 data[:, i_start - start : i_stop - start],
                 idx,
@@ -242,9 +242,8 @@ class RawNSX(BaseRaw):
                 cals,
                 mult,
                 dtype,
-                n_channels=None,
                 offset=offset,
-                trigger_ch=None,
+                n_samples=recording_extent,
             )
 
 
@@ -0,0 +1,8 @@
+"""Lazy preprocessing pipelines for raw data."""
+
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+from .pipeline import RawPipeline
+
+__all__ = ["RawPipeline"]
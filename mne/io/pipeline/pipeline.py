@@ -0,0 +1,570 @@
+"""Lazy preprocessing of raw data."""
+
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import numpy as np
+from scipy import signal
+
+from ..._fiff.pick import _picks_to_idx, pick_types
+from ...annotations import _annotations_starts_stops
+from ...cuda import _smart_pad
+from ...filter import (
+    _LOCAL_PADS,
+    _check_notch_widths,
+    _check_resamp_noop,
+    _filt_check_picks,
+    _filt_update_info,
+    _notch_stop_bands,
+    _prep_polyphase,
+    _prep_polyphase_blocks,
+    _resamp_ratio_len,
+    _resample_polyphase_block,
+    create_filter,
+)
+from ...utils import (
+    _check_option,
+    _pl,
+    _validate_type,
+    copy_doc,
+    fill_doc,
+    logger,
+    verbose,
+)
+from ..array import RawArray
+from ..base import BaseRaw
+
+
+@fill_doc
+class RawPipeline(BaseRaw):
+    """Raw data whose preprocessing is only computed when the data are read.
+
+    Parameters
+    ----------
+    raw : instance of Raw
+        The raw data to preprocess. The data of a preloaded instance are
+        shared with (not copied to) the pipeline, so they should not be
+        modified in place afterward.
+    %(verbose)s
+
+    See Also
+    --------
+    mne.io.Raw.lazy
+
+    Notes
+    -----
+    :meth:`filter` and :meth:`notch_filter` (with ``method='fir'``),
+    :meth:`resample` (with ``method='polyphase'``), :meth:`set_eeg_reference`,
+    :meth:`apply_proj`, :meth:`crop` and :meth:`pick` only record the
+    operation. The data are computed, one buffer at a time, when they are read
+    (e.g., with :meth:`get_data`, :meth:`save`, :class:`mne.Epochs` or
+    :meth:`load_data`), so preprocessing a recording that is not preloaded
+    takes a single pass over the data and only holds the samples of each
+    buffer (plus the filter context) in memory. Other operations (e.g., IIR
+    filtering) require :meth:`load_data` to be called first, after which the
+    instance behaves like any preloaded raw instance.
+
+    Consecutive re-referencing and projection steps are fused into a single
+    matrix, and consecutive FIR filters applied to the same channels are
+    fused into a single kernel. Fused filters give the same result as
+    applying them one after the other except within the edge transients of
+    each contiguous segment, where the signal is only padded once. As for a
+    single raw file, concatenated recordings are resampled as one segment.
+
+    .. versionadded:: 1.7
+    """
+
+    @verbose
+    def __init__(self, raw, *, verbose=None):
+        _validate_type(raw, BaseRaw, "raw")
+        # the data of preloaded instances are shared copy-on-write
+        source = raw.copy(view=True)
+        super().__init__(
+            source.info.copy(),
+            preload=False,
+            first_samps=(source.first_samp,),
+            last_samps=(source.last_samp,),
+            raw_extras=[dict(source=source, steps=[], first_samp=source.first_samp)],
+            orig_format=source.orig_format,
+            dtype=source._dtype,
+            buffer_size_sec=source.buffer_size_sec,
+            verbose=verbose,
+        )
+        self.set_annotations(source.annotations)
+
+    def _add_step(self, step):
+        if len(self._raw_extras) != 1:
+            raise NotImplementedError(
+                "Preprocessing steps cannot be recorded for concatenated pipelines, "
+                "record them before concatenating or call load_data() first"
+            )
+        extras = self._raw_extras[0]
+        steps = list(extras["steps"])
+        fused = step.fuse(steps[-1]) if len(steps) else None
+        if fused is None:
+            steps.append(step)
+        else:
+            logger.debug(f"Fusing {type(step).__name__} with the previous step")
+            steps[-1] = fused
+        extras["steps"] = steps
+
+    def _apply_operator(self, operator):
+        """Record a linear operator acting on the current channels."""
+        sel = self._read_picks[0]
+        full = np.eye(self._raw_extras[0]["orig_nchan"])
+        full[np.ix_(sel, sel)] = operator
+        self._add_step(_LinearStep(full))
+        # active projectors are applied by the recorded steps
+        self._projector = None
+
+    def _add_fir(self, h, phase, picks, skip_by_annotation, pad):
+        _check_option("pad", pad, _LOCAL_PADS, extra="for lazy filtering")
+        n_pad = len(h)  # the signal is padded by the original filter length
+        if phase == "zero-double":
+            h = np.convolve(h, h[::-1])
+        delay = (len(h) - 1) // 2 if phase.startswith("zero") else 0
+        onsets, ends = _annotations_starts_stops(self, skip_by_annotation, invert=True)
+        logger.info(
+            "Recording a filter of %d contiguous segment%s" % (len(onsets), _pl(onsets))
+        )
+        offset = self.first_samp - self._raw_extras[0]["first_samp"]
+        segments = np.array([onsets, ends], int).T + offset
+        picks = self._read_picks[0][picks]
+        self._add_step(_FIRStep(h, delay, n_pad, picks, segments, pad))
+
+    @copy_doc(BaseRaw.filter)
+    def filter(
+        self,
+        l_freq,
+        h_freq,
+        picks=None,
+        filter_length="auto",
+        l_trans_bandwidth="auto",
+        h_trans_bandwidth="auto",
+        n_jobs=None,
+        method="fir",
+        iir_params=None,
+        phase="zero",
+        fir_window="hamming",
+        fir_design="firwin",
+        skip_by_annotation=("edge", "bad_acq_skip"),
+        pad="reflect_limited",
+        verbose=None,
+    ):
+        kwargs = dict(
+            picks=picks,
+            filter_length=filter_length,
+            l_trans_bandwidth=l_trans_bandwidth,
+            h_trans_bandwidth=h_trans_bandwidth,
+            n_jobs=n_jobs,
+            method=method,
+            iir_params=iir_params,
+            phase=phase,
+            fir_window=fir_window,
+            fir_design=fir_design,
+            skip_by_annotation=skip_by_annotation,
+            pad=pad,
+            verbose=verbose,
+        )
+        if self.preload:
+            return super().filter(l_freq, h_freq, **kwargs)
+        return self._filter_lazy(l_freq, h_freq, **kwargs)
+
+    @verbose
+    def _filter_lazy(
+        self,
+        l_freq,
+        h_freq,
+        *,
+        picks,
+        filter_length,
+        l_trans_bandwidth,
+        h_trans_bandwidth,
+        n_jobs,
+        method,
+        iir_params,
+        phase,
+        fir_window,
+        fir_design,
+        skip_by_annotation,
+        pad,
+        verbose=None,
+    ):
+        _check_lazy_method(method, "fir", "filtering")
+        if pad is None:
+            pad = "edge"
+        update_info, picks = _filt_check_picks(self.info, picks, l_freq, h_freq)
+        h = create_filter(
+            None,
+            self.info["sfreq"],
+            l_freq,
+            h_freq,
+            filter_length,
+            l_trans_bandwidth,
+            h_trans_bandwidth,
+            method,
+            iir_params,
+            phase,
+            fir_window,
+            fir_design,
+        )
+        self._add_fir(h, phase, picks, skip_by_annotation, pad)
+        _filt_update_info(self.info, update_info, l_freq, h_freq)
+        return self
+
+    @copy_doc(BaseRaw.notch_filter)
+    def notch_filter(
+        self,
+        freqs,
+        picks=None,
+        filter_length="auto",
+        notch_widths=None,
+        trans_bandwidth=1.0,
+        n_jobs=None,
+        method="fir",
+        iir_params=None,
+        mt_bandwidth=None,
+        p_value=0.05,
+        phase="zero",
+        fir_window="hamming",
+        fir_design="firwin",
+        pad="reflect_limited",
+        skip_by_annotation=("edge", "bad_acq_skip"),
+        verbose=None,
+    ):
+        kwargs = dict(
+            picks=picks,
+            filter_length=filter_length,
+            notch_widths=notch_widths,
+            trans_bandwidth=trans_bandwidth,
+            n_jobs=n_jobs,
+            method=method,
+            iir_params=iir_params,
+            mt_bandwidth=mt_bandwidth,
+            p_value=p_value,
+            phase=phase,
+            fir_window=fir_window,
+            fir_design=fir_design,
+            pad=pad,
+            skip_by_annotation=skip_by_annotation,
+            verbose=verbose,
+        )
+        if self.preload:
+            return super().notch_filter(freqs, **kwargs)
+        return self._notch_filter_lazy(freqs, **kwargs)
+
+    @verbose
+    def _notch_filter_lazy(
+        self,
+        freqs,
+        *,
+        picks,
+        filter_length,
+        notch_widths,
+        trans_bandwidth,
+        n_jobs,
+        method,
+        iir_params,
+        mt_bandwidth,
+        p_value,
+        phase,
+        fir_window,
+        fir_design,
+        pad,
+        skip_by_annotation,
+        verbose=None,
+    ):
+        _check_lazy_method(method, "fir", "notch filtering")
+        if freqs is None:
+            raise ValueError("freqs=None can only be used with method spectrum_fit")
+        freqs = np.atleast_1d(freqs)
+        picks = _picks_to_idx(self.info, picks, exclude=(), none="data_or_ica")
+        notch_widths = _check_notch_widths(freqs, notch_widths)
+        lows, highs = _notch_stop_bands(freqs, notch_widths, trans_bandwidth)
+        tb_2 = trans_bandwidth / 2.0
+        h = create_filter(
+            None,
+            self.info["sfreq"],
+            highs,
+            lows,
+            filter_length,
+            tb_2,
+            tb_2,
+            method,
+            iir_params,
+            phase,
+            fir_window,
+            fir_design,
+        )
+        self._add_fir(h, phase, picks, skip_by_annotation, pad)
+        return self
+
+    @copy_doc(BaseRaw.resample)
+    def resample(
+        self,
+        sfreq,
+        *,
+        npad="auto",
+        window="auto",
+        stim_picks=None,
+        n_jobs=None,
+        events=None,
+        pad="auto",
+        method="fft",
+        preload=None,
+        verbose=None,
+    ):
+        kwargs = dict(
+            npad=npad,
+            window=window,
+            stim_picks=stim_picks,
+            n_jobs=n_jobs,
+            events=events,
+            pad=pad,
+            method=method,
+            preload=preload,
+            verbose=verbose,
+        )
+        if self.preload:
+            return super().resample(sfreq, **kwargs)
+        return self._resample_lazy(sfreq, **kwargs)
+
+    @verbose
+    def _resample_lazy(
+        self,
+        sfreq,
+        *,
+        npad,
+        window,
+        stim_picks,
+        n_jobs,
+        events,
+        pad,
+        method,
+        preload,
+        verbose=None,
+    ):
+        _check_lazy_method(method, "polyphase", "resampling")
+        if preload is not None:
+            raise ValueError(
+                "preload must be None when resampling lazily, got "
+                f"{repr(preload)}, call load_data() first to resample to a file"
+            )
+        sfreq = float(sfreq)
+        o_sfreq = float(self.info["sfreq"])
+        if _check_resamp_noop(sfreq, o_sfreq):
+            return self
+        if stim_picks is None:
+            stim_picks = pick_types(
+                self.info, meg=False, ref_meg=False, stim=True, exclude=[]
+            )
+        else:
+            stim_picks = _picks_to_idx(
+                self.info, stim_picks, exclude=(), with_ref_meg=False
+            )
+        n_orig = self.n_times
+        ratio, n_new = _resamp_ratio_len(sfreq, o_sfreq, n_orig)
+        up, down, poly_window = _prep_polyphase(ratio, n_orig, n_new, window)
+        poly = _prep_polyphase_blocks(
+            n_orig, up=up, down=down, pad=pad, window=poly_window
+        )
+        assert poly["n_out"] == n_new
+        extras = self._raw_extras[0]
+        step = _ResampleStep(
+            poly,
+            self.first_samp - extras["first_samp"],
+            self._read_picks[0][stim_picks],
+            extras["orig_nchan"],
+        )
+        self._add_step(step)
+        self._cropped_samp = int(np.round(self._cropped_samp * ratio))
+        self._first_samps = np.round(self._first_samps * ratio).astype(int)
+        self._last_samps = self._first_samps + n_new - 1
+        # later steps work on the resampled samples
+        extras["first_samp"] = int(self._first_samps[0])
+        lowpass = self.info.get("lowpass")
+        lowpass = np.inf if lowpass is None else lowpass
+        with self.info._unlock():
+            self.info["lowpass"] = min(lowpass, sfreq / 2.0)
+            self.info["sfreq"] = sfreq
+        if events is None:
+            return self
+        events = events.copy()
+        events[:, 0] = np.minimum(
+            np.round(events[:, 0] * ratio).astype(int), self.last_samp
+        )
+        return self, events
+
+    @copy_doc(BaseRaw.set_eeg_reference)
+    def set_eeg_reference(
+        self,
+        ref_channels="average",
+        projection=False,
+        ch_type="auto",
+        forward=None,
+        *,
+        joint=False,
+        verbose=None,
+    ):
+        kwargs = dict(
+            ref_channels=ref_channels,
+            projection=projection,
+            ch_type=ch_type,
+            forward=forward,
+            joint=joint,
+            verbose=verbose,
+        )
+        if self.preload or projection:
+            return super().set_eeg_reference(**kwargs)
+        return self._set_eeg_reference_lazy(**kwargs)
+
+    def _set_eeg_reference_lazy(self, **kwargs):
+        # re-referencing is linear, so referencing the identity matrix (one
+        # sample per channel) gives the operator to record
+        probe = RawArray(np.eye(len(self.ch_names)), self.info.copy(), verbose=False)
+        probe.set_eeg_reference(**kwargs)
+        self._apply_operator(probe._data)
+        # removed average reference projectors and the custom reference flag
+        with self.info._unlock():
+            for key in ("projs", "custom_ref_applied"):
+                self.info[key] = probe.info[key]
+        return self
+
+    @copy_doc(BaseRaw.apply_proj)
+    def apply_proj(self, verbose=None):
+        super().apply_proj(verbose=verbose)
+        if not self.preload and self._projector is not None:
+            self._apply_operator(self._projector)
+        return self
+
+
+def _check_lazy_method(method, allowed, kind):
+    if method != allowed:
+        raise NotImplementedError(
+            f"Only method={repr(allowed)} {kind} can be recorded by a RawPipeline, "
+            f"got method={repr(method)}, call load_data() first"
+        )
+
+
+class _LinearStep:
+    """Apply a matrix to the channels."""
+
+    def __init__(self, operator):
+        self.operator = operator
+        # only the rows that differ from the identity need to be computed
+        self.rows = np.where((operator != np.eye(len(operator))).any(axis=1))[0]
+
+    def fuse(self, prev):
+        if isinstance(prev, _LinearStep):
+            return _LinearStep(self.operator @ prev.operator)
+
+    def compute(self, read, start, stop):
+        x = read(start, stop)
+        out = x.copy()
+        out[self.rows] = self.operator[self.rows] @ x
+        return out
+
+
+class _FIRStep:
+    """Filter the rows in picks within each contiguous segment.
+
+    Samples outside of the segments are left untouched, and each segment is
+    padded at its edges like :func:`mne.filter._overlap_add_filter` does, so
+    each chunk gives the same result as filtering the whole segment.
+    """
+
+    def __init__(self, h, delay, n_pad, picks, segments, pad):
+        self.h = h
+        self.delay = delay  # output sample t is centered on input sample t
+        self.n_pad = n_pad
+        self.picks = picks
+        self.segments = segments
+        self.pad = pad
+
+    def fuse(self, prev):
+        if (
+            isinstance(prev, _FIRStep)
+            and prev.pad == self.pad
+            and np.array_equal(prev.picks, self.picks)
+            and np.array_equal(prev.segments, self.segments)
+        ):
+            h = np.convolve(prev.h, self.h)
+            delay = prev.delay + self.delay
+            # the padding must cover the reach of the fused filter
+            n_pad = max(prev.n_pad, self.n_pad, len(h) - delay, delay + 1)
+            return _FIRStep(h, delay, n_pad, self.picks, self.segments, self.pad)
+
+    def compute(self, read, start, stop):
+        n_h = len(self.h)
+        before, after = n_h - 1 - self.delay, self.delay
+        pieces = list()
+        lo, hi = start, stop
+        for s0, s1 in self.segments:
+            a, b = max(start, s0), min(stop, s1)
+            if a >= b:
+                continue
+            n_edge = max(min(self.n_pad, s1 - s0) - 1, 0)
+            r0, r1 = max(a - before, s0), min(b + after, s1)
+            # the padding is computed from the samples next to each edge
+            if a - before < s0:
+                r1 = max(r1, min(s0 + n_edge + 1, s1))
+            if b + after > s1:
+                r0 = min(r0, max(s1 - n_edge - 1, s0))
+            pieces.append((a, b, s0, s1, n_edge))
+            lo, hi = min(lo, r0), max(hi, r1)
+        x = read(lo, hi)
+        out = x[:, start - lo : stop - lo].copy()
+        if len(self.picks) == 0:
+            return out
+        x = x[self.picks]
+        for a, b, s0, s1, n_edge in pieces:
+            e0, e1 = a - before, b + after  # extended input samples
+            x_ext = np.zeros((len(x), e1 - e0))
+            c0, c1 = max(e0, s0), min(e1, s1)
+            x_ext[:, c0 - e0 : c1 - e0] = x[:, c0 - lo : c1 - lo]
+            if e0 < s0 and n_edge > 0:
+                edge = x[:, s0 - lo : s0 - lo + n_edge + 1]
+                left = np.array(
+                    [_smart_pad(e, (n_edge, 0), self.pad)[:n_edge] for e in edge]
+                )
+                p0 = max(e0, s0 - n_edge)
+                x_ext[:, p0 - e0 : s0 - e0] = left[:, p0 - s0 + n_edge :]
+            if e1 > s1 and n_edge > 0:
+                edge = x[:, s1 - lo - n_edge - 1 : s1 - lo]
+                right = np.array(
+                    [_smart_pad(e, (0, n_edge), self.pad)[-n_edge:] for e in edge]
+                )
+                p1 = min(e1, s1 + n_edge)
+                x_ext[:, s1 - e0 : p1 - e0] = right[:, : p1 - s1]
+            out[self.picks, a - start : b - start] = signal.oaconvolve(
+                x_ext, self.h[np.newaxis], mode="valid", axes=-1
+            )
+        return out
+
+
+class _ResampleStep:
+    """Resample all channels with polyphase filtering."""
+
+    def __init__(self, poly, in_start, stim_picks, n_chan):
+        self.poly = poly
+        self.in_start = in_start  # input sample of the first output sample
+        self.stim_picks = stim_picks
+        self.n_chan = n_chan
+
+    def fuse(self, prev):
+        return None
+
+    def compute(self, read, start, stop):
+        # align the block to the stim channel windows
+        up = self.poly["up"]
+        o_start = start // up * up
+        o_stop = min(-(-stop // up) * up, self.poly["n_out"])
+        out = np.empty((self.n_chan, o_stop - o_start))
+        _resample_polyphase_block(
+            lambda a, b: read(self.in_start + a, self.in_start + b),
+            o_start,
+            out,
+            poly=self.poly,
+            stim_picks=self.stim_picks,
+        )
+        return out[:, start - o_start : stop - o_start]
@@ -0,0 +1,2 @@
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
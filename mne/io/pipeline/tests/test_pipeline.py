@@ -0,0 +1,143 @@
+# License: BSD-3-Clause
+# Copyright the MNE-Python contributors.
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+
+from mne import Annotations, Epochs, create_info, find_events
+from mne.io import RawArray, RawPipeline, read_raw_fif
+
+
+@pytest.fixture()
+def raw_fname(tmp_path):
+    """Write a raw file with EEG and stim channels."""
+    rng = np.random.default_rng(0)
+    info = create_info(
+        [f"EEG {ii:03d}" for ii in range(5)] + ["STI 014"],
+        1000.0,
+        ["eeg"] * 5 + ["stim"],
+    )
+    data = rng.standard_normal((6, 20000)) * 1e-5
+    data[5] = 0
+    data[5, 3000:3010] = 1
+    data[5, 15000:15020] = 2
+    raw = RawArray(data, info)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    return fname
+
+
+def _get_data_chunked(raw, n):
+    return np.concatenate(
+        [
+            raw.get_data(start=start, stop=min(start + n, raw.n_times))
+            for start in range(0, raw.n_times, n)
+        ],
+        axis=1,
+    )
+
+
+@pytest.mark.parametrize("phase", ("zero", "zero-double", "minimum"))
+@pytest.mark.parametrize("pad", ("reflect_limited", "edge"))
+def test_pipeline_filter(raw_fname, phase, pad):
+    """Test that recorded filters match filtering the loaded data."""
+    raw = read_raw_fif(raw_fname)
+    raw.set_annotations(Annotations([12.0], [1.0], ["bad_acq_skip"]))
+    pipe = raw.lazy()
+    assert isinstance(pipe, RawPipeline)
+    pipe.crop(1, None).filter(1.0, 40.0, phase=phase, pad=pad)
+    pipe.notch_filter(50.0, picks=[0, 1, 2])
+    assert not pipe.preload
+    assert len(pipe._raw_extras[0]["steps"]) == 2
+    raw.load_data().crop(1, None).filter(1.0, 40.0, phase=phase, pad=pad)
+    raw.notch_filter(50.0, picks=[0, 1, 2])
+    assert pipe.info["highpass"] == raw.info["highpass"] == 1.0
+    assert pipe.info["lowpass"] == raw.info["lowpass"] == 40.0
+    want = raw.get_data()
+    got = pipe.get_data()
+    assert_allclose(got, want, rtol=1e-7, atol=1e-18)
+    assert_allclose(_get_data_chunked(pipe, 777), got, rtol=1e-10, atol=1e-20)
+    # the source is not modified
+    assert pipe._raw_extras[0]["source"].n_times == 20000
+
+
+def test_pipeline_fuse(raw_fname):
+    """Test fusing filters and linear operators."""
+    raw = read_raw_fif(raw_fname)
+    pipe = raw.lazy()
+    pipe.filter(1.0, None).filter(None, 40.0)
+    pipe.set_eeg_reference(["EEG 000"])
+    pipe.set_eeg_reference(projection=True).apply_proj()
+    steps = pipe._raw_extras[0]["steps"]
+    assert [type(step).__name__ for step in steps] == ["_FIRStep", "_LinearStep"]
+    assert pipe._projector is None
+    raw.load_data().filter(1.0, None).filter(None, 40.0)
+    raw.set_eeg_reference(["EEG 000"])
+    raw.set_eeg_reference(projection=True).apply_proj()
+    assert pipe.info["custom_ref_applied"] == raw.info["custom_ref_applied"]
+    assert all(proj["active"] for proj in pipe.info["projs"])
+    # the fused filter only differs within the edge transients
+    want, got = raw.get_data(), pipe.get_data()
+    assert_allclose(got[:, 5000:-5000], want[:, 5000:-5000], rtol=1e-7, atol=1e-18)
+    assert_allclose(got, want, atol=1e-7)
+
+
+def test_pipeline_resample(raw_fname, tmp_path):
+    """Test recording resampling, picks and referencing."""
+    raw = read_raw_fif(raw_fname)
+    events = find_events(raw)
+    pipe = raw.lazy().pick(["EEG 001", "EEG 003", "STI 014"])
+    pipe.set_eeg_reference()
+    pipe, pipe_events = pipe.resample(333.0, method="polyphase", events=events)
+    pipe.filter(None, 40.0)
+    raw.load_data().pick(["EEG 001", "EEG 003", "STI 014"])
+    raw.set_eeg_reference()
+    raw, raw_events = raw.resample(333.0, method="polyphase", events=events)
+    raw.filter(None, 40.0)
+    assert_array_equal(pipe_events, raw_events)
+    assert pipe.info["sfreq"] == raw.info["sfreq"] == 333.0
+    assert pipe.n_times == raw.n_times
+    assert pipe.first_samp == raw.first_samp
+    want = raw.get_data()
+    assert_allclose(pipe.get_data(), want, rtol=1e-7, atol=1e-18)
+    assert_allclose(_get_data_chunked(pipe, 100), want, rtol=1e-7, atol=1e-18)
+    epochs = Epochs(raw, raw_events, tmin=-0.1, tmax=0.2, baseline=None)
+    pipe_epochs = Epochs(pipe, pipe_events, tmin=-0.1, tmax=0.2, baseline=None)
+    assert_allclose(pipe_epochs.get_data(), epochs.get_data(), rtol=1e-7, atol=1e-18)
+    # save through the pipeline
+    fname = tmp_path / "test_pipe_raw.fif"
+    pipe.save(fname, fmt="double")
+    assert_allclose(read_raw_fif(fname).get_data(), want, rtol=1e-7, atol=1e-18)
+    # copies share the source
+    pipe_copy = pipe.copy()
+    assert pipe_copy._raw_extras[0]["source"] is pipe._raw_extras[0]["source"]
+    assert pipe_copy._raw_extras[0]["steps"] is not pipe._raw_extras[0]["steps"]
+
+
+def test_pipeline_preloaded_and_errors(raw_fname):
+    """Test pipelines of preloaded data and unsupported operations."""
+    raw = read_raw_fif(raw_fname, preload=True)
+    pipe = RawPipeline(raw)
+    assert np.shares_memory(pipe._raw_extras[0]["source"]._data, raw._data)
+    # modifying the preloaded instance does not change what is read
+    other = raw.copy()
+    data = other.get_data()
+    other_pipe = other.lazy()
+    other.filter(1.0, 10.0)
+    other[0] = 0.0
+    other.apply_function(np.negative)
+    assert_array_equal(other_pipe.get_data(), data)
+    with pytest.raises(NotImplementedError, match="method='fir'"):
+        pipe.filter(1.0, 40.0, method="iir")
+    with pytest.raises(NotImplementedError, match="method='fir'"):
+        pipe.notch_filter(None, method="spectrum_fit")
+    with pytest.raises(NotImplementedError, match="method='polyphase'"):
+        pipe.resample(500.0)
+    with pytest.raises(ValueError, match="Invalid value for the 'pad'"):
+        pipe.filter(1.0, 40.0, pad="mean")
+    pipe.filter(1.0, 40.0)
+    # once loaded, the usual (eager) methods are used
+    pipe.load_data().filter(1.0, 40.0, method="iir")
+    raw.filter(1.0, 40.0).filter(1.0, 40.0, method="iir")
+    assert_allclose(pipe.get_data(), raw.get_data(), rtol=1e-7, atol=1e-18)
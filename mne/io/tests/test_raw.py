@@ -1013,6 +1013,117 @@ def test_resamp_noop():
     assert_array_equal(data_before, data_after)
 
 
+def test_copy_view():
+    """Test copies sharing the data."""
+    rng = np.random.default_rng(0)
+    info = create_info(3, 1000.0, "eeg")
+    raw = RawArray(rng.standard_normal((3, 10000)), info)
+    data = raw.get_data()
+    crop = raw.copy(view=True).crop(2, 5, include_tmax=False)
+    assert crop.info is not raw.info
+    assert np.shares_memory(crop._data, raw._data)
+    assert not crop._data.flags.writeable
+    assert_array_equal(crop.get_data(), data[:, 2000:5000])
+    # a regular copy of a view does not share anything
+    crop_copy = crop.copy()
+    assert not np.shares_memory(crop_copy._data, raw._data)
+    # modifying the data or the channels copies them first
+    crop.filter(10.0, 40.0)
+    assert crop.info["highpass"] == 10.0
+    assert raw.info["highpass"] == 0.0
+    assert not np.shares_memory(crop._data, raw._data)
+    view = raw.copy(view=True)
+    view[0, :10] = 1.0
+    assert_array_equal(raw.get_data(), data)
+    view = raw.copy(view=True).pick([0, 1])
+    assert view.info["nchan"] == 2
+    assert raw.info["nchan"] == 3
+    assert_array_equal(view.get_data(), data[:2])
+    view.apply_function(np.negative)
+    assert_array_equal(raw.get_data(), data)
+    # changing the info of a view leaves the original untouched
+    view = raw.copy(view=True)
+    view.resample(500.0)
+    assert view.info["sfreq"] == 500.0
+    assert raw.info["sfreq"] == 1000.0
+    view = raw.copy(view=True)
+    view.rename_channels({"0": "foo"})
+    view.info["bads"] = ["1"]
+    with pytest.warns(RuntimeWarning, match="unit for channel"):
+        view.set_channel_types({"2": "misc"})
+    assert view.ch_names[0] == "foo"
+    assert raw.ch_names == ["0", "1", "2"]
+    assert raw.info["bads"] == []
+    assert raw.get_channel_types() == ["eeg"] * 3
+    assert np.shares_memory(view._data, raw._data)
+    # all in-place modifications copy the data first, on either side
+    info = create_info(["0", "1", "STI"], 1000.0, ["eeg", "eeg", "stim"])
+    raw = RawArray(np.concatenate([data[:2], np.zeros((1, 10000))]), info)
+    data = raw.get_data()
+    events = np.array([[1000, 0, 1]])
+    view = raw.copy(view=True)
+    view.add_events(events, stim_channel="STI")
+    assert view.get_data("STI")[0, 1000] == 1.0
+    view = raw.copy(view=True)
+    mne.preprocessing.fix_stim_artifact(view, events, tmin=0.0, tmax=0.01)
+    assert not np.allclose(view.get_data([0, 1], 1000, 1010), data[:2, 1000:1010])
+    assert_array_equal(raw.get_data(), data)
+    view = raw.copy(view=True)
+    raw.add_events(events, stim_channel="STI")
+    raw.filter(10.0, 40.0)
+    raw[0] = 0.0
+    assert_array_equal(view.get_data(), data)
+    assert not np.shares_memory(view._data, raw._data)
+    # nothing is shared when the data are not loaded
+    raw = RawArray(data, info).lazy()
+    view = raw.copy(view=True)
+    assert not view._shared
+
+
+def test_concatenate_raws_virtual():
+    """Test concatenating preloaded raws without copying their data."""
+    rng = np.random.default_rng(0)
+    info = create_info(3, 100.0, "eeg")
+    raws = list()
+    for ri in range(4):
+        raw = RawArray(rng.standard_normal((3, 300 + ri)), info, first_samp=10 * ri)
+        raw.set_annotations(Annotations([0.5], [0.1], [f"run{ri}"]))
+        raws.append(raw)
+    # a concatenated instance is also virtually concatenated as a single file
+    want = concatenate_raws([raw.copy() for raw in raws])
+    raw = concatenate_raws([raws[0].copy(), raws[1]], preload=False)
+    raw.append([concatenate_raws([raws[2].copy(), raws[3]]), raws[2]], preload=False)
+    want.append(raws[2].copy())
+    assert not raw.preload
+    assert len(raw._raw_extras) == 4
+    assert np.shares_memory(raw._raw_extras[1]["source"]._data, raws[1]._data)
+    assert_array_equal(raw.get_data(), want.get_data())
+    assert_array_equal(raw.get_data(start=250, stop=950), want[:, 250:950][0])
+    assert_array_equal(raw.annotations.onset, want.annotations.onset)
+    assert_array_equal(raw.annotations.description, want.annotations.description)
+    # one pair of boundary annotations per boundary
+    onsets = raw.annotations.onset[raw.annotations.description == "BAD boundary"]
+    starts = np.cumsum([300, 301, 302, 303, 302])[:-1] / 100.0
+    assert_allclose(onsets, starts)
+    # the appended instances can still be modified, which does not change the
+    # concatenated data
+    assert raws[1]._data.flags.writeable
+    raws[1].filter(5.0, None)
+    raws[2][:] = 0.0
+    raws[2].crop(1, 2)
+    raws[3].add_events([[130, 0, 1]], stim_channel="0")
+    mne.preprocessing.fix_stim_artifact(raws[0], np.array([[100, 0, 1]]), tmax=0.05)
+    assert_array_equal(raw.get_data(), want.get_data())
+    # copies share the data read, projectors and picks are applied on read
+    assert raw.copy()._raw_extras[1]["source"] is raw._raw_extras[1]["source"]
+    raw.set_eeg_reference(projection=True)
+    raw.pick([2, 0]).apply_proj()
+    want.set_eeg_reference(projection=True).pick([2, 0]).apply_proj()
+    assert_allclose(raw.get_data(), want.get_data(), atol=1e-12)
+    raw.load_data()
+    assert_allclose(raw.get_data(), want.get_data(), atol=1e-12)
+
+
 def test_concatenate_raw_dev_head_t():
     """Test concatenating raws with dev-head-t including nans."""
     data = np.random.randn(3, 10)
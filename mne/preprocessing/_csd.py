@@ -263,7 +263,7 @@ def compute_bridged_electrodes(
     ----------
     .. footbibliography::
     """
-    _check_preload(inst, "Computing bridged electrodes")
+    _check_preload(inst, "Computing bridged electrodes", write=False)
     inst = inst.copy()  # don't modify original
     picks = pick_types(inst.info, eeg=True)
     if len(picks) == 0:
@@ -182,7 +182,7 @@ class EOGRegression:
 
         # Calculate regression coefficients. Add a row of ones to also fit the
         # intercept.
-        _check_preload(inst, "artifact regression")
+        _check_preload(inst, "artifact regression", write=False)
         artifact_data = inst._data[..., picks_artifact, :]
         ref_data = artifact_data - np.mean(artifact_data, axis=-1, keepdims=True)
         if ref_data.ndim == 3:
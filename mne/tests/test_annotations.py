@@ -334,6 +334,44 @@ def test_chunk_duration(first_samp):
     assert_array_equal(events, expected_events)
 
 
+@pytest.mark.parametrize("chunk_duration", (0.1, 0.3, 1.0))
+def test_chunk_duration_many(chunk_duration):
+    """Test chunk_duration with many annotations against per-annotation chunks."""
+    rng = np.random.default_rng(0)
+    sfreq = 256.0
+    raw = RawArray(np.zeros((1, 100000)), create_info(1, sfreq), first_samp=100)
+    onset = np.sort(rng.uniform(0, 380, 1000)).round(3)
+    duration = rng.uniform(0, 2, 1000).round(2) * (rng.random(1000) > 0.1)
+    description = rng.choice(["b", "a", "c", "bad"], 1000)
+    raw.set_annotations(Annotations(onset, duration, description))
+    events, event_id = events_from_annotations(raw, chunk_duration=chunk_duration)
+    assert event_id == dict(a=1, b=2, c=3)
+    want = list()
+    for annot in raw.annotations:
+        if annot["description"] == "bad":
+            continue
+        offset = annot["onset"] + annot["duration"]
+        onsets = np.arange(annot["onset"], offset, chunk_duration)
+        onsets = onsets[offset - onsets >= chunk_duration]
+        for this_onset in onsets:
+            want.append(
+                [
+                    raw.time_as_index(this_onset, use_rounding=True)[0] + 100,
+                    0,
+                    event_id[annot["description"]],
+                ]
+            )
+    assert len(want) > 200
+    assert_array_equal(events, want)
+    # and back, which sorts the overlapping chunks
+    annot = annotations_from_events(
+        events, sfreq, {v: k for k, v in event_id.items()}, first_samp=100
+    )
+    events = events[np.argsort(events[:, 0], kind="stable")]
+    assert_allclose(annot.onset, (events[:, 0] - 100) / sfreq)
+    assert_array_equal(annot.description, np.array(["a", "b", "c"])[events[:, 2] - 1])
+
+
 def test_events_from_annotation_orig_time_none():
     """Tests events_from_annotation with orig_time None and first_sampe > 0."""
     # Create fake data
@@ -1288,6 +1326,46 @@ def test_crop_wo_orig_time(windows_like_datetime):
     assert len(annot) == 3
 
 
+@first_samps
+def test_annotations_interval_index(first_samp):
+    """Test the interval index used for rejection and overlap queries."""
+    rng = np.random.default_rng(0)
+    n_annot = 500
+    onset = np.sort(rng.uniform(0, 95, n_annot).round(2))
+    duration = rng.uniform(0, 2, n_annot).round(2) * (rng.random(n_annot) > 0.1)
+    duration[::50] = np.nan
+    description = rng.choice(["BAD_seg", "bad", "edge", "stage"], n_annot)
+    raw = RawArray(np.zeros((1, 10000)), create_info(1, 100.0), first_samp=first_samp)
+    raw.set_annotations(Annotations(onset, duration, description))
+    annot = raw.annotations
+    onset = _sync_onset(raw, annot.onset)
+    ends = onset + annot.duration
+    is_bad = np.char.startswith(np.char.lower(annot.description), "bad")
+    tmins = rng.uniform(0, 100, 200).round(2)
+    for tmin, tmax in zip(tmins, tmins + rng.uniform(0, 1, 200).round(2)):
+        # same as a linear scan for the first overlapping bad annotation
+        want = np.flatnonzero(is_bad & (onset < tmax) & (ends > tmin))
+        (got,) = raw._bad_segment_descriptions([round(tmin * 100)], [round(tmax * 100)])
+        assert got == (annot.description[want[0]] if len(want) else None)
+        index = annot._get_index()
+        _, idx = index.overlapping(tmin, tmax)
+        want = (annot.onset <= tmax) & (annot.onset + annot.duration >= tmin)
+        assert_array_equal(idx, np.flatnonzero(want))
+    # the cached indices are kept when the arrays are only read
+    index = annot._get_index()
+    assert len(annot.onset) == len(annot.duration) == len(annot.description)
+    assert annot._get_index() is index
+    # and invalidated when the arrays are set
+    index = annot._get_index(raw._first_time, ("bad",))
+    annot.description = np.where(
+        annot.description == "edge", "bad_edge", annot.description
+    )
+    assert annot._get_index(raw._first_time, ("bad",)) is not index
+    annot.onset += 1000
+    _, idx = annot._get_index().overlapping(0, 100)
+    assert len(idx) == 0
+
+
 def test_allow_nan_durations():
     """Deal with "n/a" strings in BIDS events with nan durations."""
     raw = RawArray(
@@ -762,6 +762,100 @@ def test_reject_by_annotations_reject_tmin_reject_tmax():
     assert len(epochs) == 1
 
 
+def test_epochs_from_raw_batched(tmp_path, monkeypatch):
+    """Test that overlapping epochs are read from disk in batches."""
+    rng = np.random.default_rng(0)
+    info = mne.create_info(["a", "b", "c"], 1000.0, ["eeg", "eeg", "eog"])
+    with info._unlock():
+        info["lowpass"] = 100.0
+    raw = RawArray(rng.standard_normal((3, 20000)), info, first_samp=100)
+    raw.set_annotations(
+        mne.Annotations([2.0, 7.1, 12.0], [0.5, 0.0, 1.0], ["bad", "BAD_b", "good"])
+    )
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    samps = np.arange(50, 20050, 37) + raw.first_samp
+    events = np.c_[samps, np.zeros_like(samps), np.ones_like(samps)]
+    kwargs = dict(tmin=-0.2, tmax=0.3, reject_tmin=-0.1, decim=2)
+    want = Epochs(read_raw_fif(fname, preload=True), events, preload=True, **kwargs)
+    raw = read_raw_fif(fname)
+    n_reads = [0]
+    getitem = raw._getitem
+
+    def _getitem(*args, **kwargs):
+        n_reads[0] += 1
+        return getitem(*args, **kwargs)
+
+    monkeypatch.setattr(raw, "_getitem", _getitem)
+    epochs = Epochs(raw, events, preload=True, **kwargs)
+    assert n_reads[0] == 1
+    assert epochs.drop_log == want.drop_log
+    assert ("bad",) in epochs.drop_log and ("BAD_b",) in epochs.drop_log
+    assert ("TOO_SHORT",) in epochs.drop_log and ("NO_DATA",) in epochs.drop_log
+    # overlapping epochs are baseline-corrected independently
+    assert_array_equal(epochs.get_data(), want.get_data())
+    with pytest.warns(RuntimeWarning, match="chronologically"):
+        epochs = Epochs(raw, events[::-1], **kwargs)
+    assert_array_equal(epochs.get_data(), want.get_data()[::-1])
+    assert_array_equal(np.array(list(epochs)), want.get_data()[::-1])
+
+
+def test_epochs_iter_lazy_annotations(monkeypatch):
+    """Test that iterating over lazy epochs does not rebuild annotation indices."""
+    rng = np.random.default_rng(0)
+    raw = RawArray(rng.standard_normal((2, 100000)), mne.create_info(2, 1000.0))
+    onset = np.sort(rng.uniform(0, 100, 10000))
+    raw.set_annotations(mne.Annotations(onset, 0.001, rng.choice(["bad", "x"], 10000)))
+    samps = np.arange(100, 99000, 250)
+    events = np.c_[samps, np.zeros_like(samps), np.ones_like(samps)]
+    epochs = Epochs(raw, events, tmin=0, tmax=0.1, baseline=None)
+    want = Epochs(raw, events, tmin=0, tmax=0.1, baseline=None, preload=True)
+    n_index = [0]
+    init = mne.annotations._IntervalIndex.__init__
+
+    def _init(*args, **kwargs):
+        n_index[0] += 1
+        init(*args, **kwargs)
+
+    monkeypatch.setattr(mne.annotations._IntervalIndex, "__init__", _init)
+    raw.annotations._index.clear()
+    got = np.array([epoch for epoch in epochs])
+    assert n_index[0] == 1
+    assert len(got) == len(want) < len(events)
+    assert_array_equal(got, want.get_data())
+
+
+@pytest.mark.parametrize("preload", (True, False))
+def test_drop_bad_thresholds(preload):
+    """Test rejection of many epochs by peak-to-peak thresholds."""
+    rng = np.random.default_rng(0)
+    info = mne.create_info(["a", "b", "c", "d", "e"], 100.0, ["eeg"] * 3 + ["eog"] * 2)
+    info["bads"] = ["c"]
+    data = rng.uniform(-1e-6, 1e-6, (200, 5, 50))
+    data[[3, 10, 150], 0, 10] = 1e-4  # "a"
+    data[[10, 60], 3, 0] = 1e-3  # "d"
+    data[[60, 199], 1] = 0  # "b" is flat
+    data[[7, 8], 2, 10] = 1e-4  # "c" is bad and ignored
+    data[100, 4, 40] = 1e-4  # "e" but outside of reject_tmax
+    events = np.c_[np.arange(200) * 50, np.zeros(200, int), np.ones(200, int)]
+    kwargs = dict(reject=dict(eeg=5e-5, eog=5e-5), flat=dict(eeg=1e-7), reject_tmax=0.2)
+    if preload:
+        epochs = mne.EpochsArray(data.copy(), info, events, **kwargs)
+    else:
+        raw = RawArray(data.transpose(1, 0, 2).reshape(5, -1), info)
+        epochs = Epochs(raw, events, tmin=0, tmax=0.49, baseline=None, **kwargs)
+        epochs.drop_bad()
+    drop_log = [()] * 200
+    drop_log[3] = drop_log[150] = ("a",)
+    drop_log[10] = ("a", "d")
+    drop_log[60] = ("d", "b")
+    drop_log[199] = ("b",)
+    assert epochs.drop_log == tuple(drop_log)
+    good = np.setdiff1d(np.arange(200), [3, 10, 60, 150, 199])
+    assert_array_equal(epochs.selection, good)
+    assert_array_equal(epochs.get_data(), data[good])
+
+
 def test_own_data():
     """Test for epochs data ownership (gh-5346)."""
     raw, events = _get_data()[:2]
@@ -1613,6 +1707,29 @@ def test_split_saving_and_loading_back(tmp_path, epochs_to_split, preload):
     assert_array_equal(epochs.events, epochs2.events)
 
 
+def test_lazy_random_access(tmp_path):
+    """Test random access of epochs read with preload=False."""
+    raw, events, picks = _get_data()
+    epochs = Epochs(raw, events[:14], picks=picks[::8], preload=True, proj=False)
+    epochs = concatenate_epochs([epochs] * 4)
+    fname = tmp_path / "test-epo.fif"
+    epochs.save(fname, split_size="1.5MB", overwrite=True)
+    epochs_lazy = read_epochs(fname, preload=False, proj=False)
+    assert len(epochs_lazy._raw) > 1
+    data = epochs.get_data()
+    rng = np.random.default_rng(0)
+    # random, unsorted, repeated, and contiguous (coalesced) selections
+    for idx in (
+        rng.permutation(len(epochs))[:20],
+        [3, 3, 0, len(epochs) - 1],
+        np.arange(5, 40),
+    ):
+        assert_allclose(epochs_lazy.get_data(item=idx), data[idx], rtol=1e-6)
+        assert_allclose(epochs_lazy[idx].get_data(), data[idx], rtol=1e-6)
+    for ii, epoch in enumerate(epochs_lazy):
+        assert_allclose(epoch, data[ii], rtol=1e-6)
+
+
 @pytest.mark.parametrize(
     "split_naming, dst_fname, split_fname_fn",
     [
@@ -15,6 +15,7 @@ from numpy.testing import (
     assert_equal,
 )
 
+import mne
 from mne import (
     Annotations,
     Epochs,
@@ -413,6 +414,40 @@ def test_find_events():
         find_events(raw)
 
 
+def test_find_events_chunked(tmp_path, monkeypatch):
+    """Test finding events of non-preloaded data read in chunks."""
+    rng = np.random.default_rng(0)
+    info = create_info(["EEG 001", "STI 014", "STI 015"], 1000.0, "stim")
+    data = np.zeros((3, 10000))
+    for ch in (1, 2):
+        for onset in rng.choice(np.arange(5 * ch, 9990, 10), 200, replace=False):
+            data[ch, onset : onset + rng.integers(1, 10)] = rng.integers(1, 20)
+    data[1, :3] = 7
+    data[1, 4] = -2
+    raw = RawArray(data, info, first_samp=12)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname, buffer_size_sec=0.1)
+    kwargs = [
+        dict(),
+        dict(stim_channel=["STI 014", "STI 015"], consecutive=True),
+        dict(output="step", consecutive=False, initial_event=True),
+        dict(output="offset", min_duration=0.002, mask=3),
+    ]
+    with pytest.warns(RuntimeWarning, match="negative values"):
+        want = [find_events(raw, shortest_event=1, **kw) for kw in kwargs]
+        want_steps = find_stim_steps(raw, pad_start=0, merge=-1)
+    assert len(want[1]) > 200
+    # read a few FIF buffers at a time, so that steps cross chunk boundaries
+    monkeypatch.setattr(mne.event, "_STIM_CHUNK_SAMPLES", 250)
+    raw = read_raw_fif(fname)
+    with pytest.warns(RuntimeWarning, match="negative values"):
+        for kw, this_want in zip(kwargs, want):
+            assert_array_equal(find_events(raw, shortest_event=1, **kw), this_want)
+        steps = find_stim_steps(raw, pad_start=0, merge=-1)
+    assert_array_equal(steps, want_steps)
+    assert not raw.preload
+
+
 def test_pick_events():
     """Test pick events in a events ndarray."""
     events = np.array([[1, 0, 1], [2, 1, 0], [3, 0, 4], [4, 4, 2], [5, 2, 0]])
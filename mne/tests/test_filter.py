@@ -1,5 +1,7 @@
 # License: BSD-3-Clause
 # Copyright the MNE-Python contributors.
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 from numpy.fft import fft, fftfreq
@@ -10,26 +12,42 @@ from numpy.testing import (
     assert_array_equal,
     assert_array_less,
 )
-from scipy.signal import butter, freqz, sosfreqz
+from scipy.signal import (
+    butter,
+    filtfilt,
+    freqz,
+    lfilter,
+    sosfilt,
+    sosfiltfilt,
+    sosfreqz,
+)
 from scipy.signal import resample as sp_resample
 
-from mne import Epochs, create_info
+from mne import Annotations, Epochs, create_info, set_fft_backend, use_fft_backend
 from mne._fiff.pick import _DATA_CH_TYPES_SPLIT
+from mne.cuda import _fft_backend
 from mne.filter import (
+    _1d_iir_filter,
     _length_factors,
     _overlap_add_filter,
+    _prep_polyphase,
+    _resample_polyphase_blocks,
     _resample_stim_channels,
     _smart_pad,
+    clear_filter_cache,
     construct_iir_filter,
     create_filter,
     design_mne_c_filter,
     detrend,
     estimate_ringing_samples,
+    filter_bank,
+    filter_cache_info,
     filter_data,
     notch_filter,
     resample,
 )
 from mne.io import RawArray, read_raw_fif
+from mne.time_frequency import tfr_array_morlet
 from mne.utils import catch_logging, requires_mne, run_subprocess, sum_squared
 
 resample_method_parametrize = pytest.mark.parametrize("method", ("fft", "polyphase"))
@@ -374,6 +392,35 @@ def test_notch_filters(method, filter_length, line_freq, tol):
     assert_almost_equal(new_power, orig_power, tol)
 
 
+@pytest.mark.parametrize("line_freqs", (None, [50.0, 60.0]))
+def test_notch_spectrum_fit_blocks(tmp_path, monkeypatch, line_freqs):
+    """Test spectrum_fit on all channels at once, in parallel and in blocks."""
+    rng = np.random.RandomState(0)
+    sfreq = 250.0
+    t = np.arange(int(35 * sfreq)) / sfreq
+    x = rng.randn(5, len(t))
+    x += 2 * np.sin(2 * np.pi * 50 * t) + np.arange(5)[:, np.newaxis] * np.sin(
+        2 * np.pi * 60 * t + 1
+    )
+    kwargs = dict(method="spectrum_fit", filter_length="5s")
+    want = np.array(
+        [notch_filter(x_, sfreq, line_freqs, **kwargs, verbose=False) for x_ in x]
+    )
+    assert_allclose(notch_filter(x, sfreq, line_freqs, **kwargs), want, atol=1e-10)
+    assert_allclose(
+        notch_filter(x, sfreq, line_freqs, **kwargs, n_jobs=2), want, atol=1e-10
+    )
+    # data read in blocks and filtered in place in a memmap
+    monkeypatch.setattr("mne.filter._MT_BLOCK", 1000)
+    x_mmap = np.memmap(tmp_path / "x.dat", np.float64, "w+", shape=x.shape)
+    x_mmap[:] = x
+    picks = [0, 2, 3]
+    out = notch_filter(x_mmap, sfreq, line_freqs, **kwargs, picks=picks, copy=False)
+    assert out is x_mmap
+    assert_allclose(x_mmap[picks], want[picks], atol=1e-10)
+    assert_array_equal(x_mmap[[1, 4]], x[[1, 4]])
+
+
 @resample_method_parametrize
 def test_resample(method):
     """Test resampling."""
@@ -401,6 +448,40 @@ def test_resample(method):
     assert_array_equal(resample([0.0, 0.0], 2, 1), [0.0, 0.0, 0.0, 0.0])
 
 
+@pytest.mark.parametrize("pad", ("reflect", "edge", "constant"))
+@pytest.mark.parametrize(
+    "n, up, down", [(1000, 1, 20), (1001, 3, 7), (500, 2, 1), (50, 1, 2)]
+)
+def test_resample_polyphase_blocks(n, up, down, pad):
+    """Test that resampling in blocks matches resampling all data at once."""
+    rng = np.random.RandomState(0)
+    x = rng.randn(3, n)
+    x[2] = 0
+    x[2, ::37] = np.arange(len(x[2, ::37])) % 5 + 1
+    y = resample(x, up, down, method="polyphase", pad=pad)
+    stim = _resample_stim_channels(x[2], y.shape[-1], n)
+    up, down, window = _prep_polyphase(up / down, n, y.shape[-1], "auto")
+    for block in (1, 7, 64, 2**16):
+        out = np.zeros_like(y)
+        _resample_polyphase_blocks(
+            lambda start, stop: x[:, start:stop],
+            n,
+            out,
+            up=up,
+            down=down,
+            pad=pad,
+            window=window,
+            stim_picks=[2],
+            block=block,
+        )
+        assert_array_equal(out[:2], y[:2])
+        assert_array_equal(out[2:], stim)
+    with pytest.raises(ValueError, match="Invalid value for the 'pad'"):
+        _resample_polyphase_blocks(
+            None, n, out, up=up, down=down, pad="mean", window=window
+        )
+
+
 def test_resample_scipy():
     """Test resampling against SciPy."""
     n_jobs_test = (1, "cuda")
@@ -778,7 +859,7 @@ def test_filter_auto():
     pytest.raises(ValueError, filter_data, x, -sfreq, 1, 10)
     pytest.raises(ValueError, filter_data, x, sfreq, 1, sfreq * 0.75)
     with pytest.raises(ValueError, match="Data to be filtered must be real"):
-        filter_data(x.astype(np.float32), sfreq, None, 10)
+        filter_data(x.astype(np.float16), sfreq, None, 10)
     with pytest.raises(ValueError, match="Data to be filtered must be real"):
         filter_data([1j], 1000.0, None, 40.0)
     with pytest.raises(TypeError, match="instance of ndarray"):
@@ -1054,3 +1135,204 @@ def test_filter_picks():
                 raw.filter(picks=picks, **kwargs)
                 want = want[1:]
                 assert_allclose(raw.get_data(), want)
+
+
+@pytest.mark.parametrize("output", ("sos", "ba"))
+def test_iir_blocks(output):
+    """Test that blockwise IIR filtering matches SciPy."""
+    x = np.random.RandomState(0).randn(1001)
+    iir_params = construct_iir_filter(
+        dict(order=4, ftype="butter", output=output), 40.0, None, 1000.0, "lowpass"
+    )
+    if output == "sos":
+        want_zero = sosfiltfilt(iir_params["sos"], x, padlen=iir_params["padlen"])
+        want_forward = sosfilt(iir_params["sos"], x)
+    else:
+        kwargs = dict(b=iir_params["b"], a=iir_params["a"])
+        want_zero = filtfilt(x=x, padlen=iir_params["padlen"], **kwargs)
+        want_forward = lfilter(x=x, **kwargs)
+    for block in (7, 100, 5000):
+        got = _1d_iir_filter(x, iir_params, iir_params["padlen"], block=block)
+        assert_allclose(got, want_zero, rtol=1e-10, atol=1e-12)
+        got = _1d_iir_filter(x, iir_params, None, block=block)
+        assert_allclose(got, want_forward, rtol=1e-10, atol=1e-12)
+    # in place
+    y = x.copy()
+    assert _1d_iir_filter(y, iir_params, 0, out=y, block=100) is y
+    assert not np.array_equal(y, x)
+
+
+@pytest.mark.parametrize("output", ("sos", "ba"))
+def test_iir_threads_float32(output):
+    """Test threaded in-place IIR filtering and float32 data."""
+    x = np.random.RandomState(0).randn(2, 5, 1000)
+    kwargs = dict(
+        sfreq=1000.0,
+        l_freq=None,
+        h_freq=40.0,
+        method="iir",
+        iir_params=dict(order=4, ftype="butter", output=output),
+    )
+    want = filter_data(x, **kwargs)
+    y = x.copy()
+    got = filter_data(y, **kwargs, picks=[0, 2, 3], n_jobs=2, copy=False)
+    assert got is y
+    assert_array_equal(got[:, [0, 2, 3]], want[:, [0, 2, 3]])
+    assert_array_equal(got[:, [1, 4]], x[:, [1, 4]])
+    # single precision
+    x_32 = x.astype(np.float32)
+    got = filter_data(x_32, **kwargs, n_jobs=2)
+    assert got.dtype == np.float32
+    assert_allclose(got, want, atol=1e-3)
+    got = notch_filter(x_32, 1000.0, 50.0, method="iir")
+    assert got.dtype == np.float32
+    with pytest.raises(ValueError, match="must be real floating"):
+        resample(x_32, 1, 2)
+    with pytest.raises(ValueError, match="must be real floating"):
+        filter_data(x.astype(np.float16), **kwargs)
+
+
+@pytest.mark.parametrize("method", ("fir", "iir"))
+def test_filter_memmap(tmp_path, method):
+    """Test filtering memory-mapped raw data in place."""
+    rng = np.random.RandomState(0)
+    info = create_info(3, 1000.0, "eeg")
+    raw = RawArray(rng.randn(3, 20000) * 1e-5, info)
+    fname = tmp_path / "test_raw.fif"
+    raw.save(fname)
+    raw_mmap = read_raw_fif(fname, preload=tmp_path / "data.dat")
+    assert isinstance(raw_mmap._data, np.memmap)
+    raw = read_raw_fif(fname, preload=True)
+    kwargs = dict(l_freq=1.0, h_freq=40.0, method=method)
+    raw.filter(**kwargs)
+    raw_mmap.filter(**kwargs)
+    assert isinstance(raw_mmap._data, np.memmap)
+    assert_array_equal(raw_mmap.get_data(), raw.get_data())
+    raw.notch_filter(50.0, method=method)
+    raw_mmap.notch_filter(50.0, method=method)
+    assert_array_equal(raw_mmap.get_data(), raw.get_data())
+
+
+@pytest.mark.parametrize("phase", ("zero", "zero-double", "minimum"))
+def test_filter_bank(phase):
+    """Test filtering into several bands at once."""
+    rng = np.random.RandomState(0)
+    info = create_info(["a", "b", "c", "s"], 500.0, ["eeg"] * 3 + ["stim"])
+    raw = RawArray(rng.randn(4, 5000), info)
+    raw.set_annotations(Annotations([3.0], [1.0], ["bad_acq_skip"]))
+    bands = [(1.0, 4.0), (8.0, 13.0), (None, 40.0)]
+    kwargs = dict(phase=phase, verbose="error")
+    data = filter_bank(raw, bands, **kwargs)
+    assert data.shape == (3, 3, 5000)
+    raws = filter_bank(raw, bands, picks=["a", "b", "c"], output="instance", **kwargs)
+    assert len(raws) == 3
+    for band, band_data, band_raw in zip(bands, data, raws):
+        want = raw.copy().filter(*band, **kwargs)
+        assert_allclose(band_data, want.get_data("eeg"), atol=1e-14)
+        assert_allclose(band_raw.get_data(), want.get_data(), atol=1e-14)
+        assert band_raw.info["highpass"] == want.info["highpass"]
+        assert band_raw.info["lowpass"] == want.info["lowpass"]
+    # epochs
+    epochs = Epochs(raw, np.array([[500, 0, 1], [2500, 0, 1]]), tmax=1.0, preload=True)
+    data = filter_bank(epochs, bands[:2], picks="b", **kwargs)
+    assert data.shape == (2, 2, 1, len(epochs.times))
+    want = epochs.copy().filter(*bands[1], **kwargs).get_data("b")
+    assert_allclose(data[1], want, atol=1e-14)
+    with pytest.raises(ValueError, match="non-empty list"):
+        filter_bank(raw, [])
+    with pytest.raises(ValueError, match="Invalid value for the 'output'"):
+        filter_bank(raw, bands, output="foo")
+
+
+@pytest.mark.parametrize("backend", ("scipy", "numpy", "pyfftw"))
+def test_fft_backend(backend):
+    """Test using different FFT backends."""
+    if backend == "pyfftw":
+        pytest.importorskip("pyfftw")
+    x = np.random.RandomState(0).randn(2, 10000)
+    want_filt = filter_data(x, 1000.0, 1.0, 40.0)
+    want_res = resample(x, 2, 3)
+    want_tfr = tfr_array_morlet(x[np.newaxis], 1000.0, [10.0, 20.0])
+    for workers in (None, 2) if backend == "numpy" else (None, 2, "n_jobs"):
+        # with workers="n_jobs", n_jobs=2 means two FFT threads (no joblib)
+        n_jobs = 2 if workers == "n_jobs" else None
+        with use_fft_backend(backend, workers=workers):
+            assert _fft_backend["backend"] == backend
+            got = filter_data(x, 1000.0, 1.0, 40.0, n_jobs=n_jobs)
+            assert_allclose(got, want_filt, atol=1e-12)
+            assert_allclose(resample(x, 2, 3, n_jobs=n_jobs), want_res, atol=1e-12)
+            got = tfr_array_morlet(x[np.newaxis], 1000.0, [10.0, 20.0])
+            assert_allclose(got, want_tfr, atol=1e-12)
+        assert _fft_backend == dict(backend="scipy", workers=None)
+    # the functions of the backend are passed to parallel jobs
+    with use_fft_backend(backend):
+        got = tfr_array_morlet(x[np.newaxis], 1000.0, [10.0, 20.0], n_jobs=2)
+    assert_allclose(got, want_tfr, atol=1e-12)
+    with pytest.raises(ValueError, match="Invalid value for the 'backend'"):
+        set_fft_backend("foo")
+    with pytest.raises(ValueError, match="Invalid value for the 'workers'"):
+        set_fft_backend("scipy", workers="foo")
+    with pytest.raises(ValueError, match='not supported by the "numpy"'):
+        set_fft_backend("numpy", workers="n_jobs")
+    assert _fft_backend == dict(backend="scipy", workers=None)
+
+
+def test_filter_cache(tmp_path, monkeypatch):
+    """Test caching of filter designs."""
+    monkeypatch.delenv("MNE_FILTER_CACHE_DIR", raising=False)
+    clear_filter_cache()
+    kwargs = dict(data=None, sfreq=1000.0, l_freq=1.0, h_freq=40.0)
+    h = create_filter(**kwargs)
+    assert filter_cache_info()["misses"] == 1
+    h[:] = 0  # the cached filter must not be modified
+    h_2 = create_filter(**kwargs)
+    assert filter_cache_info()["hits"] == 1
+    assert_array_equal(h_2, create_filter(**kwargs, l_trans_bandwidth=1.0))
+    assert filter_cache_info()["misses"] == 1
+    assert np.abs(h_2).max() > 0
+    create_filter(**kwargs, fir_window="hann")
+    create_filter(**kwargs, phase="minimum")
+    assert filter_cache_info()["misses"] == 3
+    # low attenuation is still reported for cached filters
+    for _ in range(2):
+        with pytest.warns(RuntimeWarning, match="Attenuation"):
+            create_filter(
+                None, 1000.0, None, 40.0, filter_length=21, fir_design="firwin2"
+            )
+    # IIR coefficients and padlen
+    for output in ("sos", "ba"):
+        iir_params = dict(order=4, ftype="butter", output=output)
+        want = create_filter(**kwargs, method="iir", iir_params=iir_params)
+        misses = filter_cache_info()["misses"]
+        got = create_filter(**kwargs, method="iir", iir_params=iir_params)
+        assert filter_cache_info()["misses"] == misses
+        assert got["padlen"] == want["padlen"]
+        for key in ("sos",) if output == "sos" else ("b", "a"):
+            assert_array_equal(got[key], want[key])
+    info = filter_cache_info()
+    assert info["currsize"] == info["misses"]
+    assert info["disk_hits"] == 0
+    # on-disk store
+    monkeypatch.setenv("MNE_FILTER_CACHE_DIR", str(tmp_path))
+    clear_filter_cache()
+    create_filter(**kwargs)
+    assert len(list(tmp_path.glob("*-filter.npz"))) == 1
+    clear_filter_cache()
+    assert_array_equal(create_filter(**kwargs), h_2)
+    assert filter_cache_info() == dict(
+        hits=0, disk_hits=1, misses=0, currsize=1, maxsize=128
+    )
+    # concurrent lookups from several threads
+    monkeypatch.delenv("MNE_FILTER_CACHE_DIR")
+    clear_filter_cache()
+    with ThreadPoolExecutor(4) as pool:
+        hs = list(
+            pool.map(
+                lambda ii: create_filter(**dict(kwargs, h_freq=20.0 + ii % 4)),
+                range(40),
+            )
+        )
+    assert_array_equal(hs[-4], create_filter(**dict(kwargs, h_freq=20.0)))
+    info = filter_cache_info()
+    assert info["hits"] + info["misses"] == 41
+    assert info["currsize"] == 4
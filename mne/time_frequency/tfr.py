@@ -15,7 +15,6 @@ from copy import deepcopy
 from functools import partial
 
 import numpy as np
-from scipy.fft import fft, ifft
 from scipy.signal import argrelmax
 
 from .._fiff.meas_info import ContainsMixin, Info
@@ -27,6 +26,7 @@ from .._fiff.pick import (
 from ..baseline import _check_baseline, rescale
 from ..channels.channels import UpdateChannelsMixin
 from ..channels.layout import _find_topomap_coords, _merge_ch_data, _pair_grad_sensors
+from ..cuda import _get_fft
 from ..defaults import _BORDER_DEFAULT, _EXTRAPOLATE_DEFAULT, _INTERPOLATION_DEFAULT
 from ..filter import next_fast_len
 from ..parallel import parallel_func
@@ -330,7 +330,7 @@ def _get_nfft(wavelets, X, use_fft=True, check=True):
     return nfft
 
 
-def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
+def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True, ffts=None):
     """Compute cwt with fft based convolutions or temporal convolutions.
 
     Parameters
@@ -353,6 +353,9 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
 
     use_fft : bool, default True
         Use the FFT for convolutions or not.
+    ffts : tuple of callable | None
+        The FFT and inverse FFT functions. None (default) uses those of the
+        FFT backend of the current process.
 
     Returns
     -------
@@ -370,6 +373,7 @@ def _cwt_gen(X, Ws, *, fsize=0, mode="same", decim=1, use_fft=True):
 
     # precompute FFTs of Ws
     if use_fft:
+        fft, ifft = (_get_fft("fft"), _get_fft("ifft")) if ffts is None else ffts
         fft_Ws = np.empty((n_freqs, fsize), dtype=np.complex128)
         for i, W in enumerate(Ws):
             fft_Ws[i] = fft(W, fsize)
@@ -565,10 +569,12 @@ def _compute_tfr(
     all_Ws = sum([list(W) for W in Ws], list())
     _get_nfft(all_Ws, epoch_data, use_fft)
     parallel, my_cwt, n_jobs = parallel_func(_time_frequency_loop, n_jobs)
+    # the FFT backend is set per process, so pass its functions to the jobs
+    ffts = (_get_fft("fft"), _get_fft("ifft"))
 
     # Parallelization is applied across channels.
     tfrs = parallel(
-        my_cwt(channel, Ws, output, use_fft, "same", decim, method)
+        my_cwt(channel, Ws, output, use_fft, "same", decim, method, ffts)
         for channel in epoch_data.transpose(1, 0, 2)
     )
 
@@ -661,7 +667,7 @@ def _check_tfr_param(
     return freqs, sfreq, zero_mean, n_cycles, time_bandwidth, decim
 
 
-def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, method=None):
+def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, method=None, ffts=None):
     """Aux. function to _compute_tfr.
 
     Loops time-frequency transform across wavelets and epochs.
@@ -691,6 +697,8 @@ def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, method=None):
     method : str | None
         Used only for multitapering to create tapers dimension in the output
         if ``output in ['complex', 'phase']``.
+    ffts : tuple of callable | None
+        The FFT and inverse FFT functions, see :func:`_cwt_gen`.
     """
     # Set output type
     dtype = np.float64
@@ -713,7 +721,9 @@ def _time_frequency_loop(X, Ws, output, use_fft, mode, decim, method=None):
     for taper_idx, W in enumerate(Ws):
         # No need to check here, it's done earlier (outside parallel part)
         nfft = _get_nfft(W, X, use_fft, check=False)
-        coefs = _cwt_gen(X, W, fsize=nfft, mode=mode, decim=decim, use_fft=use_fft)
+        coefs = _cwt_gen(
+            X, W, fsize=nfft, mode=mode, decim=decim, use_fft=use_fft, ffts=ffts
+        )
 
         # Inter-trial phase locking is apparently computed per taper...
         if "itc" in output:
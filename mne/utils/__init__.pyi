@@ -74,6 +74,7 @@ __all__ = [
     "_gen_events",
     "_get_argvalues",
     "_get_blas_funcs",
+    "_get_cache_fname",
     "_get_call_line",
     "_get_extra_data_path",
     "_get_inst_data",
@@ -119,6 +120,7 @@ __all__ = [
     "_url_to_local_path",
     "_validate_type",
     "_verbose_safe_false",
+    "_write_cache_file",
     "array_split_idx",
     "assert_and_remove_boundary_annot",
     "assert_dig_allclose",
@@ -277,10 +279,12 @@ from .check import (
     path_like,
 )
 from .config import (
+    _get_cache_fname,
     _get_extra_data_path,
     _get_numpy_libs,
     _get_root_dir,
     _get_stim_channel,
+    _write_cache_file,
     get_config,
     get_config_path,
     get_subjects_dir,
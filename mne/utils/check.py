@@ -290,10 +290,15 @@ def _check_subject(
     return None
 
 
-def _check_preload(inst, msg):
-    """Ensure data are preloaded."""
+def _check_preload(inst, msg, *, write=True):
+    """Ensure data are preloaded.
+
+    Unless ``write`` is False, Raw data shared with another instance (see
+    ``Raw.copy(view=True)``) are also copied so they can be modified in place.
+    """
     from ..epochs import BaseEpochs
     from ..evoked import Evoked
+    from ..io import BaseRaw
     from ..time_frequency import _BaseTFR
     from ..time_frequency.spectrum import BaseSpectrum
 
@@ -310,6 +315,8 @@ def _check_preload(inst, msg):
             )
         if name == "epochs":
             inst._handle_empty("raise", msg)
+        elif write and isinstance(inst, BaseRaw):
+            inst._unshare()
 
 
 def _check_compensation_grade(info1, info2, name1, name2="data", ch_names=None):
@@ -5,6 +5,7 @@
 # Copyright the MNE-Python contributors.
 
 import atexit
+import hashlib
 import json
 import multiprocessing
 import os
@@ -20,6 +21,7 @@ from pathlib import Path
 from urllib.error import URLError
 from urllib.request import urlopen
 
+import numpy as np
 from packaging.version import parse
 
 from ._logging import logger, warn
@@ -170,6 +172,14 @@ _known_config_types = {
     "MNE_DATASETS_REFMEG_NOISE_PATH": "str, path for refmeg_noise data",
     "MNE_DATASETS_SSVEP_PATH": "str, path for ssvep data",
     "MNE_DATASETS_ERP_CORE_PATH": "str, path for erp_core data",
+    "MNE_FIFF_INDEX_CACHE_DIR": (
+        "str, path to a directory used to cache the tag directory of FIF files "
+        "for faster re-opening (disabled if not set, read once per session)"
+    ),
+    "MNE_FILTER_CACHE_DIR": (
+        "str, path to a directory used to store designed filters for reuse "
+        "across sessions (disabled if not set)"
+    ),
     "MNE_FORCE_SERIAL": "bool, force serial rather than parallel execution",
     "MNE_LOGGING_LEVEL": (
         "str or int, controls the level of verbosity of any function "
@@ -215,6 +225,24 @@ _known_config_wildcards = (
 )
 
 
+def _get_cache_fname(cache_dir, key, kind):
+    """Get the name of the cache file of a (string) key in a cache directory."""
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return op.join(op.expanduser(cache_dir), f"{digest}-{kind}.npz")
+
+
+def _write_cache_file(fname, data, what):
+    """Write arrays to a cache file atomically, warning if this fails."""
+    try:
+        os.makedirs(op.dirname(fname), exist_ok=True)
+        tmp_fname = f"{fname}.{os.getpid()}.tmp"
+        with open(tmp_fname, "wb") as fid:
+            np.savez(fid, **data)
+        os.replace(tmp_fname, fname)
+    except Exception as exp:
+        warn(f"Could not write {what} {fname}: {exp}")
+
+
 def _load_config(config_path, raise_error=False):
     """Safely load a config file."""
     with open(config_path) as fid:
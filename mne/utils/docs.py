@@ -2353,7 +2353,8 @@ n_jobs : int | str
 docdict["n_jobs_fir"] = """
 n_jobs : int | str
     Number of jobs to run in parallel. Can be ``'cuda'`` if ``cupy``
-    is installed properly and ``method='fir'``.
+    is installed properly and ``method='fir'``. With ``method='iir'``,
+    this is the number of threads used to filter the channels in place.
 """
 
 docdict["n_pca_components_apply"] = """
@@ -2784,6 +2785,8 @@ physical_range : str | tuple
     taking the minimum and maximum values per channel type.
     If it is a 2-tuple of minimum and maximum limit, then those
     physical ranges will be used. Only used for exporting EDF files.
+    With 'auto', the data are read twice (once to find the ranges), which
+    can be avoided for data that are not preloaded by passing a tuple.
 """
 
 _pick_ori_novec = """
@@ -3062,9 +3065,30 @@ preload : bool, str, or None (default None)
     file name of a memory-mapped file which is used to store the data
     on the hard drive (slower, requires less memory). If preload is
     None, preload=True or False is inferred using the preload status
-    of the instances passed in.
+    of the instances passed in. If False, the data of preloaded instances
+    are not copied but read from them when needed, so concatenating many
+    instances is fast and uses little additional memory.
+
+    .. versionchanged:: 1.7
+       Preloaded instances can be concatenated with ``preload=False``.
 """
 
+docdict["preload_fif"] = """
+preload : bool or str (default False)
+    Preload data into memory for data manipulation and faster indexing.
+    If True, the data will be preloaded into memory (fast, requires
+    large amount of memory). If preload is a string, preload is the
+    file name of a memory-mapped file which is used to store the data
+    on the hard drive (slower, requires less memory). If ``"mmap"``, the
+    data are not preloaded, but each (split) file is memory-mapped once
+    and the requested samples are read directly from the mapped data
+    buffers, which makes repeated access to small windows of long
+    recordings much faster. Not available for compressed (``.gz``) files
+    or file-like objects.
+
+    .. versionchanged:: 1.7
+       Support for ``preload="mmap"``."""
+
 docdict["proj_epochs"] = """
 proj : bool | 'delayed'
     Apply SSP projection vectors. If proj is 'delayed' and reject is not
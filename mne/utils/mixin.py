@@ -66,7 +66,7 @@ class SizeMixin:
         if isinstance(self, Evoked):
             return object_hash(dict(info=self.info, data=self.data))
         elif isinstance(self, (BaseEpochs, BaseRaw)):
-            _check_preload(self, "Hashing ")
+            _check_preload(self, "Hashing ", write=False)
             return object_hash(dict(info=self.info, data=self._data))
         else:
             raise RuntimeError("Hashing unknown object type: %s" % type(self))
@@ -727,7 +727,7 @@ class ExtendedTimeMixin(TimeMixin):
         data sample by an arbitrary amount. It does *not* resample the signal
         or change the *data* values in any way.
         """
-        _check_preload(self, "shift_time")
+        _check_preload(self, "shift_time", write=False)
         start = tshift + (self.times[0] if relative else 0.0)
         new_times = start + np.arange(len(self.times)) / self.info["sfreq"]
         self._set_times(new_times)